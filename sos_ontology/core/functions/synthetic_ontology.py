@@ -0,0 +1,489 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+from itertools import accumulate
+from os import makedirs
+from os.path import dirname, join
+
+from rdflib.namespace import OWL, Namespace
+
+import sos_ontology
+from sos_ontology.core.sos_entities.code_repository import CodeRepository
+from sos_ontology.core.sos_entities.parameter import Parameter
+from sos_ontology.core.sos_entities.parameter_usage import ParameterUsage
+from sos_ontology.core.sos_entities.sos_coupling import SoSCoupling
+from sos_ontology.core.sos_entities.sos_discipline import SoSDiscipline
+from sos_ontology.core.sos_entities.sos_entity import SoSEntityDict
+from sos_ontology.core.sos_entities.sos_process import SoSProcess
+from sos_ontology.core.sos_entities.sos_process_repository import SoSProcessRepository
+from sos_ontology.core.sos_entities.sos_usecase import SoSUsecase
+from sos_ontology.core.sos_ontology import SoSOntology
+
+'''
+Generator of synthetic SoSTrades ontologies used for scale testing.
+The entities are built with the same SoSEntityDict structures than SoSCodeDataExtractor
+and turned into an ABox with SoSOntology.createDecentralizedSoSOntologyABox, so the generated
+owl file can be loaded by the API by setting ONTOLOGY_FOLDER to the output folder.
+'''
+
+DATA_FOLDER = join(dirname(sos_ontology.__file__), 'data')
+TBOX_PATH = join(DATA_FOLDER, 'sos_ontology', 'SoSTrades_Ontology_TBox.owl')
+ABOX_FILE_NAME = 'SoSTrades_Ontology_ABox_Decentralized.owl'
+NTRIPLES_FILE_NAME = 'SoSTrades_Ontology_ABox_Decentralized.nt'
+TERMINOLOGY_PATH = join(DATA_FOLDER, 'terminology', 'SoS_Trades_Terminology_ABox.xlsx')
+LOGS_PATH = join(DATA_FOLDER, 'logs', 'ontologyCreationLogs.json')
+
+# default number of entities, roughly the size of the current SoSTrades platform
+DEFAULT_SIZES = {
+    'code_repositories': 3,
+    'process_repositories_per_code_repository': 2,
+    'processes': 20,
+    'disciplines': 50,
+    'parameters': 400,
+    'usages_per_discipline': 20,
+    'disciplines_per_process': 8,
+    'usecases_per_process': 2,
+    'couplings_per_usecase': 5,
+    'documentation_words': 300,
+}
+
+# sizes that are not multiplied when the generator is scaled
+FAN_OUT_SIZES = (
+    'process_repositories_per_code_repository',
+    'usages_per_discipline',
+    'disciplines_per_process',
+    'usecases_per_process',
+    'couplings_per_usecase',
+    'documentation_words',
+)
+
+DATATYPES = ['float', 'int', 'string', 'dataframe', 'dict', 'list', 'array', 'bool']
+UNITS = ['', '-', '%', 'kg', 'km', 'h', 'M$', 'GW', 'TWh', 'Gt', 'year']
+VISIBILITIES = ['Local', 'Shared', 'Internal']
+DISCIPLINE_TYPES = ['Research', 'Industrial', 'Other']
+WORDS = [
+    'model', 'energy', 'climate', 'economics', 'production', 'demand', 'capital', 'cost',
+    'emissions', 'carbon', 'technology', 'scenario', 'optimization', 'constraint', 'population',
+    'resource', 'investment', 'price', 'temperature', 'damage', 'welfare', 'utility', 'consumption',
+    'efficiency', 'stream', 'mix', 'biomass',
+]
+
+
+class SyntheticOntologyGenerator:
+    """Generate a synthetic SoSTrades ontology of configurable size with a realistic fan-out"""
+
+    def __init__(self, seed: int = 0, **sizes) -> None:
+        unknown_sizes = set(sizes) - set(DEFAULT_SIZES)
+        if len(unknown_sizes) > 0:
+            raise ValueError(f'Unknown synthetic ontology sizes {sorted(unknown_sizes)}')
+        self.sizes = {**DEFAULT_SIZES, **sizes}
+        self.random = random.Random(seed)
+
+        self.code_repositories = SoSEntityDict()
+        self.sos_process_repositories = SoSEntityDict()
+        self.sos_processes = SoSEntityDict()
+        self.sos_disciplines = SoSEntityDict()
+        self.parameters = SoSEntityDict()
+        self.parameters_usages = SoSEntityDict()
+        self.usecases = SoSEntityDict()
+        self.couplings = SoSEntityDict()
+        self.generated = False
+        # parameters and cumulated weights drawn from by _pick_parameters, set once the parameters are generated
+        self.parameters_list = []
+        self.parameters_cum_weights = []
+
+    @classmethod
+    def scaled(cls, scale: float, seed: int = 0) -> SyntheticOntologyGenerator:
+        """Generator with the entity counts of DEFAULT_SIZES multiplied by scale, fan-out is kept"""
+        sizes = {
+            key: value if key in FAN_OUT_SIZES else max(1, round(value * scale))
+            for key, value in DEFAULT_SIZES.items()
+        }
+        return cls(seed=seed, **sizes)
+
+    def _text(self, words_count: int) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(words_count)).capitalize()
+
+    def _documentation(self, title: str) -> str:
+        words_count = max(0, int(self.random.gauss(self.sizes['documentation_words'], self.sizes['documentation_words'] / 3)))
+        paragraphs = [self._text(min(words_count - start, 80)) for start in range(0, words_count, 80)]
+        return '\n\n'.join([f'# {title}', *paragraphs])
+
+    def generate(self) -> SyntheticOntologyGenerator:
+        """Create all the entities, can only be called once per generator"""
+        if not self.generated:
+            self._generate_repositories()
+            self._generate_parameters()
+            self._generate_disciplines()
+            self._generate_processes_and_usecases()
+            self.generated = True
+        return self
+
+    def _generate_repositories(self):
+        for repo_index in range(self.sizes['code_repositories']):
+            repo_name = f'synthetic_repo_{repo_index}'
+            code_repo = CodeRepository(repo_name, repo_name)
+            code_repo.update_info({
+                'url': f'https://example.org/synthetic/{repo_name}.git',
+                'branch': 'develop',
+                'commit': f'{self.random.getrandbits(160):040x}',
+                'committed_date': '2026-01-01 00:00:00+00:00',
+            })
+            self.code_repositories.add(code_repo)
+            for process_repo_index in range(self.sizes['process_repositories_per_code_repository']):
+                process_repo_id = f'{repo_name}.sos_processes.group_{process_repo_index}'
+                process_repo = SoSProcessRepository(
+                    id=process_repo_id,
+                    label=f'Synthetic processes {repo_index}.{process_repo_index}',
+                    description=self._text(20),
+                    code_repository=code_repo,
+                )
+                self.sos_process_repositories.add(process_repo)
+                code_repo.add_process_repository(process_repo)
+
+    def _generate_parameters(self):
+        code_repositories = list(self.code_repositories.sos_entity_dict.values())
+        for parameter_index in range(self.sizes['parameters']):
+            parameter_id = f'{self.random.choice(WORDS)}_{self.random.choice(WORDS)}_{parameter_index}'
+            parameter = Parameter(
+                id=parameter_id,
+                label=parameter_id.replace('_', ' ').capitalize(),
+                attributesDict={
+                    'unit': self.random.choice(UNITS),
+                    'definition': self._text(self.random.randint(5, 40)),
+                    'definitionSource': 'synthetic',
+                    'type': self.random.choice(DATATYPES),
+                    'ACLTag': None,
+                },
+            )
+            # parameters documented in a glossary are attached to a code repository
+            if self.random.random() < 0.5:
+                parameter.add_code_repository(self.random.choice(code_repositories))
+            self.parameters.add(parameter)
+        # a few parameters (year, dataframes of the study...) are used by most disciplines,
+        # most parameters are used by one or two disciplines
+        self.parameters_list = list(self.parameters.sos_entity_dict.values())
+        self.parameters_cum_weights = list(accumulate(1 / (index + 1) for index in range(len(self.parameters_list))))
+
+    def _pick_parameters(self, count: int) -> list[Parameter]:
+        # cumulated weights are computed once, each draw is a bisection instead of a pass over all the weights
+        picked = {}
+        while len(picked) < min(count, len(self.parameters_list)):
+            parameter = self.random.choices(self.parameters_list, cum_weights=self.parameters_cum_weights)[0]
+            picked[parameter.id] = parameter
+        return list(picked.values())
+
+    def _add_usage(self, discipline: SoSDiscipline, parameter: Parameter, io: str) -> ParameterUsage:
+        usage_id = f'{discipline.id}_{io}_{parameter.id}'
+        usage = self.parameters_usages.get(usage_id)
+        if usage is None:
+            datatype = parameter.datatype
+            usage = ParameterUsage(
+                id=usage_id,
+                label=usage_id,
+                attributesDict={
+                    'visibility': self.random.choice(VISIBILITIES),
+                    'default': None,
+                    'user_level': self.random.randint(1, 3),
+                    'range': [0, self.random.randint(1, 1000)] if datatype in ('float', 'int') else None,
+                    'dataframe_descriptor': (
+                        {f'column_{i}': ('float', None, True) for i in range(self.random.randint(2, 6))}
+                        if datatype == 'dataframe' else None
+                    ),
+                    'structuring': self.random.random() < 0.1,
+                    'optional': self.random.random() < 0.1,
+                    'namespace': f'ns_{self.random.choice(WORDS)}',
+                    'numerical': self.random.random() < 0.05,
+                    'coupling': io == 'output',
+                    'editable': io == 'input',
+                    'io_type': 'in' if io == 'input' else 'out',
+                    'type': datatype,
+                    'unit': parameter.unit,
+                },
+                parameter=parameter,
+                sos_discipline=discipline,
+            )
+            self.parameters_usages.add(usage)
+            parameter.add_unit(usage)
+            parameter.add_datatype(usage)
+        if io == 'input':
+            discipline.add_input_parameter_usage(usage)
+        else:
+            discipline.add_output_parameter_usage(usage)
+        return usage
+
+    def _generate_disciplines(self):
+        code_repositories = list(self.code_repositories.sos_entity_dict.values())
+        for discipline_index in range(self.sizes['disciplines']):
+            code_repo = code_repositories[discipline_index % len(code_repositories)]
+            module_name = f'{self.random.choice(WORDS)}_{discipline_index}'
+            discipline_id = f'{code_repo.id}.sos_wrapping.{module_name}_disc'
+            class_name = f'{module_name.title().replace("_", "")}Discipline'
+            discipline = SoSDiscipline(
+                id=discipline_id,
+                label=f'{module_name.replace("_", " ").capitalize()} model',
+                repository=code_repo,
+                pythonModulePath=discipline_id.replace('.', '/') + '.py',
+                definition=self._text(self.random.randint(10, 60)),
+                validated=self.random.choice(['', 'True', 'False']),
+                type=self.random.choice(DISCIPLINE_TYPES),
+                icon='fa-solid fa-gears',
+                documentation=self._documentation(class_name),
+                last_modification_date='2026-01-01',
+                validated_by=self.random.choice(['', 'SoSTrades team']),
+                pythonClassInheritance=[class_name, 'SoSWrapp', 'object'],
+                pythonClass=class_name,
+                source='synthetic',
+                category=self.random.choice(WORDS),
+                version='1.0',
+            )
+            self.sos_disciplines.add(discipline)
+
+            usages_count = max(1, int(self.random.gauss(self.sizes['usages_per_discipline'], self.sizes['usages_per_discipline'] / 4)))
+            for parameter in self._pick_parameters(usages_count):
+                self._add_usage(discipline, parameter, 'output' if self.random.random() < 0.3 else 'input')
+
+    def _generate_processes_and_usecases(self):
+        process_repositories = list(self.sos_process_repositories.sos_entity_dict.values())
+        disciplines = list(self.sos_disciplines.sos_entity_dict.values())
+        for process_index in range(self.sizes['processes']):
+            process_repo = process_repositories[process_index % len(process_repositories)]
+            process_name = f'{self.random.choice(WORDS)}_process_{process_index}'
+            process = SoSProcess(
+                id=f'{process_repo.id}.{process_name}',
+                label=process_name.replace('_', ' ').capitalize(),
+                description=self._text(20),
+                repository=process_repo,
+                documentation=self._documentation(process_name),
+                process_module_path=f'{process_repo.id}.{process_name}.process',
+                category=self.random.choice(WORDS),
+                version='1.0',
+            )
+            self.sos_processes.add(process)
+            process_repo.add_process(process)
+
+            process_disciplines = self.random.sample(
+                disciplines, min(self.sizes['disciplines_per_process'], len(disciplines)),
+            )
+            for discipline in process_disciplines:
+                process.add_model(discipline)
+
+            for usecase_index in range(self.sizes['usecases_per_process']):
+                usecase = SoSUsecase(
+                    id=f'{process.process_module_path}.usecase_{usecase_index}',
+                    label=f'usecase_{usecase_index}',
+                    description=self._text(10),
+                    process=process,
+                    run_usecase=self.random.random() < 0.8,
+                )
+                for discipline in process_disciplines:
+                    usecase.add_disciplines(discipline.label, [discipline])
+                self.usecases.add(usecase)
+                process.add_usecase(usecase)
+                self._generate_couplings(usecase, process_disciplines)
+
+    def _generate_couplings(self, usecase: SoSUsecase, disciplines: list[SoSDiscipline]):
+        if len(disciplines) < 2:
+            return
+        for _ in range(self.sizes['couplings_per_usecase']):
+            disc_from, disc_to = self.random.sample(disciplines, 2)
+            if len(disc_from.outputParameterUsagesList) == 0:
+                continue
+            usage_out = self.random.choice(disc_from.outputParameterUsagesList)
+            parameter = usage_out.instanceOf
+            usage_in = self._add_usage(disc_to, parameter, 'input')
+            self.couplings.add(
+                SoSCoupling(
+                    id=f'from_{disc_from.id}_to_{disc_to.id}_param_{parameter.id}',
+                    label=f'{usecase.label}.{parameter.id}',
+                    disciplineFrom=disc_from,
+                    disciplineTo=disc_to,
+                    parameterUsageOut=usage_out,
+                    parameterUsageIn=usage_in,
+                    usecase=usecase,
+                ),
+            )
+
+    def entities_count(self) -> dict:
+        """Number of generated entities by type"""
+        return {
+            'code_repositories': self.code_repositories.len(),
+            'sos_process_repositories': self.sos_process_repositories.len(),
+            'sos_processes': self.sos_processes.len(),
+            'sos_disciplines': self.sos_disciplines.len(),
+            'parameters': self.parameters.len(),
+            'parameters_usages': self.parameters_usages.len(),
+            'usecases': self.usecases.len(),
+            'couplings': self.couplings.len(),
+        }
+
+    def get_abox_entities(self) -> dict:
+        """Generated entities, as given to SoSOntology.createDecentralizedSoSOntologyABox"""
+        self.generate()
+        return {
+            'parameters': self.parameters,
+            'parameters_usages': self.parameters_usages,
+            'sos_disciplines': self.sos_disciplines,
+            'sos_processes': self.sos_processes,
+            'code_repositories': self.code_repositories,
+            'sos_process_repositories': self.sos_process_repositories,
+            'usecases': self.usecases,
+            'couplings': self.couplings,
+        }
+
+    def create_ontology(self, tbox_path: str = TBOX_PATH) -> SoSOntology:
+        """Build the ABox of the generated entities on top of the SoSTrades TBox"""
+        ontology = SoSOntology(version=0, source='empty')
+        ontology.load(tbox_path, 'xml')
+        ontology.SOS = Namespace(SoSOntology.BASE_URI)
+        ontology.createDecentralizedSoSOntologyABox(**self.get_abox_entities())
+        # properties dicts are only initialised by SoSOntology when loaded from file, they are needed by the read methods
+        ontology.datapropertyDict = ontology.getOntologyPredicatesDict(OWL.DatatypeProperty)
+        ontology.objectpropertyDict = ontology.getOntologyPredicatesDict(OWL.ObjectProperty)
+        ontology.annotationPropertyDict = ontology.getOntologyPredicatesDict(OWL.AnnotationProperty)
+        return ontology
+
+    def export(self, output_folder: str, with_companion_files: bool = True) -> str:
+        """
+        Write the generated ABox in output_folder and return its path.
+        With companion files, the terminology and logs shipped with the package are copied too,
+        so that the folder can be used as ONTOLOGY_FOLDER by the API.
+        """
+        makedirs(output_folder, exist_ok=True)
+        abox_path = join(output_folder, ABOX_FILE_NAME)
+        self.create_ontology().exportOntology(aboxPath=abox_path)
+        if with_companion_files:
+            shutil.copyfile(TERMINOLOGY_PATH, join(output_folder, 'SoS_Trades_Terminology_ABox.xlsx'))
+            shutil.copyfile(LOGS_PATH, join(output_folder, 'ontologyCreationLogs.json'))
+        return abox_path
+
+    def export_ntriples(self, output_folder: str, tbox_path: str = TBOX_PATH) -> str:
+        """
+        Write the SoSTrades TBox and the generated ABox to an N-Triples file in output_folder and return its path,
+        the ABox triples are streamed to the file without building the graph
+        """
+        makedirs(output_folder, exist_ok=True)
+        ntriples_path = join(output_folder, NTRIPLES_FILE_NAME)
+        ontology = SoSOntology(version=0, source='empty')
+        ontology.load(tbox_path, 'xml')
+        ontology.SOS = Namespace(SoSOntology.BASE_URI)
+        ontology.exportDecentralizedSoSOntologyNTriples(ntriples_path, **self.get_abox_entities())
+        return ntriples_path
+
+    def build_treeview(self, process: SoSProcess, study_name: str = 'Study') -> dict:
+        """Treeview of a process as sent by the GUI to get its N2 matrix"""
+        self.generate()
+        coupled_inputs = {
+            coupling.parameterUsageIn.id
+            for coupling in self.couplings.sos_entity_dict.values()
+            if coupling.parameterUsageIn is not None
+        }
+        children = []
+        for discipline in process.models_list:
+            disc_data = {
+                f'{study_name}.{discipline.label}.{usage.instanceOf.id}': {
+                    'coupling': usage.coupling or usage.id in coupled_inputs,
+                }
+                for usage in discipline.inputParameterUsagesList + discipline.outputParameterUsagesList
+            }
+            children.append({
+                'name': discipline.label,
+                'node_type': 'SoSDiscipline',
+                'full_namespace': f'{study_name}.{discipline.label}',
+                'model_name_full_path': discipline.id,
+                'disc_data': disc_data,
+                'children': [],
+            })
+        return {
+            'name': study_name,
+            'node_type': 'SoSCoupling',
+            'full_namespace': study_name,
+            'model_name_full_path': 'sostrades_core.execution_engine.sos_coupling',
+            'disc_data': {},
+            'children': children,
+        }
+
+    def build_requests(self, disciplines_count: int = 10, parameters_count: int = 60) -> dict:
+        """Sample API requests on the generated entities, with the same structure than the tests/data json files"""
+        self.generate()
+        disciplines = self.random.sample(
+            list(self.sos_disciplines.sos_entity_dict), min(disciplines_count, self.sos_disciplines.len()),
+        )
+        parameters = self.random.sample(
+            list(self.parameters.sos_entity_dict), min(parameters_count, self.parameters.len()),
+        )
+        parameter_usages = [
+            usage_id
+            for discipline_id in disciplines
+            for usage_id in (
+                self.sos_disciplines.get(discipline_id).inputParameterUsagesIds
+                + self.sos_disciplines.get(discipline_id).outputParameterUsagesIds
+            )
+        ]
+        linked_process_dict = {}
+        for process in self.sos_processes.sos_entity_dict.values():
+            linked_process_dict.setdefault(process.repository.id, []).append(process.id.split('.')[-1])
+        first_process = next(iter(self.sos_processes.sos_entity_dict.values()))
+        return {
+            'data_request': {'disciplines': disciplines, 'parameters': parameters},
+            'parameter_usages': {'disciplines': disciplines, 'parameter_usages': parameter_usages},
+            'linked_process_dict': linked_process_dict,
+            'processes_name': list(self.sos_processes.sos_entity_dict),
+            'repositories_name': list(self.sos_process_repositories.sos_entity_dict),
+            'n2_treeview': self.build_treeview(first_process),
+        }
+
+
+def main(args=None):
+    """Command line entry point, run with python -m sos_ontology.core.functions.synthetic_ontology --help"""
+    parser = argparse.ArgumentParser(description='Generate a synthetic SoSTrades ontology for scale testing')
+    parser.add_argument('output_folder', help='folder where the ABox (and companion files) are written')
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplier of the default entity counts')
+    parser.add_argument('--seed', type=int, default=0)
+    for size_name in DEFAULT_SIZES:
+        parser.add_argument(f'--{size_name.replace("_", "-")}', type=int, dest=size_name, default=None)
+    parser.add_argument('--requests', action='store_true', help='also write sample API requests as json files')
+    parser.add_argument(
+        '--ntriples', action='store_true', help='stream the ontology to an N-Triples file instead of the OWL ABox',
+    )
+    parsed_args = parser.parse_args(args)
+
+    sizes = SyntheticOntologyGenerator.scaled(parsed_args.scale).sizes
+    sizes.update({
+        size_name: getattr(parsed_args, size_name)
+        for size_name in DEFAULT_SIZES
+        if getattr(parsed_args, size_name) is not None
+    })
+    generator = SyntheticOntologyGenerator(seed=parsed_args.seed, **sizes).generate()
+    print(f'Generated entities: {generator.entities_count()}')
+    if parsed_args.ntriples:
+        generator.export_ntriples(parsed_args.output_folder)
+    else:
+        generator.export(parsed_args.output_folder)
+
+    if parsed_args.requests:
+        for request_name, request_data in generator.build_requests().items():
+            with open(join(parsed_args.output_folder, f'{request_name}.json'), 'w') as request_file:
+                json.dump(request_data, request_file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
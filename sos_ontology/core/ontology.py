@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07-2024/07/11 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -19,13 +19,13 @@ limitations under the License.
 import logging
 from os.path import basename
 
-import numpy as np
-import pandas as pd
 from rdflib import Dataset, Literal, Namespace, URIRef
-from rdflib.namespace import OWL, RDF, RDFS, XSD, split_uri
+from rdflib.namespace import OWL, RDF, RDFS, split_uri
 from rdflib.term import bind
 
+from sos_ontology.core.sos_literal_factory import SoSLiteralFactory
 from sos_ontology.core.sos_toolbox import SoSToolbox
+from sos_ontology.core.sos_uri_registry import SoSURIRegistry
 
 
 class Ontology:
@@ -39,6 +39,10 @@ class Ontology:
         self.graph = Dataset()
         self.namespace_dict = {}
         self.countAddedTriples = dict({'individuals': 0, 'triples': 0})
+        # URIs used in each namespace, URIs issued by create_new_URI may not be in the graph yet
+        # when their triples are added by chunks
+        self.uri_registry = SoSURIRegistry(self.graph)
+        self.literal_factory = SoSLiteralFactory()
         self.namespace_dict = {}
         self.toolbox = SoSToolbox()
 
@@ -57,6 +61,7 @@ class Ontology:
     def load(self, path, onto_format):
         # Load ontology owl file
         self.graph.parse(path, format=onto_format)
+        self.uri_registry.reload_graph_subjects()
         self.logger.info(
             f'Ontology {basename(path)} loaded with {len(self.graph)} triples',
         )
@@ -181,7 +186,6 @@ class Ontology:
     def create_new_URI(self, namespace, URIstring):
         # Create new URI by replacing spaces and putting it in lower and if the URI
         # exists, add a number at the end to make sure it is a new URI
-        cpt = 0
         # first clean of the string
         URIstring = (
             URIstring.replace('-', ' ')
@@ -199,18 +203,8 @@ class Ontology:
         # we remove the spaces
         URIstring = URIstring.replace(' ', '')
 
-        URI = URIRef(namespace + URIstring)
-        if (URI, None, None) in self.graph:
-            cpt += 1
-            while (
-                URIRef(namespace + URIstring + '_' + str(cpt)),
-                None,
-                None,
-            ) in self.graph:
-                cpt += 1
-            return URIRef(namespace + URIstring + '_' + str(cpt))
-        else:
-            return URI
+        # the URI is new if it was not issued by create_new_URI and is not the subject of a triple of the graph
+        return self.uri_registry.allocate(namespace, URIstring)
 
     def copy_triples(self, s, p, o, graphToCopyFrom):
         # Copy triple from one external graph to the ontology graph
@@ -283,46 +277,7 @@ class Ontology:
         return classDict, attributesDict
 
     def getLiteral(self, parameterDict, key):
-        valueLiteral = parameterDict.get(key, None)
-        returnLiteral = ' '
-        if isinstance(valueLiteral, pd.DataFrame):
-            # convert dataframe to dict
-            valueLiteral = valueLiteral.to_dict(orient='list')
-        elif isinstance(valueLiteral, np.ndarray):
-            # convert np.ndarray to list
-            valueLiteral = valueLiteral.tolist()
-        if valueLiteral is not None:
-            if isinstance(valueLiteral, list):
-                for v in valueLiteral:
-                    if v is None or v == 'null':
-                        valueLiteral.remove(v)
-                if valueLiteral is not None and len(valueLiteral) > 0:
-                    returnLiteral = ',\n'.join([str(i) for i in valueLiteral])
-            elif (
-                isinstance(valueLiteral, int | float | dict | str)
-            ):
-                returnLiteral = str(valueLiteral)
-
-        return Literal(returnLiteral, datatype=XSD.string)
+        return self.toLiteral(parameterDict.get(key, None))
 
     def toLiteral(self, valueLiteral):
-        returnLiteral = ' '
-        if isinstance(valueLiteral, pd.DataFrame):
-            # convert dataframe to dict
-            valueLiteral = valueLiteral.to_dict(orient='list')
-        elif isinstance(valueLiteral, np.ndarray):
-            # convert np.ndarray to list
-            valueLiteral = valueLiteral.tolist()
-        if valueLiteral is not None:
-            if isinstance(valueLiteral, list):
-                for v in valueLiteral:
-                    if v is None or v == 'null':
-                        valueLiteral.remove(v)
-                if valueLiteral is not None and len(valueLiteral) > 0:
-                    returnLiteral = ',\n'.join([str(i) for i in valueLiteral])
-            elif (
-                isinstance(valueLiteral, int | float | dict | str)
-            ):
-                returnLiteral = str(valueLiteral)
-
-        return Literal(returnLiteral, datatype=XSD.string)
+        return self.literal_factory.to_literal(valueLiteral)
@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/02/08 Copyright 2024 Capgemini
+Modifications on 2024/02/08-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -18,13 +18,15 @@ limitations under the License.
 #!/usr/bin/python
 # -*- coding: UTF-8 -*-
 
+import argparse
 import cProfile
 import io
 import logging
 import pstats
+import shutil
 import sys
-from os import environ, pathsep
-from os.path import dirname, join
+from os import environ, makedirs, pathsep
+from os.path import abspath, dirname, isfile, join, normcase
 
 from rdflib.namespace import Namespace
 
@@ -33,24 +35,70 @@ from sos_ontology.core.functions.ontology_to_terminology import ontology_to_term
 from sos_ontology.core.functions.sendGChatNotifications import sendGChatNotification
 from sos_ontology.core.ontology import Ontology
 from sos_ontology.core.sos_decentralized_codedataextractor import SoSCodeDataExtractor
+from sos_ontology.core.sos_extraction_checkpoint import (
+    DIFFERENCE_PHASE,
+    DISCIPLINES_PHASE,
+    EXTRACTION_PHASES,
+    GLOSSARIES_PHASE,
+    LOGS_PHASE,
+    ONTOLOGY_PHASE,
+    PROCESSES_PHASE,
+    TERMINOLOGY_PHASE,
+    SoSExtractionCheckpoint,
+    get_phases_to_run,
+    get_previous_phase,
+)
 from sos_ontology.core.sos_ontology import SoSOntology
 from sos_ontology.core.sos_terminology import SoSTerminology
+from sos_ontology.core.sos_timings import PHASE_SPAN, timing_span
 from sos_ontology.core.sos_toolbox import SoSToolbox
 
+
+def is_same_path(path: str, other_path: str) -> bool:
+    """Return True if both paths point to the same file, even if it does not exist"""
+    return normcase(abspath(path)) == normcase(abspath(other_path))
+
+
 PROFILING = False
 if PROFILING:
     profiler = cProfile.Profile()
     profiler.enable()
 
-webhookURL = None
-platform = None
-if len(sys.argv) > 1:
-    webhookURL = str(sys.argv[1])
-if len(sys.argv) >= 2:
-    platform = str(sys.argv[2])
-
 BUILD_URL = None
 environ_dict = dict(environ)
+
+parser = argparse.ArgumentParser(description='Create the SoSTrades ontology from the code of the PYTHONPATH repositories')
+parser.add_argument('webhookURL', nargs='?', default=None, help='Google Chat webhook notified at the end of the run')
+parser.add_argument('platform', nargs='?', default=None, help='platform name displayed in the notification')
+parser.add_argument(
+    '--resume-from',
+    choices=EXTRACTION_PHASES,
+    default=None,
+    help='run the phases from this one, starting from the checkpoint of the previous phase',
+)
+parser.add_argument(
+    '--only',
+    choices=EXTRACTION_PHASES,
+    default=None,
+    help='run only this phase, starting from the checkpoint of the previous phase',
+)
+# state reached after each phase, an empty value disables the checkpoints
+parser.add_argument(
+    '--checkpoint-folder',
+    default=environ_dict.get('ONTOLOGY_CHECKPOINT_FOLDER', '.ontology_checkpoints'),
+    help='folder of the checkpoints stored after each phase, no checkpoint if empty',
+)
+args = parser.parse_args()
+if args.resume_from is not None and args.only is not None:
+    parser.error('--resume-from and --only can not be used together')
+webhookURL = args.webhookURL
+platform = args.platform
+
+phases_to_run = get_phases_to_run(resume_from=args.resume_from, only=args.only)
+first_phase = phases_to_run[0]
+checkpoint = SoSExtractionCheckpoint(args.checkpoint_folder) if args.checkpoint_folder else None
+if checkpoint is None and first_phase != DISCIPLINES_PHASE:
+    parser.error(f'phase {first_phase} starts from a checkpoint, --checkpoint-folder can not be empty')
 # prepare necessary paths
 dataPath = dirname(dirname(dirname(sos_ontology.__file__)))
 dataOntologyPath = join(dirname(sos_ontology.__file__), 'data')
@@ -111,81 +159,164 @@ if len(PYTHONPATH_list) > 0:
             'code_repositories_traceability', {},
         )
 
+    # state of the previous phase when the run does not start from the first one
+    checkpoint_state = None
+    if first_phase != DISCIPLINES_PHASE:
+        checkpoint_state = checkpoint.load(get_previous_phase(first_phase))
+        if checkpoint_state is None:
+            print(f'No checkpoint of phase {get_previous_phase(first_phase)} in {args.checkpoint_folder}. Stopping script')
+            sys.exit(1)
+
+    # number of processes used to scan code repositories, all CPUs by default
+    max_workers = environ_dict.get('ONTOLOGY_MAX_WORKERS')
+    # extraction artifacts of the code repositories, only repositories with a new commit are scanned
+    # an empty value disables the cache
+    cache_folder = environ_dict.get('ONTOLOGY_CACHE_FOLDER', '.ontology_cache')
+    # limits of the isolated processes configuring the processes and usecases, in seconds and MB
+    process_timeout = environ_dict.get('ONTOLOGY_PROCESS_TIMEOUT')
+    usecase_timeout = environ_dict.get('ONTOLOGY_USECASE_TIMEOUT')
+    usecase_memory_limit = environ_dict.get('ONTOLOGY_USECASE_MEMORY_LIMIT')
     codeData = SoSCodeDataExtractor(
         basepath=dirname(sos_ontology.__file__),
         logs_dict=logs_dict,
         previous_code_repositories_traceability=previous_code_repositories_traceability,
+        code_repositories_dict=checkpoint_state['code_repositories_dict'] if checkpoint_state is not None else None,
+        max_workers=int(max_workers) if max_workers else None,
+        cache_folder=cache_folder or None,
+        usecase_timeout=float(usecase_timeout) if usecase_timeout else None,
+        usecase_memory_limit=int(usecase_memory_limit) if usecase_memory_limit else None,
+        process_timeout=float(process_timeout) if process_timeout else None,
     )
+    if checkpoint_state is not None:
+        codeData.set_checkpoint_state(checkpoint_state)
+        logs_dict = codeData.logs_dict
+
+    def save_checkpoint(phase):
+        """Store the entities and logs reached after phase if the checkpoints are enabled"""
+        if checkpoint is not None:
+            print(f'Phase {phase} done, saving checkpoint')
+            checkpoint.save(phase, codeData.get_checkpoint_state())
+
+    # previous ontology, copied in the checkpoint folder before the export may overwrite it
+    previous_abox_path = pathsDict["SoSaBoxCurrent"]
+    if checkpoint is not None:
+        previous_abox_checkpoint_path = join(args.checkpoint_folder, 'previous_abox.owl')
+        if ONTOLOGY_PHASE in phases_to_run:
+            if isfile(previous_abox_path):
+                makedirs(args.checkpoint_folder, exist_ok=True)
+                shutil.copyfile(previous_abox_path, previous_abox_checkpoint_path)
+        elif isfile(previous_abox_checkpoint_path):
+            previous_abox_path = previous_abox_checkpoint_path
+        elif DIFFERENCE_PHASE in phases_to_run and is_same_path(previous_abox_path, pathsDict['SoSaBox']):
+            # the current ontology is the one exported by the ontology phase, it would be compared with itself
+            print(
+                f'No copy of the previous ontology previous_abox.owl in {args.checkpoint_folder}, '
+                f'the differences with {previous_abox_path} can not be calculated. Stopping script',
+            )
+            sys.exit(1)
 
     # retrieve code data on all repositories
-    logs_dict = codeData.generate_entities_from_code_repositories()
+    if DISCIPLINES_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, DISCIPLINES_PHASE):
+            codeData.generate_disciplines_from_code_repositories()
+        save_checkpoint(DISCIPLINES_PHASE)
 
-    print(
-        "#####################    CREATE ONTOLOGY ABOX FROM CODE  #########################",
-    )
+    if PROCESSES_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, PROCESSES_PHASE):
+            codeData.generate_processes_from_code_repositories()
+        save_checkpoint(PROCESSES_PHASE)
+
+    if GLOSSARIES_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, GLOSSARIES_PHASE):
+            logs_dict = codeData.generate_parameters_glossaries()
+        save_checkpoint(GLOSSARIES_PHASE)
 
     # Load SoS Tbox
     sosOnto = SoSOntology(version=0, source="empty")
-    sosOnto.load(pathsDict["SoStBox"], "xml")
-    sosOnto.SOS = Namespace(SoSOntology.BASE_URI)
-
-    # Create instances of updated ontology from extracted code data
-    sosOnto.createDecentralizedSoSOntologyABox(
-        parameters=codeData.parameters,
-        parameters_usages=codeData.parameters_usages,
-        sos_disciplines=codeData.sos_disciplines,
-        sos_processes=codeData.sos_processes,
-        code_repositories=codeData.code_repositories,
-        sos_process_repositories=codeData.sos_process_repositories,
-        usecases=codeData.usecases,
-        couplings=codeData.couplings,
-        logs_dict=logs_dict,
-    )
-
-    print(
-        "#####################    LOAD PREVIOUS ONTOLOGY    #########################",
-    )
-    oldOnto.load(pathsDict["SoSaBoxCurrent"], "xml")
-
-    print(
-        "#####################    EXPORT UPDATED ONTOLOGY TO OWL   #########################",
-    )
-    # save ontology to OWL
-    sosOnto.exportOntology(aboxPath=pathsDict["SoSaBox"])
-
-    print(
-        '#####################    EXPORT ONTOLOGY TO EXCEL TERMINOLOGY   #########################',
-    )
-    excelTerminology = SoSTerminology(pathsDict['excelTerminology'])
-    ontology_to_terminology(
-        loaded_ontology=sosOnto,
-        ontology_file_path=None,
-        loaded_terminology=excelTerminology,
-        terminology_file_path=None,
-    )
-
-    print(
-        "#####################    CALCULATE DIFFERENCES BETWEEN BEFORE AND AFTER UPDATE #########################",
-    )
-    toolbox.calculate_difference_before_after(
-        oldOntology=oldOnto,
-        newOntology=sosOnto,
-        ontologyNamespace=sosOnto.SOS,
-        logs_dict=logs_dict,
-    )
-
-    print("#####################    WRITE LOGS #########################")
-    toolbox.write_logs(
-        logs_dict=logs_dict,
-        log_file_name='output_log.txt',
-        short_log_file_name='short_log.txt',
-        full_log_json_path=pathsDict['ontologyCreationLogs'],
-    )
+    if ONTOLOGY_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, ONTOLOGY_PHASE):
+            print(
+                "#####################    CREATE ONTOLOGY ABOX FROM CODE  #########################",
+            )
+            sosOnto.load(pathsDict["SoStBox"], "xml")
+            sosOnto.SOS = Namespace(SoSOntology.BASE_URI)
+
+            # Create instances of updated ontology from extracted code data
+            sosOnto.createDecentralizedSoSOntologyABox(
+                parameters=codeData.parameters,
+                parameters_usages=codeData.parameters_usages,
+                sos_disciplines=codeData.sos_disciplines,
+                sos_processes=codeData.sos_processes,
+                code_repositories=codeData.code_repositories,
+                sos_process_repositories=codeData.sos_process_repositories,
+                usecases=codeData.usecases,
+                couplings=codeData.couplings,
+                logs_dict=logs_dict,
+            )
+
+            print(
+                "#####################    LOAD PREVIOUS ONTOLOGY    #########################",
+            )
+            oldOnto.load(previous_abox_path, "xml")
+
+            print(
+                "#####################    EXPORT UPDATED ONTOLOGY TO OWL   #########################",
+            )
+            # save ontology to OWL
+            sosOnto.exportOntology(aboxPath=pathsDict["SoSaBox"])
+        save_checkpoint(ONTOLOGY_PHASE)
+    elif any(phase in phases_to_run for phase in (TERMINOLOGY_PHASE, DIFFERENCE_PHASE)):
+        # the ontology exported by the ontology phase is loaded back
+        sosOnto.load(pathsDict["SoSaBox"], "xml")
+        sosOnto.SOS = Namespace(SoSOntology.BASE_URI)
+
+    if TERMINOLOGY_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, TERMINOLOGY_PHASE):
+            print(
+                '#####################    EXPORT ONTOLOGY TO EXCEL TERMINOLOGY   #########################',
+            )
+            excelTerminology = SoSTerminology(pathsDict['excelTerminology'])
+            ontology_to_terminology(
+                loaded_ontology=sosOnto,
+                ontology_file_path=None,
+                loaded_terminology=excelTerminology,
+                terminology_file_path=None,
+            )
+        save_checkpoint(TERMINOLOGY_PHASE)
+
+    if DIFFERENCE_PHASE in phases_to_run:
+        with timing_span(codeData.logs_dict, PHASE_SPAN, DIFFERENCE_PHASE):
+            if ONTOLOGY_PHASE not in phases_to_run:
+                print(
+                    "#####################    LOAD PREVIOUS ONTOLOGY    #########################",
+                )
+                oldOnto.load(previous_abox_path, "xml")
+
+            print(
+                "#####################    CALCULATE DIFFERENCES BETWEEN BEFORE AND AFTER UPDATE #########################",
+            )
+            toolbox.calculate_difference_before_after(
+                oldOntology=oldOnto,
+                newOntology=sosOnto,
+                ontologyNamespace=sosOnto.SOS,
+                logs_dict=logs_dict,
+            )
+        save_checkpoint(DIFFERENCE_PHASE)
+
+    # the logs phase is not timed, its span could not be written to the logs it writes
+    if LOGS_PHASE in phases_to_run:
+        print("#####################    WRITE LOGS #########################")
+        toolbox.write_logs(
+            logs_dict=logs_dict,
+            log_file_name='output_log.txt',
+            short_log_file_name='short_log.txt',
+            full_log_json_path=pathsDict['ontologyCreationLogs'],
+        )
 
-    # Display output_log.txt file
-    with open('output_log.txt') as file:
-        content = file.read()
-        print(content)
+        # Display output_log.txt file
+        with open('output_log.txt') as file:
+            content = file.read()
+            print(content)
 
     logging.disable(logging.INFO)
 
@@ -201,7 +332,7 @@ print(
 if 'BUILD_URL' in environ_dict:
     BUILD_URL = environ_dict['BUILD_URL']
 
-if webhookURL is not None and BUILD_URL is not None:
+if webhookURL is not None and BUILD_URL is not None and LOGS_PHASE in phases_to_run:
     with open('short_log.txt') as short_log_file:
         shortLog = short_log_file.read()
 
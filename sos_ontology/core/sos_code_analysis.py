@@ -0,0 +1,511 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import ast
+import builtins
+import sys
+from importlib.machinery import EXTENSION_SUFFIXES
+from importlib.util import find_spec
+from os.path import isdir, isfile, join
+
+'''
+Static analysis of the Python files scanned by the SoSCodeDataExtractor.
+Each file is read and parsed once, and classes, imports and discipline attributes (DESC_IN, DESC_OUT,
+_ontology_data, _maturity) are extracted in a single walk of its AST.
+The module level definitions of the files are used to resolve class hierarchies without importing the modules.
+'''
+
+# keys of the parsing errors, one per information extracted from the file
+CLASSES = 'classes'
+IMPORTS = 'imports'
+DISCIPLINE_ATTRIBUTES = 'discipline_attributes'
+
+# kinds of the module level definitions
+CLASS_DEFINITION = 'class'
+IMPORT_DEFINITION = 'import'
+MODULE_DEFINITION = 'module'
+ALIAS_DEFINITION = 'alias'
+NAMES_DEFINITION = 'names'
+# a name whose value can not be known without executing the module
+UNKNOWN_DEFINITION = 'unknown'
+
+
+def get_dotted_name(node) -> str | None:
+    """Return 'a.b.C' for a Name or an Attribute chain, None for any other expression"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = get_dotted_name(node.value)
+        return f'{value}.{node.attr}' if value is not None else None
+    return None
+
+
+def get_bound_names(statement) -> set[str]:
+    """Names bound in the module namespace by a statement, the bodies of functions and classes are not visited"""
+    names = set()
+    nodes = [statement]
+    while len(nodes) > 0:
+        node = nodes.pop()
+        if isinstance(node, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef):
+            names.add(node.name)
+            continue
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store | ast.Del):
+            names.add(node.id)
+        elif isinstance(node, ast.alias):
+            names.add(node.asname or node.name.split('.')[0])
+        nodes.extend(ast.iter_child_nodes(node))
+    return names
+
+
+def is_not_executed_on_import(node: ast.If) -> bool:
+    """Return True for the 'if __name__ == "__main__":' and 'if TYPE_CHECKING:' blocks"""
+    test = node.test
+    if get_dotted_name(test) in ('TYPE_CHECKING', 'typing.TYPE_CHECKING'):
+        return True
+    return (
+        isinstance(test, ast.Compare)
+        and get_dotted_name(test.left) == '__name__'
+        and len(test.comparators) == 1
+        and isinstance(test.comparators[0], ast.Constant)
+        and test.comparators[0].value == '__main__'
+    )
+
+
+class SoSFileAnalysis:
+    """
+    Classes, imports and discipline attributes of a Python file, extracted with a single parse.
+    Parsing errors are stored by extracted information as (log sub category, message, exception),
+    the message has to be completed with the file path by the caller.
+    """
+
+    def __init__(self, file) -> None:
+        self.classes = []
+        self.imports = {}
+        self.ontology_data = {}
+        self.maturity = ""
+        self.desc_in = {}
+        self.desc_out = {}
+        # module level names by name: (statement index, definition tuple whose first item is the definition kind)
+        self.definitions = {}
+        # module level 'from module import *' as (statement index, module, level)
+        self.star_imports = []
+        # False if the module can not be analysed, its definitions are then unknown
+        self.is_parsed = False
+        self.errors = {CLASSES: [], IMPORTS: [], DISCIPLINE_ATTRIBUTES: []}
+
+        try:
+            with open(file=file, encoding="utf-8", errors="ignore") as myfile:
+                tree = ast.parse(myfile.read())
+        except Exception as ex:
+            self.errors[CLASSES].append(('parsingClassList', 'Impossible to parse classes from', ex))
+            self.errors[IMPORTS].append(('parsingImportList', 'Impossible to parse import list from', ex))
+            self.errors[DISCIPLINE_ATTRIBUTES].append(('parsingDiscipline', 'Impossible to parse sos discipline', ex))
+            return
+
+        self._classes_parsed = True
+        self._discipline_attributes_parsed = True
+        # ast.walk order is kept so that the results are the same as separate walks for each information
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                self._add_class(node)
+                self._add_discipline_attributes(node)
+            elif isinstance(node, ast.Import | ast.ImportFrom):
+                self._add_imports(node)
+
+        if not self._classes_parsed:
+            self.classes = []
+
+        for index, statement in enumerate(tree.body):
+            self._add_module_definitions(index, statement)
+        self.is_parsed = True
+
+    def _add_class(self, node: ast.ClassDef) -> None:
+        if not self._classes_parsed:
+            return
+        try:
+            self.classes.append(
+                {
+                    "name": node.name,
+                    "type": [
+                        n.id if hasattr(n, "id") else n.attr
+                        for n in node.bases
+                    ],
+                },
+            )
+        except Exception as ex:
+            # a class with a base that is not a name (ex: Generic[T]) makes the whole class list unavailable
+            self._classes_parsed = False
+            self.errors[CLASSES].append(('parsingClassList', 'Impossible to parse classes from', ex))
+
+    def _add_imports(self, node: ast.Import | ast.ImportFrom) -> None:
+        module = node.module if isinstance(node, ast.ImportFrom) else None
+        for n in node.names:
+            if n.asname is not None:
+                self.imports[n.asname] = {"module": module, "name": n.name}
+            else:
+                self.imports[n.name] = {"module": module, "name": n.name}
+
+    def _add_module_definitions(self, index: int, statement) -> None:
+        if isinstance(statement, ast.ClassDef) and len(statement.decorator_list) > 0:
+            # a class decorator may return an other class
+            self.definitions[statement.name] = (index, (UNKNOWN_DEFINITION,))
+        elif isinstance(statement, ast.ClassDef):
+            self.definitions[statement.name] = (
+                index, (CLASS_DEFINITION, tuple(get_dotted_name(base) for base in statement.bases)),
+            )
+        elif isinstance(statement, ast.Import):
+            for n in statement.names:
+                if n.asname is not None:
+                    self.definitions[n.asname] = (index, (MODULE_DEFINITION, n.name))
+                else:
+                    # 'import a.b' binds the top level package a
+                    top_level_name = n.name.split('.')[0]
+                    self.definitions[top_level_name] = (index, (MODULE_DEFINITION, top_level_name))
+        elif isinstance(statement, ast.ImportFrom):
+            for n in statement.names:
+                if n.name == '*':
+                    self.star_imports.append((index, statement.module, statement.level))
+                else:
+                    self.definitions[n.asname or n.name] = (
+                        index, (IMPORT_DEFINITION, statement.module, statement.level, n.name),
+                    )
+        elif isinstance(statement, ast.Assign) and all(isinstance(target, ast.Name) for target in statement.targets):
+            for target in statement.targets:
+                self.definitions[target.id] = (index, self._get_assigned_definition(target.id, statement.value))
+        elif isinstance(statement, ast.If) and is_not_executed_on_import(statement):
+            return
+        else:
+            # names bound by functions, conditional blocks... are unknown until the module is executed,
+            # a '*' name means that any name may be defined by a conditional star import
+            for name in get_bound_names(statement):
+                self.definitions[name] = (index, (UNKNOWN_DEFINITION,))
+
+    def _get_assigned_definition(self, name: str, value) -> tuple:
+        dotted_name = get_dotted_name(value)
+        if dotted_name is not None:
+            return ALIAS_DEFINITION, dotted_name
+        if name == '__all__' and isinstance(value, ast.List | ast.Tuple):
+            try:
+                return NAMES_DEFINITION, tuple(ast.literal_eval(value))
+            except Exception:
+                return (UNKNOWN_DEFINITION,)
+        return (UNKNOWN_DEFINITION,)
+
+    def _literal_eval(self, value, attribute_name):
+        try:
+            return ast.literal_eval(value)
+        except Exception as ex:
+            self.errors[DISCIPLINE_ATTRIBUTES].append(
+                ('parsingDiscipline', f'Impossible to parse {attribute_name} from', ex),
+            )
+            return None
+
+    def _add_discipline_attributes(self, node: ast.ClassDef) -> None:
+        if not self._discipline_attributes_parsed:
+            return
+        for assign in node.body:
+            if isinstance(assign, ast.Assign) and isinstance(assign.targets[0], ast.Name):
+                target = assign.targets[0].id
+                if isinstance(assign.value, ast.Dict):
+                    if target == "_ontology_data":
+                        value = self._literal_eval(assign.value, '_ontology_data')
+                        if value is not None:
+                            self.ontology_data = value
+                    if target == "DESC_IN":
+                        # DESC_IN updated via a function can not be evaluated
+                        value = self._literal_eval(assign.value, 'DESC_IN')
+                        if value is not None:
+                            self.desc_in = value
+                    if target == "DESC_OUT":
+                        value = self._literal_eval(assign.value, 'DESC_OUT')
+                        if value is not None:
+                            self.desc_out = value
+                if target == "_maturity":
+                    try:
+                        self.maturity = ast.literal_eval(assign.value)
+                    except Exception as ex:
+                        # a non literal maturity stops the extraction of the discipline attributes
+                        self._discipline_attributes_parsed = False
+                        self.errors[DISCIPLINE_ATTRIBUTES].append(
+                            ('parsingDiscipline', 'Impossible to parse sos discipline', ex),
+                        )
+                        return
+
+    def get_discipline_attributes(self) -> tuple[dict, str, dict, dict]:
+        """Return _ontology_data, _maturity, DESC_IN and DESC_OUT parsed from the class bodies"""
+        return self.ontology_data, self.maturity, self.desc_in, self.desc_out
+
+
+# result of a name lookup when the name is certainly not defined in the module
+NOT_DEFINED = 'notDefined'
+# kinds of the resolved names
+RESOLVED_CLASS = 'class'
+RESOLVED_BUILTIN_CLASS = 'builtinClass'
+RESOLVED_MODULE = 'module'
+
+
+def c3_merge(sequences: list[list]) -> list | None:
+    """C3 linearization of the method resolution orders of the bases, None if it is not consistent"""
+    result = []
+    sequences = [sequence for sequence in sequences if len(sequence) > 0]
+    while len(sequences) > 0:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other_sequence[1:] for other_sequence in sequences):
+                break
+        else:
+            return None
+        result.append(head)
+        sequences = [
+            sequence[1:] if sequence[0] == head else sequence
+            for sequence in sequences
+            if len(sequence) > 1 or sequence[0] != head
+        ]
+    return result
+
+
+class SoSClassHierarchyResolver:
+    """
+    Resolve the method resolution order of classes from the module level definitions of the Python files,
+    without importing their modules. Imports, relative imports, aliases, star imports and re-exports in packages
+    __init__ are followed. A class whose hierarchy depends on code executed at import (conditional definitions,
+    dynamic bases, compiled modules...) is not resolved, the caller has to import it.
+    """
+
+    def __init__(self, get_file_analysis=SoSFileAnalysis) -> None:
+        """
+        Constructor
+        :param get_file_analysis: function returning the SoSFileAnalysis of a Python file path
+        :type get_file_analysis: callable
+        """
+        self.get_file_analysis = get_file_analysis
+        # (file, is package, submodule search paths) by module name, None if the module can not be analysed
+        self.module_locations = {}
+        self.resolved_names = {}
+        self.mros = {}
+        # names and classes being resolved, to stop on circular definitions
+        self.resolving = set()
+
+    def get_inheritance_tree(self, module_name: str | None, class_name: str) -> list[str] | None:
+        """
+        Return the names of the classes in the method resolution order of class_name imported from module_name,
+        like type.mro, None if it can not be resolved statically
+        """
+        if not module_name:
+            return None
+        resolved = self.resolve_attribute(module_name, class_name)
+        if resolved is None or resolved[0] not in (RESOLVED_CLASS, RESOLVED_BUILTIN_CLASS):
+            return None
+        mro = self.get_mro(resolved)
+        if mro is None:
+            return None
+        return [key[2] if key[0] == RESOLVED_CLASS else key[1].__name__ for key in mro]
+
+    def get_mro(self, key: tuple) -> list[tuple] | None:
+        if key[0] == RESOLVED_BUILTIN_CLASS:
+            return [(RESOLVED_BUILTIN_CLASS, cls) for cls in key[1].__mro__]
+        if key in self.mros:
+            return self.mros[key]
+        if key in self.resolving:
+            return None
+        self.resolving.add(key)
+        try:
+            mro = self._compute_mro(key)
+        finally:
+            self.resolving.discard(key)
+        self.mros[key] = mro
+        return mro
+
+    def _compute_mro(self, key: tuple) -> list[tuple] | None:
+        _, module_name, class_name = key
+        location = self.get_module_location(module_name)
+        bases = self.get_file_analysis(location[0]).definitions[class_name][1][1]
+        if len(bases) == 0:
+            return [key, (RESOLVED_BUILTIN_CLASS, object)]
+        base_keys = []
+        for base in bases:
+            base_key = self.resolve_dotted_name(module_name, base) if base is not None else None
+            if base_key is None or base_key[0] not in (RESOLVED_CLASS, RESOLVED_BUILTIN_CLASS):
+                return None
+            base_keys.append(base_key)
+        base_mros = [self.get_mro(base_key) for base_key in base_keys]
+        if any(base_mro is None for base_mro in base_mros):
+            return None
+        merged_mro = c3_merge([*base_mros, base_keys])
+        return [key, *merged_mro] if merged_mro is not None else None
+
+    def get_module_location(self, module_name: str) -> tuple | None:
+        """Return the file, whether it is a package and the submodule search paths of a module, without importing it"""
+        if module_name not in self.module_locations:
+            self.module_locations[module_name] = self._find_module_location(module_name)
+        return self.module_locations[module_name]
+
+    def _find_module_location(self, module_name: str) -> tuple | None:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            file = getattr(module, '__file__', None)
+            paths = getattr(module, '__path__', None)
+            if file is None:
+                return (None, True, list(paths)) if paths is not None else None
+            if not file.endswith('.py'):
+                return None
+            return file, paths is not None, list(paths) if paths is not None else None
+        if module_name in sys.builtin_module_names:
+            return None
+
+        parent_name, _, name = module_name.rpartition('.')
+        if parent_name == '':
+            # finding the spec of a top level module does not import anything
+            try:
+                spec = find_spec(module_name)
+            except Exception:
+                return None
+            if spec is None:
+                return None
+            paths = list(spec.submodule_search_locations) if spec.submodule_search_locations is not None else None
+            if spec.origin is None or spec.origin == 'namespace':
+                return (None, True, paths) if paths is not None else None
+            if not spec.origin.endswith('.py') or not isfile(spec.origin):
+                return None
+            return spec.origin, paths is not None, paths
+
+        parent_location = self.get_module_location(parent_name)
+        if parent_location is None or parent_location[2] is None:
+            return None
+        # same lookup order as the import system: package, compiled or source module, namespace package
+        namespace_paths = []
+        for directory in parent_location[2]:
+            package_path = join(directory, name)
+            if isfile(join(package_path, '__init__.py')):
+                return join(package_path, '__init__.py'), True, [package_path]
+            if any(isfile(join(directory, name + suffix)) for suffix in (*EXTENSION_SUFFIXES, '.pyc')):
+                return None
+            if isfile(join(directory, f'{name}.py')):
+                return join(directory, f'{name}.py'), False, None
+            if isdir(package_path):
+                namespace_paths.append(package_path)
+        if len(namespace_paths) > 0:
+            return None, True, namespace_paths
+        return None
+
+    def get_module_analysis(self, module_name: str) -> SoSFileAnalysis | None:
+        location = self.get_module_location(module_name)
+        if location is None or location[0] is None:
+            return None
+        analysis = self.get_file_analysis(location[0])
+        return analysis if analysis.is_parsed else None
+
+    def get_absolute_module_name(self, module_name: str, imported_module: str | None, level: int) -> str | None:
+        """Absolute name of a module imported by module_name, None if a relative import goes beyond the top package"""
+        if level == 0:
+            return imported_module
+        is_package = self.get_module_location(module_name)[1]
+        package_parts = module_name.split('.') if is_package else module_name.split('.')[:-1]
+        if level - 1 >= len(package_parts):
+            return None
+        package_name = '.'.join(package_parts[:len(package_parts) - level + 1])
+        return f'{package_name}.{imported_module}' if imported_module else package_name
+
+    def resolve_name(self, module_name: str, name: str):
+        """
+        Resolve a module level name as a (kind, ...) tuple, NOT_DEFINED if the module does not define it,
+        None if it can not be resolved statically
+        """
+        key = (module_name, name)
+        if key not in self.resolved_names:
+            if key in self.resolving:
+                return None
+            self.resolving.add(key)
+            try:
+                self.resolved_names[key] = self._resolve_name(module_name, name)
+            finally:
+                self.resolving.discard(key)
+        return self.resolved_names[key]
+
+    def _resolve_name(self, module_name: str, name: str):
+        location = self.get_module_location(module_name)
+        if location is None:
+            return None
+        if location[0] is None:
+            # namespace package, only submodules can be found in it
+            return NOT_DEFINED
+        analysis = self.get_module_analysis(module_name)
+        if analysis is None:
+            return None
+
+        definition_index, definition = analysis.definitions.get(name, (-1, None))
+        # a star import after the definition of the name overrides it
+        for star_index, star_module, star_level in reversed(analysis.star_imports):
+            if star_index > definition_index:
+                star_module_name = self.get_absolute_module_name(module_name, star_module, star_level)
+                resolved = self.resolve_star_imported_name(star_module_name, name) if star_module_name else None
+                if resolved != NOT_DEFINED:
+                    return resolved
+
+        if definition is None:
+            if '*' in analysis.definitions or '__getattr__' in analysis.definitions:
+                return None
+            return NOT_DEFINED
+        kind = definition[0]
+        if kind == CLASS_DEFINITION:
+            return RESOLVED_CLASS, module_name, name
+        if kind == MODULE_DEFINITION:
+            return RESOLVED_MODULE, definition[1]
+        if kind == IMPORT_DEFINITION:
+            imported_module_name = self.get_absolute_module_name(module_name, definition[1], definition[2])
+            return self.resolve_attribute(imported_module_name, definition[3]) if imported_module_name else None
+        if kind == ALIAS_DEFINITION:
+            return self.resolve_dotted_name(module_name, definition[1])
+        return None
+
+    def resolve_star_imported_name(self, module_name: str, name: str):
+        """Resolve a name imported by 'from module_name import *'"""
+        analysis = self.get_module_analysis(module_name)
+        if analysis is None:
+            location = self.get_module_location(module_name)
+            return NOT_DEFINED if location is not None and location[0] is None else None
+        if '__all__' in analysis.definitions:
+            exported_names = analysis.definitions['__all__'][1]
+            if exported_names[0] != NAMES_DEFINITION:
+                return None
+            if name not in exported_names[1]:
+                return NOT_DEFINED
+            return self.resolve_attribute(module_name, name)
+        if name.startswith('_'):
+            return NOT_DEFINED
+        return self.resolve_name(module_name, name)
+
+    def resolve_attribute(self, module_name: str, name: str):
+        """Resolve module_name.name, which may be a submodule, None if it can not be resolved statically"""
+        resolved = self.resolve_name(module_name, name)
+        if resolved != NOT_DEFINED:
+            return resolved
+        submodule_name = f'{module_name}.{name}'
+        return (RESOLVED_MODULE, submodule_name) if self.get_module_location(submodule_name) is not None else None
+
+    def resolve_dotted_name(self, module_name: str, dotted_name: str):
+        """Resolve an expression like 'a.b.C' evaluated in the namespace of module_name"""
+        names = dotted_name.split('.')
+        resolved = self.resolve_name(module_name, names[0])
+        if resolved == NOT_DEFINED:
+            builtin = getattr(builtins, names[0], None)
+            resolved = (RESOLVED_BUILTIN_CLASS, builtin) if isinstance(builtin, type) else None
+        for name in names[1:]:
+            if resolved is None or resolved[0] != RESOLVED_MODULE:
+                return None
+            resolved = self.resolve_attribute(resolved[1], name)
+        return resolved
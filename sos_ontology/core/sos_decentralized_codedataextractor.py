@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2022/11/29-2024/07/10 Copyright 2023 Capgemini
+Modifications on 2022/11/29-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -16,23 +16,36 @@ limitations under the License.
 '''
 from __future__ import annotations
 
-import ast
-import base64
 import copy
 import logging
+import multiprocessing
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
 from importlib import import_module
+from importlib.util import find_spec
 from logging import Logger
-from os import environ, listdir, pathsep, scandir, sep
+from os import cpu_count, environ, listdir, pathsep, scandir, sep
 from os.path import abspath, basename, dirname, isdir, isfile, join, splitext
 from pathlib import Path
 
 import git
-import pandas as pd
 from sostrades_core.execution_engine.execution_engine import ExecutionEngine
 from sostrades_core.sos_processes.processes_factory import SoSProcessFactory
 
+from sos_ontology.core.sos_code_analysis import (
+    CLASSES,
+    DISCIPLINE_ATTRIBUTES,
+    IMPORTS,
+    SoSClassHierarchyResolver,
+    SoSFileAnalysis,
+)
+from sos_ontology.core.sos_documentation_index import (
+    SoSDocumentationIndex,
+    get_file_signature,
+)
 from sos_ontology.core.sos_entities.code_repository import CodeRepository
 from sos_ontology.core.sos_entities.parameter import Parameter
 from sos_ontology.core.sos_entities.parameter_usage import ParameterUsage
@@ -42,9 +55,312 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntityDict
 from sos_ontology.core.sos_entities.sos_process import SoSProcess
 from sos_ontology.core.sos_entities.sos_process_repository import SoSProcessRepository
 from sos_ontology.core.sos_entities.sos_usecase import SoSUsecase
+from sos_ontology.core.sos_extraction_cache import (
+    SoSConfigurationCache,
+    SoSFileExtractionCache,
+    SoSParametersGlossaryCache,
+    SoSRepositoryExtractionCache,
+    get_file_hash,
+    get_module_repositories,
+    is_git_repository_clean,
+)
+from sos_ontology.core.sos_extraction_index import SoSExtractionIndex
+from sos_ontology.core.sos_isolated_runner import (
+    TASK_FAILED,
+    TASK_NOT_SERIALIZABLE,
+    TASK_SUCCEEDED,
+    SoSIsolatedRunner,
+)
+from sos_ontology.core.sos_parameter_descriptors import project_descriptors
+from sos_ontology.core.sos_parameters_glossary import (
+    PARAMETERS_GLOSSARY_FILE_NAME,
+    SoSMergedParametersGlossaries,
+    SoSParametersGlossary,
+    read_parameters_glossary,
+)
+from sos_ontology.core.sos_timings import (
+    FILE_PARSE_SPAN,
+    PROCESS_SPAN,
+    REPOSITORY_SPAN,
+    USECASE_SPAN,
+    add_timing,
+    timing_span,
+    without_timings,
+)
 from sos_ontology.core.sos_toolbox import SoSToolbox
 
 
+def get_process_pool_context():
+    """Multiprocessing context of the extraction worker pools, fork is used when available to inherit imported modules"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+# git metadata (branch or version tag, committed date) by (working tree, HEAD reference, HEAD commit),
+# so that the tags of a repository are only looked up once per process and HEAD commit
+git_metadata_by_head = {}
+git_metadata_by_head_lock = threading.Lock()
+
+# extractor attributes restored from the checkpoints of the extraction phases
+CHECKPOINT_ATTRIBUTES = (
+    'code_repositories_dict',
+    'logs_dict',
+    'code_repositories',
+    'sos_process_repositories',
+    'sos_processes',
+    'sos_disciplines',
+    'parameters',
+    'parameters_usages',
+    'usecases',
+    'couplings',
+    'extraction_index',
+)
+
+# number of git repositories read at the same time, git commands run in subprocesses
+GIT_METADATA_MAX_WORKERS = 16
+
+
+def get_version_tag(repo) -> str | None:
+    """Latest version tag (format v0.0.0) pointing at the HEAD commit of repo, None if there is none"""
+    # tags are looked up by git directly, resolving the commit of every tag is slow with thousands of tags
+    tags = repo.git.tag('--list', 'v*', '--points-at', 'HEAD').split()
+    if len(tags) == 0:
+        return None
+
+    def convert_version(version: str) -> list[int]:
+        return [
+            int(part)
+            for part in version.strip("v").split(".")
+        ]
+
+    # sort versions
+    return sorted(tags, key=convert_version)[-1]
+
+
+def get_git_repository_metadata(library_path: str) -> dict:
+    """
+    Name, url, branch, commit SHA and committed date of the git repository containing library_path,
+    raise git.exc.InvalidGitRepositoryError if library_path is not in a git repository
+    """
+    # Regular expression to remove connection info from url when token is
+    # used
+    INFO_REGEXP = '://.*@'
+    INFO_REPLACE = '://'
+
+    # Regular expression when it is a remote repostory with ssh
+    SSH_REGEX =  r'^[a-zA-Z]+@[a-zA-Z0-9.-]+:'
+    SSH_REGEX_TO_REPLACE = r'^.*@'
+    SSH_REGEX_REPLACE = 'https://'
+
+    repo = git.Repo(
+        path=library_path,
+        search_parent_directories=True,
+    )
+
+    # there is an url
+    if len(repo.remotes) > 0:
+        # Retrieve url and remove connection info from it
+        raw_url = repo.remotes.origin.url
+        url = re.sub(INFO_REGEXP, INFO_REPLACE, raw_url)
+        try:
+            repo_name = url.split(".git")[0].split("/")[-1]
+        except:
+            print(
+                f"Impossible to retrieve repo name from url {url}",
+            )
+            repo_name = url
+    else:
+        url = ""
+        repo_name = basename(library_path)
+
+    if repo.head.is_detached:
+        head_reference = None
+        commit = repo.head.commit
+    else:
+        head_reference = repo.active_branch.name
+        commit = repo.active_branch.commit
+    head_key = (repo.working_tree_dir, head_reference, commit.hexsha)
+    with git_metadata_by_head_lock:
+        head_metadata = git_metadata_by_head.get(head_key)
+    if head_metadata is None:
+        if head_reference is None:
+            branch_name = get_version_tag(repo) or "detached"
+        else:
+            branch_name = head_reference
+        commited_date = datetime.fromtimestamp(
+            commit.committed_date,
+            UTC,
+        )
+        head_metadata = (branch_name, commited_date.strftime("%d/%m/%Y %H:%M:%S"))
+        with git_metadata_by_head_lock:
+            git_metadata_by_head[head_key] = head_metadata
+
+    # Remove trailing .git
+    if url.endswith(".git"):
+        url = url[:-4]
+    # Verify if we are dealing with ssh remote repository and replace by https://
+    if bool(re.match(SSH_REGEX, url)):
+        url = url.replace(":", "/")
+        url = re.sub(SSH_REGEX_TO_REPLACE, SSH_REGEX_REPLACE, url)
+    return {
+        'name': repo_name,
+        'url': url,
+        'branch': head_metadata[0],
+        'commit': commit.hexsha,
+        'committed_date': head_metadata[1],
+    }
+
+
+def scan_code_repository_worker(
+        basepath: str, repo_name: str, repo_dict: dict, cache_folder: str | None = None, file_cache_key: dict | None = None,
+        repository_folders: dict | None = None,
+) -> tuple[list, dict, set]:
+    """
+    Worker of the parallel discovery phase, scan one code repository in a separate process
+    and return its plain discipline records, the logs generated during the scan
+    and the code repositories of repository_folders whose modules were imported
+    """
+    extractor = SoSCodeDataExtractor(
+        basepath=basepath,
+        logs_dict={},
+        code_repositories_dict={repo_name: repo_dict},
+        max_workers=1,
+        cache_folder=cache_folder,
+    )
+    extractor.file_cache_key = file_cache_key
+    if repository_folders is not None:
+        extractor.repository_folders = repository_folders
+    records, imported_repo_names = extractor.scan_code_repository(repo_dict['path'], repo_name)
+    return records, extractor.logs_dict, imported_repo_names
+
+
+def configure_process(repo: str, process: str, repository_folders: dict | None = None) -> dict:
+    """
+    Import and configure a process, return its module path, its ontology data, its disciplines with their data in
+    and out, the logs generated and the code repositories of repository_folders whose modules are loaded
+    as plain data that can be sent back from a worker process
+    Logs are returned as add_to_log arguments
+    """
+    process_configuration = {
+        'process_path': "",
+        'ontology_data': {},
+        'disciplines': [],
+        'logs': [],
+        'imported_repositories': [],
+    }
+    logs = process_configuration['logs']
+    ee = ExecutionEngine(f"EE.{repo}.{process}")
+    process_module_path = f"{repo}.{process}.process"
+    try:
+        process_module = import_module(process_module_path)
+        process_configuration['process_path'] = process_module.__file__
+
+        # instantiate process
+        try:
+            builder = ee.factory.get_builder_from_process(repo, process)
+            ee.factory.set_builders_to_coupling_builder(builder)
+            ee.configure()
+
+            disciplinesDict = ee.dm.convert_disciplines_dict_with_full_name()
+            process_configuration['disciplines'] = [
+                {
+                    'model_name_full_path': discipline["model_name_full_path"],
+                    'data_in': project_descriptors(discipline["reference"].get_data_in()),
+                    'data_out': project_descriptors(discipline["reference"].get_data_out()),
+                }
+                for disciplines_list in disciplinesDict.values()
+                for discipline in disciplines_list
+            ]
+
+        except Exception as ex:
+            logs.append(
+                {
+                    'category': "errors",
+                    'sub_category': "loadProcess",
+                    'message': f"{repo}.{process}",
+                    'exception': ex,
+                },
+            )
+        # retrieve process ontology info
+        try:
+            # retrieve process Builder
+            processBuilderClass = getattr(process_module, 'ProcessBuilder')
+            if hasattr(processBuilderClass, "_ontology_data"):
+                process_configuration['ontology_data'] = processBuilderClass._ontology_data
+
+            else:
+                logs.append(
+                    {
+                        'category': "ontologyInfo",
+                        'sub_category': "process",
+                        'message': f"{process}",
+                        'exception': "_ontology_data does not exist",
+                    },
+                )
+
+        except Exception as ex:
+            logs.append(
+                {
+                    'category': "errors",
+                    'sub_category': "loadProcessBuilder",
+                    'message': f"Impossible to retrieve process builder for {process}",
+                    'exception': ex,
+                },
+            )
+    except Exception as ex:
+        logs.append(
+            {
+                'category': "errors",
+                'sub_category': "loadProcess",
+                'message': f"{repo}.{process}",
+                'exception': ex,
+            },
+        )
+    process_configuration['imported_repositories'] = sorted(get_module_repositories(repository_folders or {}))
+    return process_configuration
+
+
+def configure_usecase(reference_path: str, repository_folders: dict | None = None) -> dict:
+    """
+    Load and configure the Study of a usecase module, return its name, its disciplines with their data in and out,
+    its couplings and the code repositories of repository_folders whose modules are loaded as plain data
+    that can be sent back from a worker process
+    """
+    ref_module = import_module(reference_path.replace(".py", ""))
+    loaded_ref = getattr(ref_module, "Study")()
+    # configure usecase
+    loaded_ref.load_data()
+    loaded_ref.execution_engine.configure()
+    usecase_configuration = {
+        'study_name': loaded_ref.study_name,
+        'run_usecase': loaded_ref.run_usecase,
+    }
+    disciplinesDict = loaded_ref.ee.dm.convert_disciplines_dict_with_full_name()
+    # couplings_dict = loaded_ref.ee.root_process.export_couplings().to_dict(orient='index')
+    couplings_list = (
+        loaded_ref.ee.root_process.coupling_structure.graph.get_disciplines_couplings()
+    )
+    # couplings as (module of discipline from, module of discipline to, coupled parameters)
+    usecase_configuration['couplings'] = [
+        (coupling[0].__module__, coupling[1].__module__, list(coupling[2]))
+        for coupling in couplings_list
+    ]
+    usecase_configuration['disciplines'] = {
+        discipline_local_name: [
+            {
+                'model_name_full_path': discipline["model_name_full_path"],
+                'data_in': project_descriptors(discipline["reference"].get_data_in()),
+                'data_out': project_descriptors(discipline["reference"].get_data_out()),
+            }
+            for discipline in disciplines_list
+        ]
+        for discipline_local_name, disciplines_list in disciplinesDict.items()
+    }
+    usecase_configuration['imported_repositories'] = sorted(get_module_repositories(repository_folders or {}))
+    return usecase_configuration
+
+
 class SoSCodeDataExtractor:
     """Class to read and parse Python code to look for entities and links for the ontology"""
 
@@ -53,8 +369,35 @@ class SoSCodeDataExtractor:
             basepath: str = ".",
             logs_dict: dict = {},
             previous_code_repositories_traceability: dict = {},
+            code_repositories_dict: dict | None = None,
+            max_workers: int | None = None,
+            cache_folder: str | None = None,
+            usecase_timeout: float | None = None,
+            usecase_memory_limit: int | None = None,
+            process_timeout: float | None = None,
     ):
-        """Constructor"""
+        """
+        Constructor
+        :param code_repositories_dict: code repositories to scan, retrieved from the PYTHONPATH git repositories if None
+        :type code_repositories_dict: dict
+        :param max_workers: number of processes used to scan the code repositories in parallel,
+            all CPUs if None, the scan is serial if 1
+        :type max_workers: int
+        :param cache_folder: folder of the extraction artifacts of each code repository and Python file, only
+            repositories whose commit changed and files whose content changed since the stored artifacts are scanned,
+            no artifact is used if None. The configurations of processes and usecases are also stored and only
+            configured again if one of the code repositories they were built from changed
+        :type cache_folder: str
+        :param usecase_timeout: time in seconds after which the configuration of a usecase is stopped,
+            no timeout if None. Usecases are configured in isolated processes only if max_workers > 1
+        :type usecase_timeout: float
+        :param usecase_memory_limit: memory limit in MB of the process configuring a usecase or a process,
+            no limit if None
+        :type usecase_memory_limit: int
+        :param process_timeout: time in seconds after which the configuration of a process is stopped,
+            no timeout if None. Processes are configured in isolated processes only if max_workers > 1
+        :type process_timeout: float
+        """
         self.toolbox = SoSToolbox()
         self.basepath = basepath
         self.exclusions_list = [
@@ -93,6 +436,25 @@ class SoSCodeDataExtractor:
             'gemseo',
         ]
         self.logs_dict = logs_dict
+        self.max_workers = (cpu_count() or 1) if max_workers is None else max_workers
+        self.cache_folder = cache_folder
+        self.repository_cache = SoSRepositoryExtractionCache(cache_folder) if cache_folder else None
+        self.configuration_cache = SoSConfigurationCache(cache_folder) if cache_folder else None
+        self.glossary_cache = SoSParametersGlossaryCache(cache_folder) if cache_folder else None
+        # ids of the process and usecase configurations reused from the cache
+        self.cached_configuration_ids = set()
+        # commit of each code repository, None if it has local modifications
+        self.repositories_state = None
+        # cache of the Python files of the code repository being scanned, and the key of its entries
+        self.file_cache = None
+        self.file_cache_key = None
+        self.usecase_timeout = usecase_timeout
+        self.usecase_memory_limit = usecase_memory_limit
+        self.process_timeout = process_timeout
+        # outcome of the usecases configured in isolated processes by usecase id
+        self.usecase_configurations = {}
+        # outcome of the processes configured in isolated processes by process id
+        self.process_configurations = {}
 
         self.code_repositories = SoSEntityDict()
         self.sos_process_repositories = SoSEntityDict()
@@ -102,9 +464,17 @@ class SoSCodeDataExtractor:
         self.parameters_usages = SoSEntityDict()
         self.usecases = SoSEntityDict()
         self.couplings = SoSEntityDict()
+        # parameters indexed by code repository, unit and datatype as their usages are generated
+        self.extraction_index = SoSExtractionIndex()
         self.current_code_repo = None
         self.current_sos_discipline = None
         self.current_process_repository = None
+        # analysis of the parsed Python files by absolute path
+        self.file_analysis_cache = {}
+        # class hierarchies resolved from the parsed files, so that discovery does not import the scanned modules
+        self.class_hierarchy_resolver = SoSClassHierarchyResolver(self.get_file_analysis)
+        # documentation folders listed and images encoded once per extraction
+        self.documentation_index = SoSDocumentationIndex()
         self.logger = logging.getLogger("Ontology")
 
         self.ontology_data_keys = {
@@ -124,10 +494,18 @@ class SoSCodeDataExtractor:
         }
 
         # retrieve traceability info concerning code repositories
-        self.code_repositories_dict = self.retrieve_code_repositories(
-            logger=self.logger,
-            previous_code_repo_dict=previous_code_repositories_traceability,
-        )
+        if code_repositories_dict is None:
+            code_repositories_dict = self.retrieve_code_repositories(
+                logger=self.logger,
+                previous_code_repo_dict=previous_code_repositories_traceability,
+            )
+        self.code_repositories_dict = code_repositories_dict
+        # folder of each code repository, to find the code repositories of the imported modules
+        self.repository_folders = {
+            repo_name: repo_dict['path']
+            for repo_name, repo_dict in self.code_repositories_dict.items()
+            if repo_dict.get('path', None) is not None
+        }
 
         # self.code_repositories_dict = {
         #     'sostrades-core': self.code_repositories_dict['sostrades-core']
@@ -149,7 +527,11 @@ class SoSCodeDataExtractor:
             if category == "date":
                 self.logs_dict[category] = datetime.now(
                 ).strftime("%d/%m/%Y %H:%M:%S")
-            elif category == "errors":
+            elif (
+                    category == "errors"
+                    or category == "usecaseConfiguration"
+                    or category == "processConfiguration"
+            ):
                 error_info = {
                     "message": message,
                 }
@@ -170,140 +552,105 @@ class SoSCodeDataExtractor:
                     or category == "synthesis"
                     or category == "inconsistencies"
                     or category == "duplicateParametersGlossary"
+                    or category == "glossaryConflicts"
             ):
                 self.logs_dict[category][sub_category] = message
 
-    def get_classes_from_parsing_code(self, file):
-        # return the list of classes instantiated by the first declaration of
-        # function in a Python file
-        try:
-            with open(file=file, encoding="utf-8", errors="ignore") as myfile:
-                data = myfile.read()
-                p = ast.parse(data)
-                classes = [
-                     {
-                        "name": node.name,
-                        "type": [
-                            n.id if hasattr(n, "id") else n.attr
-                            for n in node.bases
-                        ],
-                    }
-                    for node in ast.walk(p)
-                    if isinstance(node, ast.ClassDef)
-                ]
-                return classes
+    def merge_logs(self, logs_dict: dict):
+        """Append logs generated by an other extractor (a worker process) to the logs of this extractor"""
+        if self.logs_dict is None:
+            return
+        for category, category_logs in logs_dict.items():
+            if isinstance(category_logs, dict):
+                merged_category_logs = self.logs_dict.setdefault(category, {})
+                for sub_category, sub_category_logs in category_logs.items():
+                    if isinstance(sub_category_logs, list):
+                        merged_category_logs.setdefault(sub_category, []).extend(sub_category_logs)
+                    else:
+                        merged_category_logs[sub_category] = sub_category_logs
+            elif isinstance(category_logs, list):
+                self.logs_dict.setdefault(category, []).extend(category_logs)
+            else:
+                self.logs_dict[category] = category_logs
+
+    def get_file_analysis(self, file) -> SoSFileAnalysis:
+        """Return the analysis of a Python file, each file is read and parsed only once during the extraction"""
+        file_path = abspath(file)
+        file_analysis = self.file_analysis_cache.get(file_path)
+        if file_analysis is None:
+            if self.file_cache is not None:
+                file_cache_entry = self.file_cache.get_entry(file_path)
+                if file_cache_entry['analysis'] is None:
+                    file_cache_entry['analysis'] = self.parse_file(file_path)
+                file_analysis = file_cache_entry['analysis']
+            else:
+                file_analysis = self.parse_file(file_path)
+            self.file_analysis_cache[file_path] = file_analysis
+        return file_analysis
 
-        except Exception as ex:
+    def parse_file(self, file_path: str) -> SoSFileAnalysis:
+        """Read and parse a Python file, its parse time is recorded in the logs"""
+        with timing_span(self.logs_dict, FILE_PARSE_SPAN, file_path):
+            return SoSFileAnalysis(file_path)
+
+    def log_file_analysis_errors(self, file, file_analysis: SoSFileAnalysis, information: str):
+        for sub_category, message, exception in file_analysis.errors[information]:
             self.add_to_log(
                 category="errors",
-                sub_category="parsingClassList",
-                message=f'Impossible to parse classes from {abspath(file).replace(self.basepath, "")}',
-                exception=ex,
+                sub_category=sub_category,
+                message=f'{message} {abspath(file).replace(self.basepath, "")}',
+                exception=exception,
             )
-            return []
+
+    def get_classes_from_parsing_code(self, file):
+        # return the list of classes instantiated by the first declaration of
+        # function in a Python file
+        file_analysis = self.get_file_analysis(file)
+        self.log_file_analysis_errors(file, file_analysis, CLASSES)
+        return file_analysis.classes
 
     def get_disc_attributes_from_parsing_code(self, file):
         # return the METADATA dict of the discipline
-        metadata = {}
-        maturity = ""
-        desc_in = {}
-        desc_out = {}
-
-        try:
-            with open(file=file, encoding="utf-8", errors="ignore") as myfile:
-                data = myfile.read()
-                p = ast.parse(data)
-                for node in ast.walk(p):
-                    if isinstance(node, ast.ClassDef):
-                        for assign in node.body:
-                            if isinstance(assign, ast.Assign) and isinstance(assign.targets[0], ast.Name):
-                                if isinstance(assign.value, ast.Dict):
-                                    if assign.targets[0].id == "_ontology_data":
-                                        try:
-                                            metadata = ast.literal_eval(
-                                                assign.value,
-                                            )
-                                        except Exception as ex:
-                                            self.add_to_log(
-                                                category="errors",
-                                                sub_category="parsingDiscipline",
-                                                message=f'Impossible to parse _ontology_data from {abspath(file).replace(self.basepath, "")}',
-                                                exception=ex,
-                                            )
-                                    if assign.targets[0].id == "DESC_IN":
-                                        # this check is to avoid error on
-                                        # statements where DESC_IN is updated via a
-                                        # function
-                                        try:
-                                            desc_in = ast.literal_eval(
-                                                assign.value)
-                                        except Exception as ex:
-                                            self.add_to_log(
-                                                category="errors",
-                                                sub_category="parsingDiscipline",
-                                                message=f'Impossible to parse DESC_IN from {abspath(file).replace(self.basepath, "")}',
-                                                exception=ex,
-                                            )
-                                    if assign.targets[0].id == "DESC_OUT":
-                                        # this check is to avoid error on
-                                        # statements where DESC_IN is updated via a
-                                        # function
-                                        try:
-                                            desc_out = ast.literal_eval(
-                                                assign.value,
-                                            )
-                                        except Exception as ex:
-                                            self.add_to_log(
-                                                category="errors",
-                                                sub_category="parsingDiscipline",
-                                                message=f'Impossible to parse DESC_OUT from {abspath(file).replace(self.basepath, "")}',
-                                                exception=ex,
-                                            )
-                                if assign.targets[0].id == "_maturity":
-                                    maturity = ast.literal_eval(
-                                        assign.value)
-
-        except Exception as ex:
-            self.add_to_log(
-                category="errors",
-                sub_category="parsingDiscipline",
-                message=f'Impossible to parse sos discipline {abspath(file).replace(self.basepath, "")}',
-                exception=ex,
-            )
-
-        return metadata, maturity, desc_in, desc_out
+        file_analysis = self.get_file_analysis(file)
+        self.log_file_analysis_errors(file, file_analysis, DISCIPLINE_ATTRIBUTES)
+        return file_analysis.get_discipline_attributes()
 
     def get_imports_from_parsing_code(self, file):
-        imports = {}
-        try:
-            with open(file=file, encoding="utf-8", errors="ignore") as myfile:
-                data = myfile.read()
-                p = ast.parse(data)
-                for node in ast.walk(p):
-                    module = None
-                    if isinstance(node, ast.Import | ast.ImportFrom):
-                        if isinstance(node, ast.ImportFrom):
-                            module = node.module
-                        for n in node.names:
-
-                            if n.asname is not None:
-                                imports[n.asname] = {
-                                    "module": module, "name": n.name}
-                            else:
-                                imports[n.name] = {
-                                    "module": module, "name": n.name}
-                return imports
-
-        except Exception as ex:
-            self.add_to_log(
-                category="errors",
-                sub_category="parsingImportList",
-                message=f'Impossible to parse import list from {abspath(file).replace(self.basepath, "")}',
-                exception=ex,
-            )
-            return {}
+        file_analysis = self.get_file_analysis(file)
+        self.log_file_analysis_errors(file, file_analysis, IMPORTS)
+        return file_analysis.imports
 
     def get_sos_discipline_internal_variables(self, entry, path, model_id):
+        """
+        Return the DESC_IN, DESC_OUT, maturity and _ontology_data of the discipline class at path.
+        When the file of the discipline and the code repositories modules loaded with it did not change since the last
+        extraction, the stored attributes are returned and the logs generated while loading them are added again
+        to the logs
+        """
+        if self.file_cache is None:
+            return self.load_sos_discipline_internal_variables(entry, path, model_id)
+
+        file_cache_entry = self.file_cache.get_entry(abspath(entry))
+        cached_internal_variables = file_cache_entry['internal_variables'].get(path)
+        if cached_internal_variables is not None and not self.file_cache.are_loaded_modules_unchanged(
+                cached_internal_variables[2],
+        ):
+            cached_internal_variables = None
+        if cached_internal_variables is None:
+            discipline_logs_dict = {}
+            extractor_logs_dict, self.logs_dict = self.logs_dict, discipline_logs_dict
+            try:
+                attributes = self.load_sos_discipline_internal_variables(entry, path, model_id)
+            finally:
+                self.logs_dict = extractor_logs_dict
+            # the variables are built when the module is imported, they depend on all the modules loaded so far
+            cached_internal_variables = (attributes, discipline_logs_dict, self.file_cache.record_loaded_modules())
+            file_cache_entry['internal_variables'][path] = cached_internal_variables
+        attributes, discipline_logs_dict, _ = cached_internal_variables
+        self.merge_logs(discipline_logs_dict)
+        return attributes
+
+    def load_sos_discipline_internal_variables(self, entry, path, model_id):
         attributes = {
             "DESC_IN": {},
             "DESC_OUT": {},
@@ -321,26 +668,26 @@ class SoSCodeDataExtractor:
                     hasattr(loaded_discipline, "DESC_IN")
                     and loaded_discipline.DESC_IN is not None
             ):
-                attributes["DESC_IN"] = copy.deepcopy(
+                attributes["DESC_IN"] = project_descriptors(
                     loaded_discipline.DESC_IN)
             if (
                     hasattr(loaded_discipline, "_data_in")
                     and loaded_discipline.get_data_in() is not None
             ):
                 attributes["DESC_IN"].update(
-                    copy.deepcopy(loaded_discipline.get_data_in()))
+                    project_descriptors(loaded_discipline.get_data_in()))
             if (
                     hasattr(loaded_discipline, "DESC_OUT")
                     and loaded_discipline.DESC_OUT is not None
             ):
-                attributes["DESC_OUT"] = copy.deepcopy(
+                attributes["DESC_OUT"] = project_descriptors(
                     loaded_discipline.DESC_OUT)
             if (
                     hasattr(loaded_discipline, "_data_out")
                     and loaded_discipline._data_out is not None
             ):
                 attributes["DESC_OUT"].update(
-                    copy.deepcopy(loaded_discipline._data_out),
+                    project_descriptors(loaded_discipline._data_out),
                 )
             if (
                     hasattr(loaded_discipline, "_maturity")
@@ -388,11 +735,11 @@ class SoSCodeDataExtractor:
                 loaded_discipline = ee.factory.sos_disciplines[0]
                 if loaded_discipline.get_data_in() is not None:
                     attributes["DESC_IN"].update(
-                        copy.deepcopy(loaded_discipline.get_data_in()),
+                        project_descriptors(loaded_discipline.get_data_in()),
                     )
                 if loaded_discipline.get_data_out() is not None:
                     attributes["DESC_OUT"].update(
-                        copy.deepcopy(loaded_discipline.get_data_out()),
+                        project_descriptors(loaded_discipline.get_data_out()),
                     )
             except Exception as ex:
                 self.add_to_log(
@@ -422,7 +769,7 @@ class SoSCodeDataExtractor:
                 sub_category="loadingDiscipline",
                 message=f'Parsed DESC_IN used because it contains more info than loaded DESC_IN for  {abspath(entry).replace(self.basepath, "")}',
             )
-            attributes["DESC_IN"] = copy.deepcopy(parsed_DESC_IN)
+            attributes["DESC_IN"] = project_descriptors(parsed_DESC_IN)
 
         if parsed_DESC_OUT is not None and parsed_DESC_OUT != {} and len(parsed_DESC_OUT.keys()) > len(attributes.get("DESC_OUT", {}).keys()):
             self.add_to_log(
@@ -430,7 +777,7 @@ class SoSCodeDataExtractor:
                 sub_category="loadingDiscipline",
                 message=f'Parsed DESC_OUT used because it contains more info than loaded DESC_OUT for  {abspath(entry).replace(self.basepath, "")}',
             )
-            attributes["DESC_OUT"] = copy.deepcopy(parsed_DESC_OUT)
+            attributes["DESC_OUT"] = project_descriptors(parsed_DESC_OUT)
 
         if attributes["_ontology_data"] == {} and parsed_ontology_data != {}:
             attributes["_ontology_data"] = parsed_ontology_data
@@ -450,20 +797,23 @@ class SoSCodeDataExtractor:
             for t in class_type:
                 # we verify if this class is imported in the module
                 if t in imports:
-                    # we load the imported class
                     try:
-                        classInstance = getattr(
-                            import_module(
-                                imports[t]["module"]), imports[t]["name"],
+                        # the inheritance tree is resolved from the parsed files, the imported class is only loaded
+                        # if its hierarchy can not be resolved statically
+                        inheritance_tree = self.class_hierarchy_resolver.get_inheritance_tree(
+                            imports[t]["module"], imports[t]["name"],
                         )
-                        # we retrieve the inheritance_tree
-                        inheritance_tree = type.mro(classInstance)
+                        if inheritance_tree is None:
+                            classInstance = getattr(
+                                import_module(
+                                    imports[t]["module"]), imports[t]["name"],
+                            )
+                            inheritance_tree = [i.__name__ for i in type.mro(classInstance)]
                         # we check if the SoSDiscipline or SoSWrapp (for Execution Engine v4) is present in the
                         # inheritance
                         if any(
                                 [
-                                    disc_class in [
-                                        i.__name__ for i in inheritance_tree]
+                                    disc_class in inheritance_tree
                                     for disc_class in ['ProxyDiscipline', 'SoSWrapp']
                                 ],
                         ):
@@ -471,9 +821,7 @@ class SoSCodeDataExtractor:
                             # print(f'{entry.name} is a model !')
                             info = {
                                 "name": class_name,
-                                "inheritance_tree": [
-                                    i.__name__ for i in inheritance_tree
-                                ],
+                                "inheritance_tree": inheritance_tree,
                             }
                             sos_disc = True
 
@@ -487,6 +835,12 @@ class SoSCodeDataExtractor:
         return sos_disc, info
 
     def add_sos_discipline_and_associated_parameters(self, entry, rootpath, class_info):
+        self.add_sos_discipline_from_record(
+            self.get_sos_discipline_record(entry, rootpath, class_info),
+        )
+
+    def get_sos_discipline_record(self, entry, rootpath, class_info) -> dict:
+        """Extract the discipline attributes and its DESC_IN/DESC_OUT as plain data, without creating any entity"""
         # Fullpath
         fullpath = abspath(entry).replace(abspath(rootpath) + sep, "")
 
@@ -504,46 +858,58 @@ class SoSCodeDataExtractor:
         if disc_label == model_id:
             disc_label = short_id
 
-        new_sos_discipline = SoSDiscipline(
-            id=model_id,
-            label=disc_label,
-            repository=self.current_code_repo,
-            pythonModulePath=fullpath,
-            definition=modelAttributes['_ontology_data'].get('definition', ''),
-            validated=modelAttributes['_ontology_data'].get('validated', ''),
-            type=modelAttributes['_ontology_data'].get('type', ''),
-            icon=modelAttributes['_ontology_data'].get('icon', ''),
-            documentation=self.get_markdown_documentation(abspath(entry)),
-            last_modification_date=modelAttributes['_ontology_data'].get(
+        discipline_attributes = {
+            'id': model_id,
+            'label': disc_label,
+            'pythonModulePath': fullpath,
+            'definition': modelAttributes['_ontology_data'].get('definition', ''),
+            'validated': modelAttributes['_ontology_data'].get('validated', ''),
+            'type': modelAttributes['_ontology_data'].get('type', ''),
+            'icon': modelAttributes['_ontology_data'].get('icon', ''),
+            'documentation': self.get_markdown_documentation(abspath(entry)),
+            'last_modification_date': modelAttributes['_ontology_data'].get(
                 'last_modification_date', '',
             ),
-            validated_by=modelAttributes['_ontology_data'].get(
+            'validated_by': modelAttributes['_ontology_data'].get(
                 'validated_by', ''),
-            pythonClassInheritance=class_info["inheritance_tree"],
-            pythonClass=class_info["name"],
-            source=modelAttributes['_ontology_data'].get('source', ''),
-            category=modelAttributes['_ontology_data'].get('category', ''),
-            version=modelAttributes['_ontology_data'].get('version', ''),
-        )
-        # add discipline to list
-        self.sos_disciplines.add(new_sos_discipline)
-        self.current_sos_discipline = new_sos_discipline
+            'pythonClassInheritance': class_info["inheritance_tree"],
+            'pythonClass': class_info["name"],
+            'source': modelAttributes['_ontology_data'].get('source', ''),
+            'category': modelAttributes['_ontology_data'].get('category', ''),
+            'version': modelAttributes['_ontology_data'].get('version', ''),
+        }
 
         # check ontology keys
         self.check_ontology_keys(
             modelAttributes['_ontology_data'], 'sos_discipline', model_id,
         )
 
+        return {
+            'discipline': discipline_attributes,
+            'DESC_IN': modelAttributes["DESC_IN"],
+            'DESC_OUT': modelAttributes["DESC_OUT"],
+        }
+
+    def add_sos_discipline_from_record(self, record: dict):
+        """Create the discipline of a record in the current code repository, with its parameters and usages"""
+        new_sos_discipline = SoSDiscipline(
+            repository=self.current_code_repo,
+            **record['discipline'],
+        )
+        # add discipline to list
+        self.sos_disciplines.add(new_sos_discipline)
+        self.current_sos_discipline = new_sos_discipline
+
         # add input parameters
         self.generate_parameters(
-            param_dict=modelAttributes["DESC_IN"],
+            param_dict=record["DESC_IN"],
             io="input",
             discipline_entity=self.current_sos_discipline,
         )
 
         # add output parameters
         self.generate_parameters(
-            param_dict=modelAttributes["DESC_OUT"],
+            param_dict=record["DESC_OUT"],
             io="output",
             discipline_entity=self.current_sos_discipline,
         )
@@ -581,8 +947,15 @@ class SoSCodeDataExtractor:
                         parameter=parameter_entity,
                         sos_discipline=discipline_entity,
                     )
+                    # the usage is added to the parameter by the ParameterUsage constructor
                     self.parameters_usages.add(new_param_usage)
-                    parameter_entity.add_usage(new_param_usage)
+                    self.extraction_index.add_parameter_usage(
+                        parameter_id=parameter_entity.id,
+                        repository_label=discipline_entity.repository.label,
+                        discipline_id=discipline_entity.id,
+                        unit=new_param_usage.unit,
+                        datatype=new_param_usage.datatype,
+                    )
                     parameter_usage_entity = new_param_usage
                 else:
                     parameter_usage_entity.updateAttributes(
@@ -594,8 +967,11 @@ class SoSCodeDataExtractor:
                     discipline_entity.add_output_parameter_usage(
                         parameter_usage_entity)
 
-    def generate_sos_disciplines_and_parameters(self, basepath, level, rootpath):
-        """This function looks for sos_discipline and associated parameters in all files in directory"""
+    def generate_sos_disciplines_and_parameters(self, basepath, level, rootpath, records=None):
+        """
+        This function looks for sos_discipline and associated parameters in all files in directory
+        If a records list is given, the disciplines are appended to it as plain records instead of being created
+        """
         with scandir(basepath) as entries:
             for entry in entries:
                 if entry.name not in self.exclusions_list:
@@ -603,11 +979,20 @@ class SoSCodeDataExtractor:
                         is_sos_disc, class_info = self.is_sos_discipline(
                             entry)
                         if is_sos_disc:
-                            self.add_sos_discipline_and_associated_parameters(
-                                entry=entry,
-                                rootpath=rootpath,
-                                class_info=class_info,
-                            )
+                            if records is None:
+                                self.add_sos_discipline_and_associated_parameters(
+                                    entry=entry,
+                                    rootpath=rootpath,
+                                    class_info=class_info,
+                                )
+                            else:
+                                records.append(
+                                    self.get_sos_discipline_record(
+                                        entry=entry,
+                                        rootpath=rootpath,
+                                        class_info=class_info,
+                                    ),
+                                )
 
                     if entry.is_dir():
                         if level == 1:
@@ -618,7 +1003,7 @@ class SoSCodeDataExtractor:
                                     self.basepath, ""),
                             )
                         self.generate_sos_disciplines_and_parameters(
-                            abspath(entry), level + 1, rootpath,
+                            abspath(entry), level + 1, rootpath, records,
                         )
 
     def generate_process_repository(self, repo, code_repo):
@@ -672,60 +1057,13 @@ class SoSCodeDataExtractor:
 
     def generate_process(self, process):
         repo = self.current_process_repository.id
-        ee = ExecutionEngine(f"EE.{repo}.{process}")
-        process_path = ""
         documentation = ""
-        disciplinesDict = {}
-        _ontology_data = {}
         process_module_path = f"{repo}.{process}.process"
-        try:
-            process_module = import_module(process_module_path)
-            process_path = process_module.__file__
-
-            # instantiate process
-            try:
-                builder = ee.factory.get_builder_from_process(repo, process)
-                ee.factory.set_builders_to_coupling_builder(builder)
-                ee.configure()
-
-                disciplinesDict = ee.dm.convert_disciplines_dict_with_full_name()
-
-            except Exception as ex:
-                self.add_to_log(
-                    category="errors",
-                    sub_category="loadProcess",
-                    message=f"{repo}.{process}",
-                    exception=ex,
-                )
-            # retrieve process ontology info
-            try:
-                # retrieve process Builder
-                processBuilderClass = getattr(process_module, 'ProcessBuilder')
-                if hasattr(processBuilderClass, "_ontology_data"):
-                    _ontology_data = processBuilderClass._ontology_data
-
-                else:
-                    self.add_to_log(
-                        category="ontologyInfo",
-                        sub_category="process",
-                        message=f"{process}",
-                        exception="_ontology_data does not exist",
-                    )
-
-            except Exception as ex:
-                self.add_to_log(
-                    category="errors",
-                    sub_category="loadProcessBuilder",
-                    message=f"Impossible to retrieve process builder for {process}",
-                    exception=ex,
-                )
-        except Exception as ex:
-            self.add_to_log(
-                category="errors",
-                sub_category="loadProcess",
-                message=f"{repo}.{process}",
-                exception=ex,
-            )
+        process_configuration = self.get_process_configuration(repo, process)
+        for log_arguments in process_configuration['logs']:
+            self.add_to_log(**log_arguments)
+        process_path = process_configuration['process_path']
+        _ontology_data = process_configuration['ontology_data']
 
         if process_path != "":
             documentation = self.get_markdown_documentation(process_path)
@@ -746,39 +1084,75 @@ class SoSCodeDataExtractor:
         self.check_ontology_keys(_ontology_data, 'process', process)
 
         # add disciplines
-        if disciplinesDict != {}:
-            for disciplines_list in disciplinesDict.values():
-                for discipline in disciplines_list:
-                    disc_entity = self.sos_disciplines.get(
-                        discipline["model_name_full_path"],
-                    )
-                    if disc_entity is not None:
-                        new_process.add_model(disc_entity)
-                        # add parameters
-                        # IN
-                        self.generate_parameters(
-                            param_dict=discipline["reference"].get_data_in(),
-                            io="input",
-                            discipline_entity=disc_entity,
-                        )
-                        # OUT
-                        self.generate_parameters(
-                            param_dict=discipline["reference"].get_data_out(),
-                            io="output",
-                            discipline_entity=disc_entity,
-                        )
+        for discipline in process_configuration['disciplines']:
+            disc_entity = self.sos_disciplines.get(
+                discipline["model_name_full_path"],
+            )
+            if disc_entity is not None:
+                new_process.add_model(disc_entity)
+                # add parameters
+                # IN
+                self.generate_parameters(
+                    param_dict=discipline["data_in"],
+                    io="input",
+                    discipline_entity=disc_entity,
+                )
+                # OUT
+                self.generate_parameters(
+                    param_dict=discipline["data_out"],
+                    io="output",
+                    discipline_entity=disc_entity,
+                )
 
-                    else:
-                        self.add_to_log(
-                            category="errors",
-                            sub_category="missingSoSDiscipline",
-                            message=f'Impossible to find discipline {discipline["model_name_full_path"]}',
-                        )
+            else:
+                self.add_to_log(
+                    category="errors",
+                    sub_category="missingSoSDiscipline",
+                    message=f'Impossible to find discipline {discipline["model_name_full_path"]}',
+                )
 
         return new_process, process_path
 
+    def get_process_configuration(self, repo, process) -> dict:
+        """
+        Return the configuration of a process, from its isolated process if it was configured in one,
+        otherwise by configuring it in this process
+        If the isolated process was stopped (timeout, memory limit) or crashed, the configuration is empty
+        """
+        process_id = f"{repo}.{process}"
+        outcome = self.process_configurations.pop(process_id, None)
+        if outcome is None or outcome[0] == TASK_NOT_SERIALIZABLE:
+            with timing_span(self.logs_dict, PROCESS_SPAN, process_id):
+                outcome = (TASK_SUCCEEDED, configure_process(repo, process, self.repository_folders))
+        status, result = outcome
+        if status == TASK_SUCCEEDED:
+            # configurations with errors may depend on the environment, they are configured again next time
+            if all(log_arguments['category'] != "errors" for log_arguments in result['logs']):
+                self.store_configuration(process_id, self.current_process_repository.code_repository.id, result)
+            return result
+        if status == TASK_FAILED:
+            raise result
+        print(f"Configuration of process {repo}.{process} stopped: {status}")
+        self.add_to_log(
+            category="processConfiguration",
+            sub_category=status,
+            message=f"{repo}.{process}",
+            exception=result,
+        )
+        return {
+            'process_path': "",
+            'ontology_data': {},
+            'disciplines': [],
+            'logs': [],
+        }
+
     def generate_entities_from_code_repositories(self) -> dict:
+        self.generate_disciplines_from_code_repositories()
+        self.generate_processes_from_code_repositories()
+        return self.generate_parameters_glossaries()
 
+    def generate_disciplines_from_code_repositories(self):
+        """Generate the code repositories with their disciplines, parameters and parameter usages"""
         # retrieve recursively models and parameters into self.models_with_params_dict
         # iterate over all paths folders
         print(
@@ -787,17 +1161,24 @@ class SoSCodeDataExtractor:
 
         # only code repositories listed in traceability dict will be explored.
         # All code repo must be Git repositories
+        scan_results = self.scan_code_repositories()
+        # the records are merged in the order of the code repositories dict so that
+        # entities (and the generated ontology) are the same than with a serial scan
         for repo_name, repo_dict in self.code_repositories_dict.items():
             path = repo_dict.get('path', None)
             if path is not None:
                 # each path is a code repository
-                print(f"Scan code repository {path}")
                 new_code_repo = CodeRepository(repo_name, repo_name)
                 new_code_repo.update_info(repo_dict)
                 self.code_repositories.add(new_code_repo)
                 self.current_code_repo = new_code_repo
-                self.generate_sos_disciplines_and_parameters(path, 0, path)
+                records, repo_logs_dict = scan_results[repo_name]
+                self.merge_logs(repo_logs_dict)
+                for record in records:
+                    self.add_sos_discipline_from_record(record)
 
+    def generate_processes_from_code_repositories(self):
+        """Generate the process repositories with their processes, usecases and couplings"""
         # retrieve list of process repository
         print(
             "#####################    LOOKING FOR PROCESSES, USECASES AND COUPLINGS    #########################",
@@ -808,6 +1189,10 @@ class SoSCodeDataExtractor:
         # Get processes dictionary
         processes_dict = process_factory.get_processes_dict()
 
+        # processes and usecases are the slowest to configure, they are configured first in parallel isolated processes
+        self.configure_processes(processes_dict)
+        self.configure_usecases(processes_dict)
+
         # retrieve list of processes, reference and couplings
         for process_repo_id, processIdList in processes_dict.items():
             code_repo_entity = self.get_code_repository_entity(
@@ -830,38 +1215,45 @@ class SoSCodeDataExtractor:
 
                     # generate usecases
                     if new_process_path != "":
-                        # construct usecases folder path
-                        folder_path = dirname(new_process_path)
-                        # match pattern to retrieve usecase files
-                        pattern = re.compile(r"^usecase.*\.py")
-                        for f in listdir(folder_path):
-                            if (
-                                f != "__init__.py"
-                                and f != "process.py"
-                                and f != "__pycache__"
-                            ) and pattern.match(f):
-                                usecase_id = f"{process_repo_id}.{process}.{f}"
-                                (
-                                    new_usecase_entity,
-                                    couplings_list,
-                                ) = self.generate_usecase(
-                                    usecase_id,
-                                    process_entity=new_process_entity,
-                                )
+                        for usecase_id in self.get_usecase_reference_paths(
+                            process_repo_id, process, new_process_path,
+                        ):
+                            (
+                                new_usecase_entity,
+                                couplings_list,
+                            ) = self.generate_usecase(
+                                usecase_id,
+                                process_entity=new_process_entity,
+                            )
 
-                                # generate couplings
-                                self.generate_couplings(
-                                    couplings_list,
-                                    usecase=new_usecase_entity,
-                                )
+                            # generate couplings
+                            self.generate_couplings(
+                                couplings_list,
+                                usecase=new_usecase_entity,
+                            )
 
+    def generate_parameters_glossaries(self) -> dict:
+        """Add the information of the parameters glossaries to the parameters and write the extraction logs"""
         print(
             "#####################    LOOKING FOR PARAMETERS GLOSSARY    #########################",
         )
+        parameters_glossaries = {}
         for repo_dict in self.code_repositories_dict.values():
             path = repo_dict.get('path', None)
-            self.retrieve_parameter_glossary_for_code_repository(
+            parameters_glossary = self.retrieve_parameter_glossary_for_code_repository(
                 repository_path=path)
+            if parameters_glossary is not None:
+                parameters_glossaries[path.split(sep)[-1]] = parameters_glossary
+
+        # glossaries of all the code repositories are merged at once, in the order of the code repositories
+        merged_glossaries = SoSMergedParametersGlossaries(parameters_glossaries)
+        self.add_ontology_data_to_parameters(merged_glossaries)
+        for parameter_id, conflicts in merged_glossaries.get_conflicts().items():
+            self.add_to_log(
+                category="glossaryConflicts",
+                sub_category=parameter_id,
+                message=conflicts,
+            )
 
         # write log of multiple info for a parameter, no info for parameter and
         # inconsistencies for multiple info
@@ -869,26 +1261,141 @@ class SoSCodeDataExtractor:
 
         return self.logs_dict
 
-    def add_ontology_data_to_parameters(
-            self, parameters_glossary_dict, code_repository,
-    ):
-        not_existing_parameters = []
-        for parameter_id, ontology_data in parameters_glossary_dict.items():
-            # get parameter
+    def get_checkpoint_state(self) -> dict:
+        """Entities, indexes and logs generated so far, stored in the checkpoints of the extraction phases"""
+        return {attribute: getattr(self, attribute) for attribute in CHECKPOINT_ATTRIBUTES}
+
+    def set_checkpoint_state(self, state: dict):
+        """Restore the entities, indexes and logs of a checkpoint"""
+        for attribute in CHECKPOINT_ATTRIBUTES:
+            setattr(self, attribute, state[attribute])
+
+    def scan_code_repository(self, path: str, repo_name: str | None = None) -> tuple[list, set]:
+        """
+        Scan a code repository and return the plain records of its disciplines and the code repositories
+        whose modules were imported (loaded so far in this process)
+        If the extraction cache is used, the information extracted from the files unchanged since the previous
+        scan is reused
+        """
+        print(f"Scan code repository {path}")
+        records = []
+        if self.cache_folder is not None and repo_name is not None and self.file_cache_key is not None:
+            self.file_cache = SoSFileExtractionCache(
+                self.repository_cache.get_file_cache_path(repo_name),
+                self.file_cache_key,
+                module_folders=self.repository_folders.values(),
+            )
+        try:
+            with timing_span(self.logs_dict, REPOSITORY_SPAN, repo_name or path):
+                self.generate_sos_disciplines_and_parameters(path, 0, path, records)
+            if self.file_cache is not None:
+                self.file_cache.save()
+        finally:
+            self.file_cache = None
+        return records, get_module_repositories(self.repository_folders)
+
+    def scan_code_repositories(self) -> dict:
+        """
+        Scan all code repositories, in parallel processes if max_workers > 1
+        Return for each repository name its discipline records and the logs generated during its scan
+        Repositories unchanged since their artifact was stored in the extraction cache are not scanned
+        """
+        repositories = {
+            repo_name: repo_dict
+            for repo_name, repo_dict in self.code_repositories_dict.items()
+            if repo_dict.get('path', None) is not None
+        }
+        scan_results = {}
+        cache_keys = {}
+        # code repositories whose modules were imported during the scan of each code repository
+        imported_repositories = {}
+        if self.repository_cache is not None:
+            self.file_cache_key = self.repository_cache.get_shared_key(self.code_repositories_dict)
+            for repo_name in repositories:
+                cache_keys[repo_name] = self.repository_cache.get_key(repo_name, self.code_repositories_dict)
+                cached_result = self.repository_cache.load(
+                    repo_name, cache_keys[repo_name], self.get_repositories_state(),
+                )
+                if cached_result is not None:
+                    print(f"Code repository {repo_name} extraction reused from cache")
+                    scan_results[repo_name] = cached_result
+        repositories_to_scan = {
+            repo_name: repo_dict for repo_name, repo_dict in repositories.items() if repo_name not in scan_results
+        }
+
+        max_workers = min(self.max_workers, len(repositories_to_scan))
+        if max_workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_process_pool_context()) as executor:
+                    futures = {
+                        repo_name: executor.submit(
+                            scan_code_repository_worker,
+                            self.basepath,
+                            repo_name,
+                            repo_dict,
+                            self.cache_folder,
+                            self.file_cache_key,
+                            self.repository_folders,
+                        )
+                        for repo_name, repo_dict in repositories_to_scan.items()
+                    }
+                    for repo_name, future in futures.items():
+                        try:
+                            records, repo_logs_dict, imported_repositories[repo_name] = future.result()
+                            scan_results[repo_name] = (records, repo_logs_dict)
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as ex:
+                            # records that can not be sent back from the worker (not picklable...) are scanned serially
+                            print(f"Parallel scan of code repository {repo_name} failed, it will be scanned serially: {ex}")
+            except BrokenProcessPool as ex:
+                print(f"Parallel scan of code repositories interrupted, remaining ones will be scanned serially: {ex}")
+
+        for repo_name, repo_dict in repositories_to_scan.items():
+            if repo_name not in scan_results:
+                serial_logs_dict = {}
+                serial_extractor_logs, self.logs_dict = self.logs_dict, serial_logs_dict
+                try:
+                    records, imported_repositories[repo_name] = self.scan_code_repository(repo_dict['path'], repo_name)
+                finally:
+                    self.logs_dict = serial_extractor_logs
+                scan_results[repo_name] = (records, serial_logs_dict)
+
+        if self.repository_cache is not None:
+            for repo_name in repositories_to_scan:
+                records, repo_logs_dict = scan_results[repo_name]
+                # timings are only valid for this run, they are not reused with the records
+                self.repository_cache.store(
+                    repo_name,
+                    cache_keys[repo_name],
+                    records,
+                    without_timings(repo_logs_dict),
+                    imported_repositories[repo_name],
+                    self.get_repositories_state(),
+                )
+        return scan_results
+
+    def add_ontology_data_to_parameters(self, merged_glossaries: SoSMergedParametersGlossaries):
+        """
+        Update the parameters with the merged attributes of the glossaries documenting them,
+        glossary parameters that do not exist in the code are logged for each code repository
+        """
+        known_parameter_ids = self.parameters.ids()
+        for parameter_id, ontology_data, repository_ids in merged_glossaries.get_merged_parameters(known_parameter_ids):
             parameter = self.parameters.get(parameter_id)
-            if parameter is not None:
-                parameter.updateOntologyAttributes(ontology_data)
+            parameter.updateOntologyAttributes(ontology_data)
+            for repository_id in repository_ids:
+                code_repository = self.code_repositories.get(repository_id)
                 parameter.add_code_repository(code_repository)
                 parameter.add_code_repository_attributes(
-                    code_repository=code_repository, attributesDict=ontology_data,
+                    code_repository=code_repository,
+                    attributesDict=merged_glossaries.glossaries[repository_id].attributes[parameter_id],
                 )
-            else:
-                # parameter does not exist
-                not_existing_parameters.append(parameter_id)
-        if len(not_existing_parameters) > 0:
+
+        for repository_id, not_existing_parameters in merged_glossaries.get_unknown_parameters(known_parameter_ids).items():
             self.add_to_log(
                 category="parameter_does_not_exist",
-                sub_category=code_repository.id,
+                sub_category=repository_id,
                 message=not_existing_parameters,
             )
 
@@ -898,76 +1405,94 @@ class SoSCodeDataExtractor:
         doc_folder_path = join(dirname(filepath), "documentation")
         filename = basename(filepath).split(".")[0]
         markdown_data = ""
-        if isdir(doc_folder_path):
-            # look for markdown file with extension .markdown or .md
-            markdown_list = [
-                join(doc_folder_path, md_file)
-                for md_file in listdir(doc_folder_path)
-                if (
-                        (md_file.endswith(r".markdown") or md_file.endswith(r".md"))
-                        and md_file.startswith(filename)
-                )
-            ]
+        # look for markdown file with extension .markdown or .md
+        markdown_filepath = self.documentation_index.find_markdown_file(doc_folder_path, filename)
+
+        # build file path
+        if markdown_filepath is not None and isfile(markdown_filepath):
+            documentation = self.documentation_index.documentations.get(markdown_filepath)
+            if documentation is None:
+                documentation = self.get_cached_markdown_documentation(markdown_filepath)
+            if documentation is not None:
+                return documentation
+            markdown_data = ""
+            # path and signature of the images referenced by the markdown file
+            images_signatures = {}
 
-            if len(markdown_list) > 0:
-                # build file path
-                markdown_filepath = markdown_list[0]
-
-                if isfile(markdown_filepath):
-                    markdown_data = ""
+            try:
+                with open(markdown_filepath, "r+", encoding="utf-8") as f:
+                    markdown_data = f.read()
 
-                    try:
-                        with open(markdown_filepath, "r+", encoding="utf-8") as f:
-                            markdown_data = f.read()
+                # Find file reference in markdown file
+                place_holder = "!\\[(.*)\\]\\((.*)\\)"
+                matches = re.finditer(place_holder, markdown_data)
 
-                        # Find file reference in markdown file
-                        place_holder = "!\\[(.*)\\]\\((.*)\\)"
-                        matches = re.finditer(place_holder, markdown_data)
+                images_base_64 = {}
+                base64_image_tags = []
 
-                        images_base_64 = {}
-                        base64_image_tags = []
+                for matche in matches:
+                    # Format:
+                    # (0) => full matche line
+                    # (1) => first group (place holder name)
+                    # (2) => second group (image path/name)
 
-                        for matche in matches:
-                            # Format:
-                            # (0) => full matche line
-                            # (1) => first group (place holder name)
-                            # (2) => second group (image path/name)
+                    image_name = matche.group(2)
 
-                            image_name = matche.group(2)
+                    # Convert markdown image link to link to base64
+                    # image
+                    image_filepath = join(doc_folder_path, image_name)
+                    images_signatures[image_filepath] = get_file_signature(image_filepath)
 
-                            # Convert markdown image link to link to base64
-                            # image
-                            image_filepath = join(doc_folder_path, image_name)
+                    encoded = self.documentation_index.get_encoded_image(image_filepath)
+                    if encoded is not None:
+                        images_base_64.update({image_name: encoded})
 
-                            if isfile(image_filepath):
-                                with open(image_filepath, "r+b") as image_file:
-                                    image_data = image_file.read()
-                                encoded = base64.b64encode(image_data).decode("utf-8")
+                        # first replace the matches
+                        matche_value = matche.group(1)
+                        matches_replace = f"![{matche_value}]({image_name})"
+                        matches_replace_by = f"![{matche_value}][{image_name}]"
 
-                                images_base_64.update({image_name: encoded})
+                        base64_image_tag = f"[{image_name}]:data:image/png;base64,{images_base_64[image_name]}"
+                        base64_image_tags.append(base64_image_tag)
 
-                                # first replace the matches
-                                matche_value = matche.group(1)
-                                matches_replace = f"![{matche_value}]({image_name})"
-                                matches_replace_by = f"![{matche_value}][{image_name}]"
+                        markdown_data = markdown_data.replace(
+                            matches_replace, matches_replace_by,
+                        )
 
-                                base64_image_tag = f"[{image_name}]:data:image/png;base64,{images_base_64[image_name]}"
-                                base64_image_tags.append(base64_image_tag)
+                for image_tag in base64_image_tags:
+                    markdown_data = f"{markdown_data}\n\n{image_tag}"
 
-                                markdown_data = markdown_data.replace(
-                                    matches_replace, matches_replace_by,
-                                )
+                self.documentation_index.documentations[markdown_filepath] = markdown_data
+                if self.file_cache is not None:
+                    self.file_cache.get_entry(markdown_filepath)['documentation'] = (
+                        markdown_data, images_signatures,
+                    )
 
-                        for image_tag in base64_image_tags:
-                            markdown_data = f"{markdown_data}\n\n{image_tag}"
+            except Exception as ex:
+                self.add_to_log(
+                    category="errors",
+                    sub_category="documentation",
+                    message=f'Impossible to retrive documentation for {abspath(markdown_filepath).replace(self.basepath, "")}',
+                    exception=ex,
+                )
+        return markdown_data
 
-                    except Exception as ex:
-                        self.add_to_log(
-                            category="errors",
-                            sub_category="documentation",
-                            message=f'Impossible to retrive documentation for {abspath(markdown_filepath).replace(self.basepath, "")}',
-                            exception=ex,
-                        )
+    def get_cached_markdown_documentation(self, markdown_filepath: str) -> str | None:
+        """
+        Return the documentation rendered from markdown_filepath during the previous extraction,
+        None if the markdown file or one of its images changed since
+        """
+        if self.file_cache is None:
+            return None
+        stored_documentation = self.file_cache.get_entry(markdown_filepath).get('documentation')
+        if stored_documentation is None:
+            return None
+        markdown_data, images_signatures = stored_documentation
+        if any(
+            get_file_signature(image_filepath) != signature for image_filepath, signature in images_signatures.items()
+        ):
+            return None
+        self.documentation_index.documentations[markdown_filepath] = markdown_data
         return markdown_data
 
     def generate_usecase(self, reference_path, process_entity):
@@ -975,12 +1500,10 @@ class SoSCodeDataExtractor:
         new_usecase = None
         usecase_id = f"{reference_path}"
         try:
-            ref_module = import_module(reference_path.replace(".py", ""))
-            loaded_ref = getattr(ref_module, "Study")()
-            # configure usecase
-            loaded_ref.load_data()
-            loaded_ref.execution_engine.configure()
-            usecase_name = loaded_ref.study_name
+            usecase_configuration = self.get_usecase_configuration(reference_path, process_entity)
+            if usecase_configuration is None:
+                return new_usecase, couplings_list
+            usecase_name = usecase_configuration['study_name']
             usecase_id = f"{process_entity.process_module_path}.{usecase_name}"
 
             #  add run_usecase ?
@@ -989,16 +1512,13 @@ class SoSCodeDataExtractor:
                 label=usecase_name,
                 description="",
                 process=process_entity,
-                run_usecase=loaded_ref.run_usecase,
+                run_usecase=usecase_configuration['run_usecase'],
             )
             self.usecases.add(new_usecase)
             process_entity.add_usecase(new_usecase)
 
-            disciplinesDict = loaded_ref.ee.dm.convert_disciplines_dict_with_full_name()
-            # couplings_dict = loaded_ref.ee.root_process.export_couplings().to_dict(orient='index')
-            couplings_list = (
-                loaded_ref.ee.root_process.coupling_structure.graph.get_disciplines_couplings()
-            )
+            disciplinesDict = usecase_configuration['disciplines']
+            couplings_list = usecase_configuration['couplings']
 
             # add disciplines
             if disciplinesDict != {}:
@@ -1013,15 +1533,13 @@ class SoSCodeDataExtractor:
                             # add parameters
                             # IN
                             self.generate_parameters(
-                                param_dict=discipline["reference"].get_data_in(
-                                ),
+                                param_dict=discipline["data_in"],
                                 io="input",
                                 discipline_entity=disc_entity,
                             )
                             # OUT
                             self.generate_parameters(
-                                param_dict=discipline["reference"].get_data_out(
-                                ),
+                                param_dict=discipline["data_out"],
                                 io="output",
                                 discipline_entity=disc_entity,
                             )
@@ -1046,11 +1564,161 @@ class SoSCodeDataExtractor:
             )
         return new_usecase, couplings_list
 
+    def get_usecase_configuration(self, reference_path, process_entity) -> dict | None:
+        """
+        Return the configuration of a usecase, from its isolated process if it was configured in one,
+        otherwise by configuring it in this process
+        Exceptions raised during the configuration are raised again, None is returned if the isolated process
+        was stopped (timeout, memory limit) or crashed
+        """
+        outcome = self.usecase_configurations.pop(reference_path, None)
+        if outcome is None or outcome[0] == TASK_NOT_SERIALIZABLE:
+            with timing_span(self.logs_dict, USECASE_SPAN, reference_path):
+                outcome = (TASK_SUCCEEDED, configure_usecase(reference_path, self.repository_folders))
+        status, result = outcome
+        if status == TASK_SUCCEEDED:
+            self.store_configuration(reference_path, process_entity.repository.code_repository.id, result)
+            return result
+        if status == TASK_FAILED:
+            raise result
+        print(f"Configuration of usecase {reference_path} stopped: {status}")
+        self.add_to_log(
+            category="usecaseConfiguration",
+            sub_category=status,
+            message=f'{reference_path}',
+            exception=result,
+        )
+        return None
+
+    def get_scanned_processes(self, processes_dict: dict) -> list[tuple[str, str]]:
+        """(process repository id, process) of the processes of the scanned code repositories"""
+        scanned_processes = []
+        for process_repo_id, processIdList in processes_dict.items():
+            try:
+                self.get_code_repository_name(process_repo_id)
+            except Exception:
+                # the error is logged when the process repository is generated
+                continue
+            scanned_processes.extend((process_repo_id, process) for process in processIdList)
+        return scanned_processes
+
+    def get_isolated_runner(self, timeout: float | None) -> SoSIsolatedRunner:
+        return SoSIsolatedRunner(
+            max_workers=self.max_workers,
+            timeout=timeout,
+            memory_limit=self.usecase_memory_limit * 1024 * 1024 if self.usecase_memory_limit is not None else None,
+            mp_context=get_process_pool_context(),
+        )
+
+    def get_repositories_state(self) -> dict:
+        """Commit of each code repository, None if it has local modifications"""
+        if self.repositories_state is None:
+            self.repositories_state = {
+                repo_name: repo_dict.get('commit') if is_git_repository_clean(repo_dict['path']) else None
+                for repo_name, repo_dict in self.code_repositories_dict.items()
+                if repo_dict.get('path', None) is not None
+            }
+        return self.repositories_state
+
+    def store_configuration(self, configuration_id: str, code_repo_name: str, configuration: dict):
+        """
+        Store a process or usecase configuration, keyed by the commits of the code repository of the process,
+        of the code repositories whose modules were loaded by the configuration and of the shared repositories
+        """
+        if self.configuration_cache is None or configuration_id in self.cached_configuration_ids:
+            return
+        repo_names = {code_repo_name, *configuration['imported_repositories']}
+        repo_names.update(
+            repo_name for repo_name in self.repository_cache.shared_repositories
+            if repo_name in self.code_repositories_dict
+        )
+        self.configuration_cache.store(configuration_id, repo_names, self.get_repositories_state(), configuration)
+
+    def run_configuration_tasks(self, tasks: dict, timeout: float | None, entity_name: str, span_type: str) -> dict:
+        """
+        Outcomes of the configuration tasks {id: (function, args)}, configurations stored in the cache are reused
+        and the other tasks are run in isolated processes if max_workers > 1
+        The duration of each task run in an isolated process is recorded as a span_type timing span
+        """
+        outcomes = {}
+        if self.configuration_cache is not None:
+            for configuration_id in tasks:
+                cached_configuration = self.configuration_cache.load(configuration_id, self.get_repositories_state())
+                if cached_configuration is not None:
+                    outcomes[configuration_id] = (TASK_SUCCEEDED, cached_configuration)
+                    self.cached_configuration_ids.add(configuration_id)
+            print(f"{len(outcomes)} {entity_name} configurations reused from cache")
+
+        tasks_to_run = {
+            configuration_id: task for configuration_id, task in tasks.items() if configuration_id not in outcomes
+        }
+        if self.max_workers > 1 and len(tasks_to_run) > 0:
+            print(
+                f"Configure {len(tasks_to_run)} {entity_name} in {min(self.max_workers, len(tasks_to_run))} isolated processes",
+            )
+            runner = self.get_isolated_runner(timeout)
+            outcomes.update(runner.run(tasks_to_run))
+            for configuration_id, duration in runner.durations.items():
+                add_timing(self.logs_dict, span_type, configuration_id, duration)
+        return outcomes
+
+    def configure_processes(self, processes_dict: dict):
+        """
+        Configure in isolated processes the processes of the scanned code repositories,
+        their outcomes are used afterwards by generate_process
+        """
+        if self.max_workers <= 1 and self.configuration_cache is None:
+            return
+        tasks = {
+            f"{process_repo_id}.{process}": (configure_process, (process_repo_id, process, self.repository_folders))
+            for process_repo_id, process in self.get_scanned_processes(processes_dict)
+        }
+        self.process_configurations = self.run_configuration_tasks(
+            tasks, self.process_timeout, 'processes', PROCESS_SPAN,
+        )
+
+    def configure_usecases(self, processes_dict: dict):
+        """
+        Configure in isolated processes the usecases of the processes of the scanned code repositories,
+        their outcomes are used afterwards by generate_usecase
+        """
+        if self.max_workers <= 1 and self.configuration_cache is None:
+            return
+        tasks = {}
+        for process_repo_id, process in self.get_scanned_processes(processes_dict):
+            try:
+                process_path = find_spec(f"{process_repo_id}.{process}.process").origin
+            except Exception:
+                continue
+            for usecase_id in self.get_usecase_reference_paths(process_repo_id, process, process_path):
+                tasks[usecase_id] = (configure_usecase, (usecase_id, self.repository_folders))
+
+        self.usecase_configurations = self.run_configuration_tasks(
+            tasks, self.usecase_timeout, 'usecases', USECASE_SPAN,
+        )
+
+    def get_usecase_reference_paths(self, process_repo_id, process, process_path) -> list[str]:
+        """Usecase ids of a process, from the usecase files next to its process.py"""
+        # construct usecases folder path
+        folder_path = dirname(process_path)
+        # match pattern to retrieve usecase files
+        pattern = re.compile(r"^usecase.*\.py")
+        return [
+            f"{process_repo_id}.{process}.{f}"
+            for f in listdir(folder_path)
+            if (
+                f != "__init__.py"
+                and f != "process.py"
+                and f != "__pycache__"
+            ) and pattern.match(f)
+        ]
+
     def generate_couplings(self, couplings_list: dict, usecase):
 
+        # couplings as (module of discipline from, module of discipline to, coupled parameters)
         for coupling in couplings_list:
-            disc_from = self.sos_disciplines.get(coupling[0].__module__)
-            disc_to = self.sos_disciplines.get(coupling[1].__module__)
+            disc_from = self.sos_disciplines.get(coupling[0])
+            disc_to = self.sos_disciplines.get(coupling[1])
             if disc_from is not None and disc_to is not None:
                 for coupling_param in coupling[2]:
                     param_name = coupling_param.split(".")[-1]
@@ -1097,16 +1765,6 @@ class SoSCodeDataExtractor:
         :param previous_code_repo_dict: code_repo_dict from previous extraction
         :type previous_code_repo_dict: dict
         """
-        # Regular expression to remove connection info from url when token is
-        # used
-        INFO_REGEXP = '://.*@'
-        INFO_REPLACE = '://'
-
-        # Regular expression when it is a remote repostory with ssh
-        SSH_REGEX =  r'^[a-zA-Z]+@[a-zA-Z0-9.-]+:'
-        SSH_REGEX_TO_REPLACE = r'^.*@'
-        SSH_REGEX_REPLACE = 'https://'
-
         BRANCH = 'branch'
         COMMIT = 'commit'
         URL = 'url'
@@ -1121,114 +1779,74 @@ class SoSCodeDataExtractor:
         if python_path_libraries is not None and len(python_path_libraries) > 0:
 
             # Set to list each library of the PYTHONPATH
-            libraries = python_path_libraries.split(pathsep)
-
-            for library_path in libraries:
+            libraries = [
+                library_path
+                for library_path in python_path_libraries.split(pathsep)
                 if isdir(library_path) and all(
-                    [
-                        exclude not in library_path
-                        for exclude in self.path_exclusion_list
-                    ],
-                ):
-                    try:
-                        repo = git.Repo(
-                            path=library_path,
-                            search_parent_directories=True,
-                        )
-
-                        # there is an url
-                        if len(repo.remotes) > 0:
-                            # Retrieve url and remove connection info from it
-                            raw_url = repo.remotes.origin.url
-                            url = re.sub(INFO_REGEXP, INFO_REPLACE, raw_url)
-                            try:
-                                repo_name = url.split(".git")[0].split("/")[-1]
-                            except:
-                                print(
-                                    f"Impossible to retrieve repo name from url {url}",
-                                )
-                                repo_name = url
-                        else:
-                            url = ""
-                            repo_name = basename(library_path)
-                        if repo.head.is_detached:
-                            branch_name = "detached"
-                            commit = repo.head.commit
-                            # get tag version (format v0.0.0)
-                            tags = [
-                                tag.name
-                                for tag in repo.tags
-                                if tag.name.startswith("v") and tag.commit == commit
-                            ]
-                            if len(tags) > 0:
-
-                                def convert_version(version: str) -> list[int]:
-                                    return [
-                                        int(part)
-                                        for part in version.strip("v").split(".")
-                                    ]
-
-                                # sort versions
-                                sorted_tags = sorted(tags, key=convert_version)
-
-                                branch_name = sorted_tags[-1]
-                        else:
-                            branch_name = repo.active_branch.name
-                            commit = repo.active_branch.commit
-                        commited_date = datetime.fromtimestamp(
-                            commit.committed_date,
-                            UTC,
-                        )
+                    exclude not in library_path
+                    for exclude in self.path_exclusion_list
+                )
+            ]
+            if len(libraries) == 0:
+                return code_repo_dict
+
+            # git metadata of the libraries are read concurrently, then handled in the PYTHONPATH order
+            with ThreadPoolExecutor(max_workers=min(GIT_METADATA_MAX_WORKERS, len(libraries))) as executor:
+                futures = [
+                    executor.submit(get_git_repository_metadata, library_path)
+                    for library_path in libraries
+                ]
 
-                        if previous_code_repo_dict.get(repo_name, {}) != {}:
-                            previous_commit_hexsha = previous_code_repo_dict[
-                                repo_name
-                            ].get(COMMIT, "")
-                            if previous_commit_hexsha == commit.hexsha:
-                                print(
-                                    f"Code Repository {repo_name} has not been updated since last Ontology update.",
-                                )
+            for library_path, future in zip(libraries, futures):
+                try:
+                    repo_metadata = future.result()
+                except git.exc.InvalidGitRepositoryError:  # type: ignore
+                    logger.error(f"{library_path} folder is not a git folder")
+                    continue
+                except Exception as error:
+                    logger.error(
+                        f"{library_path} folder generates the following error while accessing with git:\n {error!s}",
+                    )
+                    continue
 
-                        # Remove trailing .git
-                        if url.endswith(".git"):
-                            url = url[:-4]
-                        # Verify if we are dealing with ssh remote repository and replace by https://
-                        if bool(re.match(SSH_REGEX, url)):
-                            url = url.replace(":", "/")
-                            url = re.sub(SSH_REGEX_TO_REPLACE, SSH_REGEX_REPLACE, url)
-                        code_repo_dict[repo_name] = {
-                            URL: url,
-                            BRANCH: branch_name,
-                            COMMIT: commit.hexsha,
-                            COMMITTED_DATE: commited_date.strftime(
-                                "%d/%m/%Y %H:%M:%S",
-                            ),
-                            REPO_PATH: str(
-                                Path(library_path),
-                            ),  # Allow to mixed / and \ on windows path of PYTHONPATH. Nothing Change for linux
-                        }
-
-                    except git.exc.InvalidGitRepositoryError:  # type: ignore
-                        logger.error(f"{library_path} folder is not a git folder")
-                    except Exception as error:
-                        logger.error(
-                            f"{library_path} folder generates the following error while accessing with git:\n {error!s}",
+                repo_name = repo_metadata['name']
+                if previous_code_repo_dict.get(repo_name, {}) != {}:
+                    previous_commit_hexsha = previous_code_repo_dict[
+                        repo_name
+                    ].get(COMMIT, "")
+                    if previous_commit_hexsha == repo_metadata['commit']:
+                        print(
+                            f"Code Repository {repo_name} has not been updated since last Ontology update.",
                         )
 
+                code_repo_dict[repo_name] = {
+                    URL: repo_metadata['url'],
+                    BRANCH: repo_metadata['branch'],
+                    COMMIT: repo_metadata['commit'],
+                    COMMITTED_DATE: repo_metadata['committed_date'],
+                    REPO_PATH: str(
+                        Path(library_path),
+                    ),  # Allow to mixed / and \ on windows path of PYTHONPATH. Nothing Change for linux
+                }
+
         return code_repo_dict
 
+    def get_code_repository_name(self, from_process_repo_id: str) -> str:
+        """Name of the code repository containing a process repository, raise an exception if there is none"""
+        process_repo_path = dirname(
+            import_module(from_process_repo_id).__file__)
+        code_repo_path = None
+        for repo_dict in self.code_repositories_dict.values():
+            path = repo_dict.get('path', None)
+            if path in process_repo_path:
+                code_repo_path = path
+                break
+        return code_repo_path.split(sep)[-1]
+
     def get_code_repository_entity(self, from_process_repo_id: str) -> CodeRepository:
         code_repo_entity = None
         try:
-            process_repo_path = dirname(
-                import_module(from_process_repo_id).__file__)
-            code_repo_path = None
-            for repo_dict in self.code_repositories_dict.values():
-                path = repo_dict.get('path', None)
-                if path in process_repo_path:
-                    code_repo_path = path
-                    break
-            repo_name = code_repo_path.split(sep)[-1]
+            repo_name = self.get_code_repository_name(from_process_repo_id)
             code_repo_entity = self.code_repositories.get(repo_name)
         except:
             print(
@@ -1240,26 +1858,21 @@ class SoSCodeDataExtractor:
             )
         return code_repo_entity
 
-    def retrieve_parameter_glossary_for_code_repository(self, repository_path: str):
+    def retrieve_parameter_glossary_for_code_repository(self, repository_path: str) -> SoSParametersGlossary | None:
+        """
+        Return the parameters glossary of a code repository, None if it does not exist or can not be read
+        The parsed glossary is reused from the cache while the content of the file does not change
+        """
         repo_id = repository_path.split(sep)[-1]
         try:
             parameter_glossary_path = join(
-                repository_path, "parameters_glossary.csv")
+                repository_path, PARAMETERS_GLOSSARY_FILE_NAME)
             if isfile(parameter_glossary_path):
-                parameters_glossary_df = pd.read_csv(
-                    parameter_glossary_path,
-                    na_filter=False,
-                    encoding="utf-8",
-                    encoding_errors="ignore",
-                    keep_default_na=False,
-                )
-                duplicated = parameters_glossary_df.duplicated(
-                    subset=['id'], keep='first',
-                )
-                if any(duplicated.values.tolist()):
-                    duplicated_list = parameters_glossary_df.loc[
-                        duplicated, 'id',
-                    ].values.tolist()
+                if self.code_repositories.get(repo_id) is None:
+                    raise ValueError(f"{repo_id} is not a scanned code repository")
+                parameters_glossary = self.load_parameters_glossary(repo_id, parameter_glossary_path)
+                duplicated_list = parameters_glossary.duplicated_ids
+                if len(duplicated_list) > 0:
                     print(
                         f'There are {len(duplicated_list)} duplicated parameters in the glossary: {", ".join(duplicated_list)}, they will be ignored',
                     )
@@ -1268,26 +1881,15 @@ class SoSCodeDataExtractor:
                         sub_category="duplicateParametersGlossary",
                         message={repo_id: duplicated_list},
                     )
-                    parameters_glossary_df = parameters_glossary_df.drop_duplicates(
-                        subset=['id'], keep='first',
-                    )
+                return parameters_glossary
 
-                parameters_glossary_df = parameters_glossary_df.set_index('id')
-                parameters_glossary_dict = parameters_glossary_df.to_dict(
-                    "index")
-
-                code_repo_entity = self.code_repositories.get(repo_id)
-                self.add_ontology_data_to_parameters(
-                    parameters_glossary_dict, code_repo_entity,
-                )
-            else:
-                print(f"Parameters glossary does not exist for repo {repo_id}")
-                self.add_to_log(
-                    category="errors",
-                    sub_category="parameterGlossary",
-                    message=f"Parameters glossary does not exist for repo {repo_id}",
-                    exception=None,
-                )
+            print(f"Parameters glossary does not exist for repo {repo_id}")
+            self.add_to_log(
+                category="errors",
+                sub_category="parameterGlossary",
+                message=f"Parameters glossary does not exist for repo {repo_id}",
+                exception=None,
+            )
         except Exception as ex:
             print(
                 f"Impossible to retrieve parameter glossary for repo {repo_id}")
@@ -1297,54 +1899,34 @@ class SoSCodeDataExtractor:
                 message=f"Impossible to retrieve parameter glossary for repo {repo_id}",
                 exception=ex,
             )
+        return None
+
+    def load_parameters_glossary(self, repo_id: str, parameter_glossary_path: str) -> SoSParametersGlossary:
+        if self.glossary_cache is None:
+            return read_parameters_glossary(parameter_glossary_path)
+        file_hash = get_file_hash(parameter_glossary_path)
+        parameters_glossary = self.glossary_cache.load(repo_id, file_hash)
+        if parameters_glossary is None:
+            parameters_glossary = read_parameters_glossary(parameter_glossary_path)
+            self.glossary_cache.store(repo_id, file_hash, parameters_glossary)
+        return parameters_glossary
 
     def generate_full_extraction_logs(self):
         no_parameter_info = {}
-        for parameter in self.parameters.sos_entity_dict.values():
+        for parameter in self.parameters.values():
             if len(parameter.code_repositories) > 1:
                 self.add_to_log(
                     category="multiple_parameters_info",
                     sub_category=parameter.id,
                     message=[repo.id for repo in parameter.code_repositories],
                 )
+                glossary_attributes = parameter.code_repositories_attributes
+            else:
+                glossary_attributes = None
+                if len(parameter.code_repositories) == 0:
+                    no_parameter_info[parameter.id] = None
 
-            elif len(parameter.code_repositories) == 0:
-                parameter_code_repositories = [
-                    instance.sos_discipline.repository.label
-                    for instance in parameter.instances_list
-                ]
-                parameter_code_repositories = list(
-                    set(parameter_code_repositories))
-                no_parameter_info[parameter.id] = parameter_code_repositories
-
-            datatypeDict = {}
-            unitDict = {}
-            for parameter_usage in parameter.instances_list:
-                unitDict.setdefault(parameter_usage.unit, [])
-                unitDict[parameter_usage.unit].append(
-                    ('discipline', parameter_usage.sos_discipline.id),
-                )
-
-                datatypeDict.setdefault(parameter_usage.datatype, [])
-                datatypeDict[parameter_usage.datatype].append(
-                    ('discipline', parameter_usage.sos_discipline.id),
-                )
-
-            if len(parameter.code_repositories) > 1:
-                for repo, attributes in parameter.code_repositories_attributes.items():
-                    unitDict.setdefault(attributes['unit'], [])
-                    unitDict[attributes['unit']].append(('glossary', repo))
-
-                    datatypeDict.setdefault(attributes['datatype'], [])
-                    datatypeDict[attributes['datatype']].append(
-                        ('glossary', repo))
-
-            message = {}
-            if len(unitDict.keys()) > 1:
-                message['unit'] = unitDict
-            if len(datatypeDict.keys()) > 1:
-                message['datatype'] = datatypeDict
-
+            message = self.extraction_index.get_inconsistencies(parameter.id, glossary_attributes)
             if message != {}:
                 self.add_to_log(
                     category="inconsistencies",
@@ -1352,35 +1934,14 @@ class SoSCodeDataExtractor:
                     message=message,
                 )
 
-        if no_parameter_info != {}:
-            # transform dictionnary from
-            # {parameter:[code_repository_list]} to
-            # {code_repository:[parameter_list]}
-
-            code_repo_list = list(
-                set(
-                    [
-                        repo_name
-                        for repo_list in no_parameter_info.values()
-                        for repo_name in repo_list
-                    ],
-                ),
+        # parameters missing in the glossaries grouped by the code repositories using them
+        param_by_code_repo_dict = self.extraction_index.get_parameters_by_repository(no_parameter_info)
+        for code_repo, param_list in param_by_code_repo_dict.items():
+            self.add_to_log(
+                category="no_parameter_info",
+                sub_category=code_repo,
+                message=param_list,
             )
-            param_by_code_repo_dict = {
-                code_repo: [
-                    p
-                    for p, repo_list in no_parameter_info.items()
-                    if code_repo in repo_list
-                ]
-                for code_repo in code_repo_list
-            }
-            if len(param_by_code_repo_dict.keys()) > 0:
-                for code_repo, param_list in param_by_code_repo_dict.items():
-                    self.add_to_log(
-                        category="no_parameter_info",
-                        sub_category=code_repo,
-                        message=param_list,
-                    )
 
         self.add_to_log(
             category="synthesis",
@@ -0,0 +1,86 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+from os import listdir
+from os.path import isdir, isfile, join
+
+'''
+Index of the documentation folders of the disciplines and processes, built once per extraction.
+Each documentation folder is listed once and each image is read and base64 encoded once.
+'''
+
+MARKDOWN_EXTENSIONS = (".markdown", ".md")
+
+
+def get_file_signature(file_path: str) -> tuple[int, int] | None:
+    """Modification time and size of a file, None if it does not exist"""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+class SoSDocumentationIndex:
+    """Markdown files of each documentation folder and base64 encoded images"""
+
+    def __init__(self) -> None:
+        # markdown file names of each documentation folder, in listdir order
+        self.markdown_files = {}
+        # base64 encoded image by image path, None if the image does not exist
+        self.encoded_images = {}
+        # base64 encoded image by content digest, identical images share the same string
+        self.encoded_images_by_digest = {}
+        # rendered documentation by markdown file path
+        self.documentations = {}
+
+    def get_markdown_files(self, doc_folder_path: str) -> list[str]:
+        """Return the markdown file names of a documentation folder, empty if it does not exist"""
+        markdown_files = self.markdown_files.get(doc_folder_path)
+        if markdown_files is None:
+            markdown_files = []
+            if isdir(doc_folder_path):
+                markdown_files = [
+                    md_file for md_file in listdir(doc_folder_path) if md_file.endswith(MARKDOWN_EXTENSIONS)
+                ]
+            self.markdown_files[doc_folder_path] = markdown_files
+        return markdown_files
+
+    def find_markdown_file(self, doc_folder_path: str, filename: str) -> str | None:
+        """Return the path of the first markdown file of the folder whose name starts with filename"""
+        for md_file in self.get_markdown_files(doc_folder_path):
+            if md_file.startswith(filename):
+                return join(doc_folder_path, md_file)
+        return None
+
+    def get_encoded_image(self, image_filepath: str) -> str | None:
+        """Return the base64 content of an image, None if it does not exist"""
+        if image_filepath not in self.encoded_images:
+            encoded = None
+            if isfile(image_filepath):
+                with open(image_filepath, "r+b") as image_file:
+                    image_data = image_file.read()
+                digest = hashlib.sha256(image_data).hexdigest()
+                encoded = self.encoded_images_by_digest.get(digest)
+                if encoded is None:
+                    encoded = base64.b64encode(image_data).decode("utf-8")
+                    self.encoded_images_by_digest[digest] = encoded
+            self.encoded_images[image_filepath] = encoded
+        return self.encoded_images[image_filepath]
@@ -1,5 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
+Modifications on 2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -18,17 +19,30 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class CodeRepository(SoSEntity):
+    __slots__ = (
+        'branch',
+        'commit',
+        'committed_date',
+        'process_repositories_ids',
+        'process_repositories_list',
+        'process_repositories_set',
+        'url',
+    )
+
     def __init__(self, id: str, label: str) -> None:
         super().__init__(id, label)
         self.process_repositories_list = []
         self.process_repositories_ids = []
+        # process repositories already added, to check the membership without walking the list
+        self.process_repositories_set = set()
         self.branch = None
         self.commit = None
         self.committed_date = None
         self.url = None
 
     def add_process_repository(self, process_repository) -> None:
-        if process_repository not in self.process_repositories_list:
+        if process_repository not in self.process_repositories_set:
+            self.process_repositories_set.add(process_repository)
             self.process_repositories_list.append(process_repository)
             self.process_repositories_ids.append(process_repository.id)
 
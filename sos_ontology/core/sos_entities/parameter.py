@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 12/02/2025 Copyright 2025 Capgemini
+Modifications on 12/02/2025-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -15,10 +15,30 @@ See the License for the specific language governing permissions and
 limitations under the License.
 '''
 
-from sos_ontology.core.sos_entities.sos_entity import SoSEntity
+from sos_ontology.core.sos_entities.sos_entity import (
+    INTERNED_ATTRIBUTES,
+    SoSEntity,
+    intern_string,
+)
 
 
 class Parameter(SoSEntity):
+    __slots__ = (
+        'ACLTag',
+        'code_repositories',
+        'code_repositories_attributes',
+        'code_repositories_set',
+        'datatype',
+        'datatype_list',
+        'definition',
+        'definitionSource',
+        'disciplinesUsingParameterIDs',
+        'instances_list',
+        'instances_set',
+        'unit',
+        'unit_list',
+    )
+
     def __init__(self, id: str, label: str, attributesDict: dict) -> None:
         super().__init__(id, label)
         self.unit = None
@@ -32,8 +52,13 @@ class Parameter(SoSEntity):
         self.code_repositories = []
         self.code_repositories_attributes = {}
         self.disciplinesUsingParameterIDs = []
+        # usages and code repositories already added, to check the membership without walking the lists
+        self.instances_set = set()
+        self.code_repositories_set = set()
 
         for key, value in attributesDict.items():
+            if key in INTERNED_ATTRIBUTES:
+                value = intern_string(value)
             if key == 'unit':
                 self.unit = value
             if key == 'definition':
@@ -46,7 +71,8 @@ class Parameter(SoSEntity):
                 self.ACLTag = value
 
     def add_usage(self, usage) -> None:
-        if usage not in self.instances_list:
+        if usage not in self.instances_set:
+            self.instances_set.add(usage)
             self.instances_list.append(usage)
 
     def add_unit(self, usage) -> None:
@@ -58,22 +84,23 @@ class Parameter(SoSEntity):
                 self.datatype_list.append(usage.datatype)
 
     def add_disciplineUsingParameter(self, disciplineID) -> None:
-        if disciplineID not in self.instances_list:
-            self.disciplinesUsingParameterIDs.append(disciplineID)
+        # instances_list holds usages, never ids, the discipline id of each usage is appended
+        self.disciplinesUsingParameterIDs.append(disciplineID)
 
     def add_code_repository(self, code_repository) -> None:
-        if code_repository not in self.code_repositories:
+        if code_repository not in self.code_repositories_set:
+            self.code_repositories_set.add(code_repository)
             self.code_repositories.append(code_repository)
 
     def add_code_repository_attributes(self, code_repository, attributesDict) -> None:
-        if code_repository not in self.code_repositories:
+        if code_repository not in self.code_repositories_set:
             self.code_repositories_attributes[code_repository.id] = attributesDict
 
     def updateOntologyAttributes(self, attributesDict):
         for key, value in attributesDict.items():
             if value is not None:
                 if key == 'unit' and self.unit != value:
-                    self.unit = value
+                    self.unit = intern_string(value)
                 if key == 'definition' and self.definition != value:
                     self.definition = value
                 if key == 'definitionSource' and self.definitionSource != value:
@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -18,10 +18,36 @@ limitations under the License.
 from numpy import array_equal
 
 from sos_ontology.core.sos_entities.parameter import Parameter
-from sos_ontology.core.sos_entities.sos_entity import SoSEntity
+from sos_ontology.core.sos_entities.sos_entity import (
+    INTERNED_ATTRIBUTES,
+    SoSEntity,
+    intern_string,
+)
 
 
 class ParameterUsage(SoSEntity):
+    __slots__ = (
+        'coupling',
+        'dataframeDescriptor',
+        'dataframeEditionLocked',
+        'datatype',
+        'defaultValue',
+        'editable',
+        'instanceOf',
+        'io_type',
+        'namespace',
+        'numerical',
+        'optional',
+        'possibleValues',
+        'range',
+        'sos_discipline',
+        'structuring',
+        'subtypeDescriptor',
+        'unit',
+        'userLevel',
+        'visibility',
+    )
+
     def __init__(
         self,
         id: str,
@@ -51,6 +77,8 @@ class ParameterUsage(SoSEntity):
         self.sos_discipline = sos_discipline
         self.instanceOf = parameter
         for key, value in attributesDict.items():
+            if key in INTERNED_ATTRIBUTES:
+                value = intern_string(value)
             if key == 'visibility':
                 self.visibility = value
             if key == 'default':
@@ -93,6 +121,8 @@ class ParameterUsage(SoSEntity):
             if value is not None and (
                 isinstance(value, str) and value != '' and value != ' '
             ):
+                if key in INTERNED_ATTRIBUTES:
+                    value = intern_string(value)
                 if key == 'visibility' and self.visibility != value:
                     self.visibility = value
                 if (
@@ -1,5 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
+Modifications on 2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -18,6 +19,14 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class SoSCoupling(SoSEntity):
+    __slots__ = (
+        'disciplineFrom',
+        'disciplineTo',
+        'parameterUsageIn',
+        'parameterUsageOut',
+        'usecase',
+    )
+
     def __init__(
         self,
         id: str,
@@ -1,5 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
+Modifications on 2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -18,6 +19,29 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class SoSDiscipline(SoSEntity):
+    __slots__ = (
+        'category',
+        'definition',
+        'documentation',
+        'icon',
+        'inputParameterUsagesIds',
+        'inputParameterUsagesIdsSet',
+        'inputParameterUsagesList',
+        'last_modification_date',
+        'outputParameterUsagesIds',
+        'outputParameterUsagesIdsSet',
+        'outputParameterUsagesList',
+        'pythonClass',
+        'pythonClassInheritance',
+        'pythonModulePath',
+        'repository',
+        'source',
+        'type',
+        'validated',
+        'validated_by',
+        'version',
+    )
+
     def __init__(
         self,
         id: str,
@@ -59,23 +83,18 @@ class SoSDiscipline(SoSEntity):
         self.outputParameterUsagesList = []
         self.outputParameterUsagesIds = []
         self.inputParameterUsagesIds = []
+        # ids of the parameter usages, to check the membership without walking the lists
+        self.inputParameterUsagesIdsSet = set()
+        self.outputParameterUsagesIdsSet = set()
 
     def add_input_parameter_usage(self, parameter_usage):
-        trouve = False
-        if parameter_usage is not None:
-            for param in self.inputParameterUsagesList:
-                if param.id == parameter_usage.id:
-                    trouve = True
-            if not trouve:
-                self.inputParameterUsagesList.append(parameter_usage)
-                self.inputParameterUsagesIds.append(parameter_usage.id)
+        if parameter_usage is not None and parameter_usage.id not in self.inputParameterUsagesIdsSet:
+            self.inputParameterUsagesIdsSet.add(parameter_usage.id)
+            self.inputParameterUsagesList.append(parameter_usage)
+            self.inputParameterUsagesIds.append(parameter_usage.id)
 
     def add_output_parameter_usage(self, parameter_usage):
-        trouve = False
-        if parameter_usage is not None:
-            for param in self.outputParameterUsagesList:
-                if param.id == parameter_usage.id:
-                    trouve = True
-            if not trouve:
-                self.outputParameterUsagesList.append(parameter_usage)
-                self.outputParameterUsagesIds.append(parameter_usage.id)
+        if parameter_usage is not None and parameter_usage.id not in self.outputParameterUsagesIdsSet:
+            self.outputParameterUsagesIdsSet.add(parameter_usage.id)
+            self.outputParameterUsagesList.append(parameter_usage)
+            self.outputParameterUsagesIds.append(parameter_usage.id)
@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/07/30 Copyright 2024 Capgemini
+Modifications on 2024/07/30-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -14,24 +14,60 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 '''
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, KeysView, ValuesView
+
+# descriptor attributes whose values are repeated across parameters and usages, their strings are interned
+INTERNED_ATTRIBUTES = frozenset(('unit', 'type', 'visibility', 'namespace', 'user_level', 'io_type'))
+
+
+def intern_string(value):
+    """Return the interned string so that equal values share the same object, other values are returned as is"""
+    return sys.intern(value) if type(value) is str else value
 
 
 class SoSEntity:
+    # entities are created by hundreds of thousands during the extraction, __slots__ keeps them compact
+    __slots__ = ('id', 'label')
+
     def __init__(self, id: str, label: str) -> None:
         self.id = id
         self.label = label
 
 
-class SoSEntityDict:
+EntityT = TypeVar('EntityT', bound=SoSEntity)
+
+
+class SoSEntityDict(Generic[EntityT]):
+    __slots__ = ('sos_entity_dict',)
+
     def __init__(self) -> None:
-        self.sos_entity_dict = {}
+        self.sos_entity_dict: dict[str, EntityT] = {}
 
-    def add(self, entity) -> None:
+    def add(self, entity: EntityT) -> None:
         if entity.id not in self.sos_entity_dict:
             self.sos_entity_dict[entity.id] = entity
 
-    def get(self, id: str):
+    def get(self, id: str) -> EntityT | None:
         return self.sos_entity_dict.get(id, None)
 
     def len(self):
         return len(self.sos_entity_dict)
+
+    def add_all(self, entities: Iterable[EntityT]) -> None:
+        for entity in entities:
+            self.add(entity)
+
+    def ids(self) -> KeysView[str]:
+        return self.sos_entity_dict.keys()
+
+    def values(self) -> ValuesView[EntityT]:
+        return self.sos_entity_dict.values()
+
+    def get_all(self, ids: Iterable[str]) -> list[EntityT | None]:
+        return [self.sos_entity_dict.get(id, None) for id in ids]
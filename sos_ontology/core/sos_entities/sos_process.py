@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -20,6 +20,21 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class SoSProcess(SoSEntity):
+    __slots__ = (
+        'category',
+        'description',
+        'documentation',
+        'models_list',
+        'models_list_ids',
+        'models_set',
+        'process_module_path',
+        'repository',
+        'usecases_list',
+        'usecases_list_ids',
+        'usecases_set',
+        'version',
+    )
+
     def __init__(
         self,
         id: str,
@@ -42,13 +57,18 @@ class SoSProcess(SoSEntity):
         self.models_list_ids = []
         self.usecases_list = []
         self.usecases_list_ids = []
+        # models and usecases already added, to check the membership without walking the lists
+        self.models_set = set()
+        self.usecases_set = set()
 
     def add_model(self, model: SoSDiscipline) -> None:
-        if model not in self.models_list:
+        if model not in self.models_set:
+            self.models_set.add(model)
             self.models_list.append(model)
             self.models_list_ids.append(model.id)
 
     def add_usecase(self, usecase) -> None:
-        if usecase not in self.usecases_list:
+        if usecase not in self.usecases_set:
+            self.usecases_set.add(usecase)
             self.usecases_list.append(usecase)
             self.usecases_list_ids.append(usecase.id)
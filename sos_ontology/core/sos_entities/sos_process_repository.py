@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -20,6 +20,14 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class SoSProcessRepository(SoSEntity):
+    __slots__ = (
+        'code_repository',
+        'description',
+        'processes_list',
+        'processes_list_ids',
+        'processes_set',
+    )
+
     def __init__(
         self, id: str, label: str, description: str, code_repository: CodeRepository,
     ) -> None:
@@ -27,9 +35,12 @@ class SoSProcessRepository(SoSEntity):
         self.description = description
         self.processes_list = []
         self.processes_list_ids = []
+        # processes already added, to check the membership without walking the list
+        self.processes_set = set()
         self.code_repository = code_repository
 
     def add_process(self, process) -> None:
-        if process not in self.processes_list:
+        if process not in self.processes_set:
+            self.processes_set.add(process)
             self.processes_list.append(process)
             self.processes_list_ids.append(process.id)
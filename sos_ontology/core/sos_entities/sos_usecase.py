@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 12/02/2025 Copyright 2025 Capgemini
+Modifications on 12/02/2025-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -19,6 +19,13 @@ from sos_ontology.core.sos_entities.sos_entity import SoSEntity
 
 
 class SoSUsecase(SoSEntity):
+    __slots__ = (
+        'description',
+        'disciplines_dict',
+        'process',
+        'run_usecase',
+    )
+
     def __init__(
         self, id: str, label: str, description: str, process, run_usecase: bool,
     ) -> None:
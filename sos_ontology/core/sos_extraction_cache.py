@@ -0,0 +1,437 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import time
+from os.path import abspath, isfile, join, normcase
+
+'''
+Persistent artifacts of the code extraction, used to only rescan the code repositories
+and the Python files that changed since the previous extraction, and to only configure again
+the processes and usecases built from code repositories that changed.
+'''
+
+# to increase each time the content of the artifacts changes, older artifacts are then ignored
+EXTRACTION_CACHE_VERSION = 4
+
+# repositories whose commit invalidates the artifacts of every repository,
+# disciplines of all repositories are configured with their execution engine
+DEFAULT_SHARED_REPOSITORIES = ('sostrades-core',)
+
+# files modified less than this number of seconds before being cached are hashed again on the next run,
+# a modification in the same time resolution would not change their modification time
+RACY_MODIFICATION_SECONDS = 2
+
+
+def is_git_repository_clean(path: str) -> bool:
+    """Return True if the git repository containing path has no local modification, False if unknown"""
+    try:
+        # GitPython is installed with sostrades_core, like the other dependencies of the code extraction
+        import git
+
+        return not git.Repo(path=path, search_parent_directories=True).is_dirty(untracked_files=True)
+    except Exception:
+        return False
+
+
+def get_module_file(module) -> str | None:
+    """Absolute path of the file a module was loaded from, None for built-in and namespace modules"""
+    module_file = getattr(module, '__file__', None)
+    if not isinstance(module_file, str):
+        return None
+    return abspath(module_file)
+
+
+def get_folder_prefixes(folders) -> tuple:
+    """Normalized paths of folders ending with a separator, to find the files they contain with startswith"""
+    return tuple(normcase(join(abspath(folder), '')) for folder in folders)
+
+
+def get_module_repositories(repository_folders: dict) -> set:
+    """
+    Names of the repositories containing a module loaded in sys.modules
+    :param repository_folders: folder of each repository by name
+    :type repository_folders: dict
+    """
+    prefixes = dict(zip(get_folder_prefixes(repository_folders.values()), repository_folders))
+    repositories = set()
+    for module in list(sys.modules.values()):
+        module_file = get_module_file(module)
+        if module_file is None:
+            continue
+        module_file = normcase(module_file)
+        repositories.update(
+            repo_name for prefix, repo_name in prefixes.items() if module_file.startswith(prefix)
+        )
+    return repositories
+
+
+def write_pickle(file_path: str, data) -> None:
+    """Write data atomically, a reader never sees a partially written file"""
+    folder = os.path.dirname(file_path)
+    os.makedirs(folder, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            pickle.dump(data, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def read_pickle(file_path: str):
+    """Read a pickle file, None if it does not exist or can not be read"""
+    if not isfile(file_path):
+        return None
+    try:
+        with open(file_path, 'rb') as pickle_file:
+            return pickle.load(pickle_file)
+    except Exception as ex:
+        print(f'Extraction cache file {file_path} ignored, it can not be read: {ex}')
+        return None
+
+
+class SoSRepositoryExtractionCache:
+    """
+    Discipline records and scan logs of each code repository, stored in cache_folder.
+    An artifact is reused while the commit of its repository, the commits of the shared repositories and the commits
+    of the other repositories whose modules were imported during the scan are the same.
+    Artifacts depending on repositories with local modifications are neither stored nor reused.
+    """
+
+    def __init__(self, cache_folder: str, shared_repositories=DEFAULT_SHARED_REPOSITORIES) -> None:
+        self.cache_folder = cache_folder
+        self.shared_repositories = shared_repositories
+
+    def get_artifact_path(self, repo_name: str) -> str:
+        return join(self.cache_folder, 'repositories', f'{repo_name}.pkl')
+
+    def get_shared_key(self, code_repositories_dict: dict, excluded_repo_name: str | None = None) -> dict | None:
+        """Commits of the shared repositories, None if one of them has local modifications"""
+        key = {}
+        for shared_repo_name in self.shared_repositories:
+            if shared_repo_name in code_repositories_dict and shared_repo_name != excluded_repo_name:
+                shared_repo_dict = code_repositories_dict[shared_repo_name]
+                if not is_git_repository_clean(shared_repo_dict['path']):
+                    return None
+                key[shared_repo_name] = shared_repo_dict.get('commit')
+        return key
+
+    def get_key(self, repo_name: str, code_repositories_dict: dict) -> dict | None:
+        """Commits the artifact of repo_name depends on, None if the repository can not be cached"""
+        repo_dict = code_repositories_dict[repo_name]
+        commit = repo_dict.get('commit')
+        if not commit or not is_git_repository_clean(repo_dict['path']):
+            return None
+        shared_key = self.get_shared_key(code_repositories_dict, excluded_repo_name=repo_name)
+        if shared_key is None:
+            return None
+        return {repo_name: commit, **shared_key}
+
+    def get_file_cache_path(self, repo_name: str) -> str:
+        return join(self.cache_folder, 'files', f'{repo_name}.pkl')
+
+    def load(self, repo_name: str, key: dict | None, repositories_state: dict) -> tuple[list, dict] | None:
+        """
+        Return the records and logs stored for repo_name if they were extracted with the same key
+        and the repositories imported during the scan did not change
+        :param repositories_state: commit of each code repository, None if the repository has local modifications
+        :type repositories_state: dict
+        """
+        if key is None:
+            return None
+        artifact = read_pickle(self.get_artifact_path(repo_name))
+        if (
+            not isinstance(artifact, dict)
+            or artifact.get('version') != EXTRACTION_CACHE_VERSION
+            or artifact.get('key') != key
+            or any(
+                repositories_state.get(imported_repo_name) != commit
+                for imported_repo_name, commit in artifact['imported_repositories'].items()
+            )
+        ):
+            return None
+        return artifact['records'], artifact['logs_dict']
+
+    def store(
+            self, repo_name: str, key: dict | None, records: list, logs_dict: dict,
+            imported_repo_names, repositories_state: dict,
+    ) -> bool:
+        """
+        Store the records and logs extracted for repo_name,
+        return False if they can not be stored or if an imported repository has local modifications
+        :param imported_repo_names: repositories whose modules were imported during the scan
+        :param repositories_state: commit of each code repository, None if the repository has local modifications
+        :type repositories_state: dict
+        """
+        if key is None:
+            return False
+        imported_repositories = {
+            imported_repo_name: repositories_state.get(imported_repo_name)
+            for imported_repo_name in sorted(imported_repo_names)
+            if imported_repo_name not in key
+        }
+        if any(commit is None for commit in imported_repositories.values()):
+            return False
+        artifact = {
+            'version': EXTRACTION_CACHE_VERSION,
+            'key': key,
+            'imported_repositories': imported_repositories,
+            'records': records,
+            'logs_dict': logs_dict,
+        }
+        try:
+            write_pickle(self.get_artifact_path(repo_name), artifact)
+        except Exception as ex:
+            print(f'Extraction of code repository {repo_name} can not be stored in cache: {ex}')
+            return False
+        return True
+
+
+def is_picklable(data) -> bool:
+    """Return True if data can be stored in the cache"""
+    try:
+        pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
+
+
+def get_file_hash(file_path: str) -> str:
+    """Sha256 of the file content"""
+    with open(file_path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class SoSFileExtractionCache:
+    """
+    Information extracted from each Python file of a code repository: its analysis (classes, imports,
+    parsed discipline attributes) and the internal variables of its disciplines with the logs generated
+    while loading them. Markdown documentation files have an entry with the documentation rendered from them
+    and the signatures of the images it embeds.
+    A file entry is reused while the file content is the same, the modification time and size are checked first
+    and the content hash only when they changed. Entries of files not visited during the scan are evicted on save.
+    All entries are ignored if the extractor version or the key (commits of the shared repositories) changed.
+    The internal variables are built when the discipline module is imported, often from other modules (glossaries...),
+    they are also recorded with the module files loaded at that time and reused while none of them changed.
+    """
+
+    def __init__(self, cache_file: str, key: dict, module_folders=()) -> None:
+        """
+        Constructor
+        :param module_folders: folders of the loaded module files the internal variables depend on
+        :type module_folders: list
+        """
+        self.cache_file = cache_file
+        self.key = key
+        self.entries = {}
+        self.visited_files = set()
+        self.module_prefixes = get_folder_prefixes(module_folders)
+        # (file, content hash) of the module files of module_folders loaded during this scan, in load order,
+        # the modules loaded with a discipline are the first ones of the list of the scan it was loaded in
+        self.loaded_modules = []
+        self.loaded_module_files = set()
+        self.read_module_names = set()
+        # content hash of the module files read during this scan
+        self.module_hashes = {}
+        # (list of loaded modules, number of its first modules that did not change) by id of the list,
+        # the list is kept so that its id is not reused
+        self.unchanged_module_counts = {}
+        stored_cache = read_pickle(cache_file)
+        if (
+            isinstance(stored_cache, dict)
+            and stored_cache.get('version') == EXTRACTION_CACHE_VERSION
+            and stored_cache.get('key') == key
+        ):
+            self.entries = stored_cache['entries']
+
+    def get_entry(self, file_path: str) -> dict:
+        """Return the entry of file_path, a new empty entry is created if the file changed since it was cached"""
+        file_stat = os.stat(file_path)
+        self.visited_files.add(file_path)
+        entry = self.entries.get(file_path)
+        if entry is not None and entry['mtime_ns'] == file_stat.st_mtime_ns and entry['size'] == file_stat.st_size:
+            return entry
+
+        file_hash = get_file_hash(file_path)
+        if entry is None or entry['hash'] != file_hash:
+            entry = {'hash': file_hash, 'analysis': None, 'internal_variables': {}, 'documentation': None}
+            self.entries[file_path] = entry
+        is_racy = time.time() - file_stat.st_mtime < RACY_MODIFICATION_SECONDS
+        entry['mtime_ns'] = None if is_racy else file_stat.st_mtime_ns
+        entry['size'] = file_stat.st_size
+        return entry
+
+    def get_module_hash(self, module_file: str) -> str | None:
+        """Content hash of a module file, None if it does not exist anymore"""
+        if module_file not in self.module_hashes:
+            try:
+                self.module_hashes[module_file] = get_file_hash(module_file)
+            except OSError:
+                self.module_hashes[module_file] = None
+        return self.module_hashes[module_file]
+
+    def record_loaded_modules(self) -> tuple[list, int]:
+        """
+        Add the module files of sys.modules loaded since the last call to the loaded modules of this scan,
+        return the dependencies of what was loaded so far: the list of loaded modules and its current length
+        """
+        for module_name, module in list(sys.modules.items()):
+            if module_name in self.read_module_names:
+                continue
+            self.read_module_names.add(module_name)
+            module_file = get_module_file(module)
+            if (
+                module_file is not None
+                and module_file not in self.loaded_module_files
+                and normcase(module_file).startswith(self.module_prefixes)
+            ):
+                self.loaded_module_files.add(module_file)
+                self.loaded_modules.append((module_file, self.get_module_hash(module_file)))
+        return self.loaded_modules, len(self.loaded_modules)
+
+    def are_loaded_modules_unchanged(self, dependencies: tuple[list, int]) -> bool:
+        """Return True if the module files of dependencies, returned by record_loaded_modules, did not change"""
+        loaded_modules, count = dependencies
+        if loaded_modules is self.loaded_modules:
+            return True
+        if id(loaded_modules) not in self.unchanged_module_counts:
+            unchanged_count = 0
+            for module_file, module_hash in loaded_modules:
+                if module_hash is None or self.get_module_hash(module_file) != module_hash:
+                    break
+                unchanged_count += 1
+            self.unchanged_module_counts[id(loaded_modules)] = (loaded_modules, unchanged_count)
+        return count <= self.unchanged_module_counts[id(loaded_modules)][1]
+
+    def save(self) -> bool:
+        """Store the entries of the visited files, return False if they can not be stored"""
+        cache = {
+            'version': EXTRACTION_CACHE_VERSION,
+            'key': self.key,
+            'entries': {
+                file_path: entry for file_path, entry in self.entries.items() if file_path in self.visited_files
+            },
+        }
+        try:
+            write_pickle(self.cache_file, cache)
+        except Exception as ex:
+            # entries with values that can not be pickled (ex: a lambda in a DESC_IN) are not stored
+            cache['entries'] = {
+                file_path: entry for file_path, entry in cache['entries'].items() if is_picklable(entry)
+            }
+            try:
+                write_pickle(self.cache_file, cache)
+            except Exception:
+                print(f'Extraction cache file {self.cache_file} can not be written: {ex}')
+                return False
+        return True
+
+
+class SoSConfigurationCache:
+    """
+    Configuration of each process and usecase (disciplines with their data in and out, couplings), stored in
+    cache_folder. A configuration is reused while the commits of the code repositories it was built from are the same,
+    configurations built from repositories with local modifications are neither stored nor reused.
+    """
+
+    def __init__(self, cache_folder: str) -> None:
+        self.cache_folder = cache_folder
+
+    def get_configuration_path(self, configuration_id: str) -> str:
+        return join(self.cache_folder, 'configurations', f'{configuration_id}.pkl')
+
+    def load(self, configuration_id: str, repositories_state: dict):
+        """
+        Return the configuration stored for configuration_id if the repositories it was built from did not change
+        :param repositories_state: commit of each code repository, None if the repository has local modifications
+        :type repositories_state: dict
+        """
+        artifact = read_pickle(self.get_configuration_path(configuration_id))
+        if (
+            not isinstance(artifact, dict)
+            or artifact.get('version') != EXTRACTION_CACHE_VERSION
+            or any(
+                commit is None or repositories_state.get(repo_name) != commit
+                for repo_name, commit in artifact['key'].items()
+            )
+        ):
+            return None
+        return artifact['configuration']
+
+    def store(self, configuration_id: str, repo_names, repositories_state: dict, configuration) -> bool:
+        """
+        Store the configuration built from the code repositories repo_names,
+        return False if one of them has local modifications or if the configuration can not be stored
+        """
+        key = {repo_name: repositories_state.get(repo_name) for repo_name in sorted(repo_names)}
+        if any(commit is None for commit in key.values()):
+            return False
+        artifact = {
+            'version': EXTRACTION_CACHE_VERSION,
+            'key': key,
+            'configuration': configuration,
+        }
+        try:
+            write_pickle(self.get_configuration_path(configuration_id), artifact)
+        except Exception as ex:
+            print(f'Configuration {configuration_id} can not be stored in cache: {ex}')
+            return False
+        return True
+
+
+class SoSParametersGlossaryCache:
+    """
+    Parsed parameters glossary of each code repository, stored in cache_folder.
+    A glossary is reused while the sha256 of its file content is the same.
+    """
+
+    def __init__(self, cache_folder: str) -> None:
+        self.cache_folder = cache_folder
+
+    def get_glossary_path(self, repo_name: str) -> str:
+        return join(self.cache_folder, 'glossaries', f'{repo_name}.pkl')
+
+    def load(self, repo_name: str, file_hash: str):
+        """Return the glossary stored for repo_name if it was parsed from a file with the same hash"""
+        artifact = read_pickle(self.get_glossary_path(repo_name))
+        if (
+            not isinstance(artifact, dict)
+            or artifact.get('version') != EXTRACTION_CACHE_VERSION
+            or artifact.get('hash') != file_hash
+        ):
+            return None
+        return artifact['glossary']
+
+    def store(self, repo_name: str, file_hash: str, glossary) -> bool:
+        """Store the glossary parsed for repo_name, return False if it can not be stored"""
+        artifact = {
+            'version': EXTRACTION_CACHE_VERSION,
+            'hash': file_hash,
+            'glossary': glossary,
+        }
+        try:
+            write_pickle(self.get_glossary_path(repo_name), artifact)
+        except Exception as ex:
+            print(f'Parameters glossary of code repository {repo_name} can not be stored in cache: {ex}')
+            return False
+        return True
@@ -0,0 +1,180 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from os.path import isfile, join
+
+from sos_ontology.core.sos_entities.sos_entity import SoSEntity
+
+'''
+Checkpoints of the ontology creation from code, the state reached after each phase is stored
+so that a run can be resumed from a later phase or a single phase can be run again.
+'''
+
+# to increase each time the content of the checkpoints changes, older checkpoints are then ignored
+EXTRACTION_CHECKPOINT_VERSION = 1
+
+DISCIPLINES_PHASE = 'disciplines'
+PROCESSES_PHASE = 'processes'
+GLOSSARIES_PHASE = 'glossaries'
+ONTOLOGY_PHASE = 'ontology'
+TERMINOLOGY_PHASE = 'terminology'
+DIFFERENCE_PHASE = 'difference'
+LOGS_PHASE = 'logs'
+# phases of the ontology creation in their execution order
+EXTRACTION_PHASES = (
+    DISCIPLINES_PHASE,
+    PROCESSES_PHASE,
+    GLOSSARIES_PHASE,
+    ONTOLOGY_PHASE,
+    TERMINOLOGY_PHASE,
+    DIFFERENCE_PHASE,
+    LOGS_PHASE,
+)
+
+# number of entities whose attributes are pickled together
+ENTITIES_CHUNK_SIZE = 10000
+
+
+def get_entity_state(entity: SoSEntity) -> dict:
+    """Attributes of an entity, from its __slots__ and its __dict__ if it has one"""
+    state = {
+        name: getattr(entity, name)
+        for entity_class in type(entity).__mro__
+        for name in getattr(entity_class, '__slots__', ())
+        if hasattr(entity, name)
+    }
+    state.update(getattr(entity, '__dict__', {}))
+    return state
+
+
+class SoSEntityPickler(pickle.Pickler):
+    """
+    Pickler of a state referencing entities, each entity is replaced by a reference and its attributes are
+    pickled afterwards with dump_entities, so that pickling does not recurse along the relations of the
+    entities (parameter -> usages -> discipline -> usages -> ...)
+    """
+
+    def __init__(self, file) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.entity_indexes = {}
+        self.pending_entities = []
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, SoSEntity):
+            return None
+        entity_index = self.entity_indexes.get(id(obj))
+        if entity_index is None:
+            entity_index = len(self.entity_indexes)
+            self.entity_indexes[id(obj)] = entity_index
+            self.pending_entities.append((entity_index, obj))
+        return entity_index, type(obj)
+
+    def dump_entities(self) -> None:
+        """Pickle the attributes of the referenced entities by chunks, terminated by None"""
+        while len(self.pending_entities) > 0:
+            chunk = self.pending_entities[:ENTITIES_CHUNK_SIZE]
+            del self.pending_entities[:ENTITIES_CHUNK_SIZE]
+            self.dump([(entity_index, get_entity_state(entity)) for entity_index, entity in chunk])
+        self.dump(None)
+
+
+class SoSEntityUnpickler(pickle.Unpickler):
+    """Unpickler of the states pickled with SoSEntityPickler"""
+
+    def __init__(self, file) -> None:
+        super().__init__(file)
+        self.entities = {}
+
+    def persistent_load(self, pid):
+        entity_index, entity_class = pid
+        entity = self.entities.get(entity_index)
+        if entity is None:
+            entity = entity_class.__new__(entity_class)
+            self.entities[entity_index] = entity
+        return entity
+
+    def load_entities(self) -> None:
+        """Set the attributes of the referenced entities"""
+        chunk = self.load()
+        while chunk is not None:
+            for entity_index, state in chunk:
+                entity = self.entities[entity_index]
+                for name, value in state.items():
+                    setattr(entity, name, value)
+            chunk = self.load()
+
+
+class SoSExtractionCheckpoint:
+    """State reached after each phase of the ontology creation, stored in checkpoint_folder"""
+
+    def __init__(self, checkpoint_folder: str) -> None:
+        self.checkpoint_folder = checkpoint_folder
+
+    def get_checkpoint_path(self, phase: str) -> str:
+        return join(self.checkpoint_folder, f'{phase}.pkl')
+
+    def save(self, phase: str, state: dict) -> bool:
+        """Store the state reached after phase, return False if it can not be stored"""
+        os.makedirs(self.checkpoint_folder, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.checkpoint_folder, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                pickler = SoSEntityPickler(temp_file)
+                pickler.dump({'version': EXTRACTION_CHECKPOINT_VERSION, 'phase': phase, 'state': state})
+                pickler.dump_entities()
+            os.replace(temp_path, self.get_checkpoint_path(phase))
+        except Exception as ex:
+            os.remove(temp_path)
+            print(f'Checkpoint of phase {phase} can not be stored: {ex}')
+            return False
+        return True
+
+    def load(self, phase: str) -> dict | None:
+        """Return the state stored after phase, None if there is none or if it can not be read"""
+        checkpoint_path = self.get_checkpoint_path(phase)
+        if not isfile(checkpoint_path):
+            return None
+        try:
+            with open(checkpoint_path, 'rb') as checkpoint_file:
+                unpickler = SoSEntityUnpickler(checkpoint_file)
+                checkpoint = unpickler.load()
+                if checkpoint.get('version') != EXTRACTION_CHECKPOINT_VERSION:
+                    print(f'Checkpoint {checkpoint_path} ignored, it was stored by another version')
+                    return None
+                unpickler.load_entities()
+        except Exception as ex:
+            print(f'Checkpoint {checkpoint_path} ignored, it can not be read: {ex}')
+            return None
+        return checkpoint['state']
+
+
+def get_phases_to_run(resume_from: str | None = None, only: str | None = None) -> list[str]:
+    """Phases to run, all of them by default, from resume_from to the last one, or only one of them"""
+    if only is not None:
+        return [only]
+    if resume_from is not None:
+        return list(EXTRACTION_PHASES[EXTRACTION_PHASES.index(resume_from):])
+    return list(EXTRACTION_PHASES)
+
+
+def get_previous_phase(phase: str) -> str | None:
+    """Phase whose checkpoint a phase starts from, None for the first phase"""
+    phase_index = EXTRACTION_PHASES.index(phase)
+    return EXTRACTION_PHASES[phase_index - 1] if phase_index > 0 else None
@@ -0,0 +1,93 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+'''
+Indexes of the parameters maintained while the entities are generated, so that the extraction logs
+(parameters missing in the glossaries, unit and datatype inconsistencies) are built in one linear pass.
+'''
+
+
+class SoSExtractionIndex:
+    """
+    Code repositories and disciplines using each parameter, grouped by unit and datatype.
+    Dictionaries with None values are used as insertion ordered sets.
+    """
+
+    def __init__(self) -> None:
+        # {parameter id: {code repository label: None}}
+        self.repositories_by_parameter = {}
+        # {code repository label: {parameter id: None}}
+        self.parameters_by_repository = {}
+        # {parameter id: {unit: [('discipline', discipline id)]}}
+        self.usages_by_unit = {}
+        # {parameter id: {datatype: [('discipline', discipline id)]}}
+        self.usages_by_datatype = {}
+        # parameters used with several units or several datatypes, updated as usages are added
+        self.inconsistent_parameter_ids = {}
+        self.parameter_usages_count = 0
+
+    def add_parameter_usage(self, parameter_id: str, repository_label: str, discipline_id: str, unit, datatype) -> None:
+        """Index a new usage of parameter_id by the discipline discipline_id of the code repository repository_label"""
+        self.parameter_usages_count += 1
+        self.repositories_by_parameter.setdefault(parameter_id, {})[repository_label] = None
+        self.parameters_by_repository.setdefault(repository_label, {})[parameter_id] = None
+
+        units = self.usages_by_unit.setdefault(parameter_id, {})
+        units.setdefault(unit, []).append(('discipline', discipline_id))
+        datatypes = self.usages_by_datatype.setdefault(parameter_id, {})
+        datatypes.setdefault(datatype, []).append(('discipline', discipline_id))
+        if len(units) > 1 or len(datatypes) > 1:
+            self.inconsistent_parameter_ids[parameter_id] = None
+
+    def get_parameters_by_repository(self, parameter_ids) -> dict:
+        """
+        Return {code repository label: [parameter ids]} restricted to parameter_ids,
+        code repositories using none of them are not returned
+        """
+        parameters_by_repository = {}
+        for repository_label, repository_parameter_ids in self.parameters_by_repository.items():
+            selected_parameter_ids = [
+                parameter_id for parameter_id in repository_parameter_ids if parameter_id in parameter_ids
+            ]
+            if len(selected_parameter_ids) > 0:
+                parameters_by_repository[repository_label] = selected_parameter_ids
+        return parameters_by_repository
+
+    def get_inconsistencies(self, parameter_id: str, glossary_attributes: dict | None = None) -> dict:
+        """
+        Return {'unit': {unit: usages}, 'datatype': {datatype: usages}} with only the attributes having several values
+        :param glossary_attributes: attributes of the parameter in the glossary of each code repository,
+            added as ('glossary', code repository) usages
+        :type glossary_attributes: dict
+        """
+        units = self.usages_by_unit.get(parameter_id, {})
+        datatypes = self.usages_by_datatype.get(parameter_id, {})
+        if glossary_attributes:
+            units = {unit: list(usages) for unit, usages in units.items()}
+            datatypes = {datatype: list(usages) for datatype, usages in datatypes.items()}
+            for repository_id, attributes in glossary_attributes.items():
+                units.setdefault(attributes['unit'], []).append(('glossary', repository_id))
+                datatypes.setdefault(attributes['datatype'], []).append(('glossary', repository_id))
+        elif parameter_id not in self.inconsistent_parameter_ids:
+            return {}
+
+        inconsistencies = {}
+        if len(units) > 1:
+            inconsistencies['unit'] = units
+        if len(datatypes) > 1:
+            inconsistencies['datatype'] = datatypes
+        return inconsistencies
@@ -0,0 +1,155 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:
+    # memory limit is not available on Windows
+    resource = None
+
+'''
+Run functions in isolated processes, each one with a wall-clock timeout and a memory limit,
+so that a hanging or memory-hungry task does not stall the caller.
+'''
+
+TASK_SUCCEEDED = 'succeeded'
+TASK_FAILED = 'failed'
+TASK_TIMEOUT = 'timeout'
+TASK_MEMORY_LIMIT = 'memoryLimit'
+TASK_CRASHED = 'crashed'
+# the task succeeded but its result can not be sent back to the caller
+TASK_NOT_SERIALIZABLE = 'notSerializable'
+
+
+def run_task(connection, function, args, memory_limit: int | None) -> None:
+    """Entry point of the isolated process, send back (status, result or exception)"""
+    if memory_limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    try:
+        outcome = (TASK_SUCCEEDED, function(*args))
+    except MemoryError as ex:
+        outcome = (TASK_MEMORY_LIMIT, ex)
+    except BaseException as ex:
+        outcome = (TASK_FAILED, ex)
+
+    try:
+        connection.send(outcome)
+    except Exception as ex:
+        if outcome[0] == TASK_SUCCEEDED:
+            connection.send((TASK_NOT_SERIALIZABLE, RuntimeError(f'{type(ex)} - {ex}')))
+        else:
+            connection.send((outcome[0], RuntimeError(f'{type(outcome[1])} - {outcome[1]}')))
+    finally:
+        connection.close()
+
+
+class SoSIsolatedRunner:
+    """Run tasks in at most max_workers processes at the same time, one process per task"""
+
+    def __init__(
+            self,
+            max_workers: int,
+            timeout: float | None = None,
+            memory_limit: int | None = None,
+            mp_context=None,
+    ) -> None:
+        """
+        Constructor
+        :param max_workers: number of tasks running at the same time
+        :type max_workers: int
+        :param timeout: wall-clock time in seconds after which a task process is terminated, no timeout if None
+        :type timeout: float
+        :param memory_limit: address space limit of each task process in bytes, no limit if None
+        :type memory_limit: int
+        """
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.mp_context = mp_context if mp_context is not None else multiprocessing.get_context()
+        # wall-clock duration in seconds of each task of the last run, from its start to its outcome
+        self.durations = {}
+
+    def run(self, tasks: dict) -> dict:
+        """
+        Run tasks given as {name: (function, args)}
+        Return for each name a (status, result) tuple, result is the exception raised by the task if it failed
+        """
+        pending = list(tasks.items())
+        running = {}
+        outcomes = {}
+        start_times = {}
+        self.durations = {}
+        while len(pending) > 0 or len(running) > 0:
+            while len(pending) > 0 and len(running) < self.max_workers:
+                name, (function, args) = pending.pop(0)
+                start_times[name] = time.monotonic()
+                running[name] = self.start_task(function, args)
+
+            deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+            wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if len(deadlines) > 0 else None
+            wait(
+                [connection for _, connection, _ in running.values()]
+                + [process.sentinel for process, _, _ in running.values()],
+                timeout=wait_timeout,
+            )
+
+            for name, (process, connection, deadline) in list(running.items()):
+                outcome = self.get_task_outcome(process, connection, deadline)
+                if outcome is not None:
+                    outcomes[name] = outcome
+                    self.durations[name] = time.monotonic() - start_times[name]
+                    connection.close()
+                    del running[name]
+
+        return {name: outcomes[name] for name in tasks}
+
+    def start_task(self, function, args) -> tuple:
+        parent_connection, child_connection = self.mp_context.Pipe(duplex=False)
+        process = self.mp_context.Process(
+            target=run_task, args=(child_connection, function, args, self.memory_limit), daemon=True,
+        )
+        process.start()
+        # the parent copy is closed so that the end of the process is seen as the end of the pipe
+        child_connection.close()
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        return process, parent_connection, deadline
+
+    def get_task_outcome(self, process, connection, deadline) -> tuple | None:
+        """Outcome of a running task, None if it is still running"""
+        if not connection.poll():
+            if process.is_alive():
+                if deadline is not None and time.monotonic() >= deadline:
+                    process.terminate()
+                    process.join()
+                    return TASK_TIMEOUT, TimeoutError(f'Task did not finish within {self.timeout} seconds')
+                return None
+            # the process may have sent its outcome and exited after the poll, the pipe is read again once it is joined
+            process.join()
+            if not connection.poll():
+                return TASK_CRASHED, RuntimeError(f'Task process exited with code {process.exitcode}')
+        try:
+            outcome = connection.recv()
+        except EOFError:
+            outcome = None
+        process.join()
+        if outcome is not None:
+            return outcome
+        return TASK_CRASHED, RuntimeError(f'Task process exited with code {process.exitcode}')
@@ -0,0 +1,89 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from rdflib import Literal
+from rdflib.namespace import XSD
+
+'''
+Factory of the xsd:string literals of an ontology: values are converted to their text once and the short literals are
+interned, so that a label, unit or datatype repeated on thousands of entities is a single Literal object in the graph.
+Long texts (definitions, documentations with embedded images) are seldom repeated and are not kept by the factory.
+'''
+
+EMPTY_LITERAL_TEXT = ' '
+# longest text of an interned literal
+INTERNED_LITERAL_MAX_LENGTH = 100
+
+
+def to_literal_text(value) -> str:
+    """
+    Text of a literal: lists (and arrays) joined by ',' and a newline without their None and 'null' values,
+    dataframes as a dict of lists, ' ' for empty and unsupported values
+    """
+    if isinstance(value, pd.DataFrame):
+        # convert dataframe to dict
+        value = value.to_dict(orient='list')
+    elif isinstance(value, np.ndarray):
+        # convert np.ndarray to list
+        value = value.tolist()
+    if value is None:
+        return EMPTY_LITERAL_TEXT
+    if isinstance(value, list):
+        # values are removed from a copy while iterating on it, as done historically, so that the text is unchanged
+        # (a None or 'null' following another one is kept) and the list given is not modified
+        values = list(value)
+        for v in values:
+            if v is None or v == 'null':
+                values.remove(v)
+        if len(values) > 0:
+            return ',\n'.join([str(i) for i in values])
+        return EMPTY_LITERAL_TEXT
+    if isinstance(value, int | float | dict | str):
+        return str(value)
+    return EMPTY_LITERAL_TEXT
+
+
+class SoSLiteralFactory:
+    """Interned xsd:string literals by text, texts longer than max_length are not interned"""
+
+    def __init__(self, max_length: int = INTERNED_LITERAL_MAX_LENGTH) -> None:
+        self.max_length = max_length
+        # {text: Literal}
+        self.literals = {}
+
+    def get_literal(self, text: str) -> Literal:
+        literal = self.literals.get(text)
+        if literal is None:
+            literal = Literal(text, datatype=XSD.string)
+            if len(text) <= self.max_length:
+                self.literals[text] = literal
+        return literal
+
+    def clear(self) -> None:
+        """Release the interned literals, the ones already in a graph are kept by the graph"""
+        self.literals = {}
+
+    def to_literal(self, value) -> Literal:
+        """xsd:string literal of a value, plain strings are looked up without conversion"""
+        if type(value) is str:
+            literal = self.literals.get(value)
+            if literal is not None:
+                return literal
+            return self.get_literal(value)
+        return self.get_literal(to_literal_text(value))
@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/24 Copyright 2024 Capgemini
+Modifications on 2024/06/24-2026/10/19 Copyright 2026 Capgemini
 
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
@@ -25,6 +25,8 @@ from rdflib.namespace import DC, DCTERMS, OWL, RDF, RDFS, SKOS, XSD, split_uri
 
 import sos_ontology
 from sos_ontology.core.ontology import Ontology
+from sos_ontology.core.sos_timings import TRIPLES_SPAN, timing_span
+from sos_ontology.core.sos_triples_sink import SoSGraphTriplesSink, SoSNTriplesSink
 from sos_ontology.rest_api.models.model_status import ModelStatus
 
 '''
@@ -93,6 +95,8 @@ class SoSOntology(Ontology):
             )
 
         self.incoherences = {}
+        # URI of each entity by its sos:id literal, filled while the ABox triples are generated
+        self.abox_uris_by_id = {}
 
     @staticmethod
     def get_files_paths():
@@ -953,8 +957,26 @@ class SoSOntology(Ontology):
 
         self.add_triples_list(creationDateTriple)
 
+    def index_abox_ids(self, triples: list) -> list:
+        """Record the URI of the entities identified by the sos:id triples of triples, the first URI of an id is kept"""
+        id_predicate = self.SOS.id
+        for triple in triples:
+            if triple[1] == id_predicate:
+                self.abox_uris_by_id.setdefault(triple[2], triple[0])
+        return triples
+
+    def get_abox_uri(self, id_literal: Literal):
+        """
+        URI of the entity whose sos:id is id_literal, None if there is none.
+        Entities generated during the ABox creation are found even if their triples are not in the graph yet
+        """
+        uri = self.abox_uris_by_id.get(id_literal)
+        if uri is None:
+            uri = self.value(None, self.SOS.id, id_literal, 'uri')
+        return uri
+
     def createCodeRepositoriesTriples(self, code_repositories):
-        for code_repository in code_repositories.sos_entity_dict.values():
+        for code_repository in code_repositories.values():
 
             # Create the discipline URI
             codeRepoURI = self.create_new_URI(
@@ -1029,10 +1051,10 @@ class SoSOntology(Ontology):
                 ),
             ]
 
-            self.add_triples_list(codeRepositoriesTriples)
+            yield from self.index_abox_ids(codeRepositoriesTriples)
 
     def createSoSProcessRepositoriesTriples(self, sos_process_repositories):
-        for sos_process_repository in sos_process_repositories.sos_entity_dict.values():
+        for sos_process_repository in sos_process_repositories.values():
 
             # Create the discipline URI
             processRepoURI = self.create_new_URI(
@@ -1088,22 +1110,17 @@ class SoSOntology(Ontology):
 
             # we add link to code_repository
             # we search for the code_repository URI
-            codeRepoURI = self.value(
-                None,
-                self.SOS.id,
-                self.toLiteral(sos_process_repository.code_repository.id),
-                'uri',
-            )
+            codeRepoURI = self.get_abox_uri(self.toLiteral(sos_process_repository.code_repository.id))
 
             if codeRepoURI is not None:
                 codeRepositoriesTriples.append(
                     (processRepoURI, self.SOS.belongsTo, codeRepoURI, self.graph),
                 )
 
-            self.add_triples_list(codeRepositoriesTriples)
+            yield from self.index_abox_ids(codeRepositoriesTriples)
 
     def createSoSDisciplinesTriples(self, sos_disciplines):
-        for sos_discipline in sos_disciplines.sos_entity_dict.values():
+        for sos_discipline in sos_disciplines.values():
 
             # Create the sosDiscipline URI
             sosDisciplineURI = self.create_new_URI(
@@ -1270,9 +1287,7 @@ class SoSOntology(Ontology):
             ]
 
             # we search for the code repository URI
-            codeRepositoryURI = self.value(
-                None, self.SOS.id, self.toLiteral(sos_discipline.repository.id), 'uri',
-            )
+            codeRepositoryURI = self.get_abox_uri(self.toLiteral(sos_discipline.repository.id))
 
             if codeRepositoryURI is not None:
 
@@ -1286,9 +1301,7 @@ class SoSOntology(Ontology):
                 )
 
             # we search for the code repository URI
-            codeRepositoryURI = self.value(
-                None, self.SOS.id, self.toLiteral(sos_discipline.repository.id), 'uri',
-            )
+            codeRepositoryURI = self.get_abox_uri(self.toLiteral(sos_discipline.repository.id))
 
             if codeRepositoryURI is not None:
 
@@ -1304,9 +1317,7 @@ class SoSOntology(Ontology):
             if len(sos_discipline.inputParameterUsagesIds) > 0:
                 for parameter_usage in sos_discipline.inputParameterUsagesList:
                     # we search for the URI
-                    parameterUsageIRI = self.value(
-                        None, self.SOS.id, self.toLiteral(parameter_usage.id), 'uri',
-                    )
+                    parameterUsageIRI = self.get_abox_uri(self.toLiteral(parameter_usage.id))
 
                     if parameterUsageIRI is not None:
                         sosDisciplineTriples.append(
@@ -1321,9 +1332,7 @@ class SoSOntology(Ontology):
             if len(sos_discipline.outputParameterUsagesIds) > 0:
                 for parameter_usage in sos_discipline.outputParameterUsagesList:
                     # we search for the URI
-                    parameterUsageIRI = self.value(
-                        None, self.SOS.id, self.toLiteral(parameter_usage.id), 'uri',
-                    )
+                    parameterUsageIRI = self.get_abox_uri(self.toLiteral(parameter_usage.id))
 
                     if parameterUsageIRI is not None:
                         sosDisciplineTriples.append(
@@ -1335,10 +1344,10 @@ class SoSOntology(Ontology):
                             ),
                         )
 
-            self.add_triples_list(sosDisciplineTriples)
+            yield from self.index_abox_ids(sosDisciplineTriples)
 
     def createUsecasesTriples(self, usecases):
-        for usecase in usecases.sos_entity_dict.values():
+        for usecase in usecases.values():
 
             # Create the usecase URI
             usecaseURI = self.create_new_URI(
@@ -1365,19 +1374,17 @@ class SoSOntology(Ontology):
             ]
 
             # we search for the process URI
-            processURI = self.value(
-                None, self.SOS.id, self.toLiteral(usecase.process.id), 'uri',
-            )
+            processURI = self.get_abox_uri(self.toLiteral(usecase.process.id))
 
             if processURI is not None:
                 usecaseTriples.append(
                     (usecaseURI, self.SOS.implements, processURI, self.graph),
                 )
 
-            self.add_triples_list(usecaseTriples)
+            yield from self.index_abox_ids(usecaseTriples)
 
     def createCouplingsTriples(self, couplings):
-        for usecase in couplings.sos_entity_dict.values():
+        for usecase in couplings.values():
 
             # Create the usecase URI
             couplingURI = self.create_new_URI(
@@ -1402,13 +1409,9 @@ class SoSOntology(Ontology):
             ]
 
             # we search for the disciplineFrom URI
-            disciplineFromURI = self.value(
-                None, self.SOS.id, self.toLiteral(usecase.disciplineFrom.id), 'uri',
-            )
+            disciplineFromURI = self.get_abox_uri(self.toLiteral(usecase.disciplineFrom.id))
             # we search for the disciplineTo URI
-            disciplineToURI = self.value(
-                None, self.SOS.id, self.toLiteral(usecase.disciplineTo.id), 'uri',
-            )
+            disciplineToURI = self.get_abox_uri(self.toLiteral(usecase.disciplineTo.id))
 
             if disciplineFromURI is not None and disciplineToURI is not None:
                 usecaseTriples.append(
@@ -1421,12 +1424,7 @@ class SoSOntology(Ontology):
             # we search for the parameterUsageIn URI
             parameterUsageIn = None
             if usecase.parameterUsageIn is not None:
-                parameterUsageIn = self.value(
-                    None,
-                    self.SOS.id,
-                    self.toLiteral(usecase.parameterUsageIn.id),
-                    'uri',
-                )
+                parameterUsageIn = self.get_abox_uri(self.toLiteral(usecase.parameterUsageIn.id))
                 if parameterUsageIn is not None:
                     usecaseTriples.append(
                         (couplingURI, self.SOS.represents, parameterUsageIn, self.graph),
@@ -1434,12 +1432,7 @@ class SoSOntology(Ontology):
             # we search for the parameterUsageOut URI
             parameterUsageOut = None
             if usecase.parameterUsageOut is not None:
-                parameterUsageOut = self.value(
-                    None,
-                    self.SOS.id,
-                    self.toLiteral(usecase.parameterUsageOut.id),
-                    'uri',
-                )
+                parameterUsageOut = self.get_abox_uri(self.toLiteral(usecase.parameterUsageOut.id))
                 if parameterUsageOut is not None:
                     usecaseTriples.append(
                         (
@@ -1450,11 +1443,11 @@ class SoSOntology(Ontology):
                         ),
                     )
 
-            self.add_triples_list(usecaseTriples)
+            yield from self.index_abox_ids(usecaseTriples)
 
     def createSoSProcessTriples(self, sos_processes):
 
-        for sos_process in sos_processes.sos_entity_dict.values():
+        for sos_process in sos_processes.values():
             # Create the process URI
             processURI = self.create_new_URI(
                 f'{SoSOntology.BASE_URI}sos_process_', sos_process.id,
@@ -1539,33 +1532,27 @@ class SoSOntology(Ontology):
             ]
 
             # we search for the process URI
-            processRepoURI = self.value(
-                None, self.SOS.id, self.toLiteral(sos_process.repository.id), 'uri',
-            )
+            processRepoURI = self.get_abox_uri(self.toLiteral(sos_process.repository.id))
 
             if processRepoURI is not None:
                 processTriples.append(
                     (processURI, self.SOS.belongsTo, processRepoURI, self.graph),
                 )
 
-            self.add_triples_list(processTriples)
+            yield from self.index_abox_ids(processTriples)
 
     def createLinksBetweenSoSProcessAndSoSDisciplineTriples(self, sos_processes):
 
-        for sos_process in sos_processes.sos_entity_dict.values():
+        for sos_process in sos_processes.values():
             processDisciplineLinkTriples = []
 
             # retrieve the process URI
-            processURI = self.value(
-                None, self.SOS.id, self.toLiteral(sos_process.id), 'uri',
-            )
+            processURI = self.get_abox_uri(self.toLiteral(sos_process.id))
 
             if processURI is not None:
                 for modelId in sos_process.models_list_ids:
                     # we search for the sos_discipline URI
-                    sosDisciplineURI = self.value(
-                        None, self.SOS.id, self.toLiteral(modelId), 'uri',
-                    )
+                    sosDisciplineURI = self.get_abox_uri(self.toLiteral(modelId))
 
                     if sosDisciplineURI is not None:
                         processDisciplineLinkTriples.append(
@@ -1573,11 +1560,11 @@ class SoSOntology(Ontology):
                         )
 
             if len(processDisciplineLinkTriples) > 0:
-                self.add_triples_list(processDisciplineLinkTriples)
+                yield from self.index_abox_ids(processDisciplineLinkTriples)
 
     def createParametersAndUsagesTriples(self, parameters):
 
-        for parameter in parameters.sos_entity_dict.values():
+        for parameter in parameters.values():
             # Create the parameter URI
             parameterURI = self.create_new_URI(
                 f'{SoSOntology.BASE_URI}parameter_', parameter.id,
@@ -1668,7 +1655,7 @@ class SoSOntology(Ontology):
                 ),
             ]
 
-            self.add_triples_list(parameterTriples)
+            yield from self.index_abox_ids(parameterTriples)
 
             # we add parameter usages
             for parameterUsage in parameter.instances_list:
@@ -1824,7 +1811,7 @@ class SoSOntology(Ontology):
                     (parameterUsageURI, self.SOS.instanceOf, parameterURI, self.graph),
                 ]
 
-                self.add_triples_list(parameterUsageTriples)
+                yield from self.index_abox_ids(parameterUsageTriples)
 
     def createDecentralizedSoSOntologyABox(
         self,
@@ -1837,52 +1824,87 @@ class SoSOntology(Ontology):
         usecases,
         couplings,
         logs_dict=None,
+        triples_sink=None,
     ):
+        """
+        Create the ABox triples of the extracted entities, the create*Triples generators are consumed by chunks
+        :param logs_dict: logs receiving the timing span of each create*Triples generator, including the sink time
+        :type logs_dict: dict
+        :param triples_sink: sink receiving the ABox triples, they are added to the graph if None
+        :type triples_sink: SoSTriplesSink
+        """
+        if triples_sink is None:
+            triples_sink = SoSGraphTriplesSink(self.graph)
+
         # add update time
         self.addOntologyCreationDate()
 
         if code_repositories is not None:
             # we will add all triples for the code_repositories
             print(f'Add {code_repositories.len()} Code Repositories triples')
-            self.createCodeRepositoriesTriples(code_repositories)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createCodeRepositoriesTriples'):
+                triples_sink.add(self.createCodeRepositoriesTriples(code_repositories))
 
         if sos_process_repositories is not None:
             # we will add all triples for the sos_process_repositories
             print(
                 f'Add {sos_process_repositories.len()} SoS Process Repositories triples',
             )
-            self.createSoSProcessRepositoriesTriples(sos_process_repositories)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createSoSProcessRepositoriesTriples'):
+                triples_sink.add(self.createSoSProcessRepositoriesTriples(sos_process_repositories))
 
         if sos_processes is not None:
             # we will add all triples for the sos_processes
             print(f'Add {sos_processes.len()} SoS Processes triples')
-            self.createSoSProcessTriples(sos_processes)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createSoSProcessTriples'):
+                triples_sink.add(self.createSoSProcessTriples(sos_processes))
 
         if parameters_usages is not None and parameters is not None:
             # we will add all triples for the sos_processes
             print(
                 f'Add {parameters_usages.len()} Parameter Usage and {parameters.len()} Parameters triples',
             )
-            self.createParametersAndUsagesTriples(parameters)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createParametersAndUsagesTriples'):
+                triples_sink.add(self.createParametersAndUsagesTriples(parameters))
 
         if sos_disciplines is not None:
             # we will add all triples for the sos_disciplines
             print(f'Add {sos_disciplines.len()} SoS Disciplines triples')
-            self.createSoSDisciplinesTriples(sos_disciplines)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createSoSDisciplinesTriples'):
+                triples_sink.add(self.createSoSDisciplinesTriples(sos_disciplines))
 
         if sos_processes is not None:
             # we will add all triples links between sos_process and the sos_disciplines
-            self.createLinksBetweenSoSProcessAndSoSDisciplineTriples(sos_processes)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createLinksBetweenSoSProcessAndSoSDisciplineTriples'):
+                triples_sink.add(self.createLinksBetweenSoSProcessAndSoSDisciplineTriples(sos_processes))
 
         if usecases is not None:
             # we will add all triples for the usecases
             print(f'Add {usecases.len()} Usecases triples')
-            self.createUsecasesTriples(usecases)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createUsecasesTriples'):
+                triples_sink.add(self.createUsecasesTriples(usecases))
 
         if couplings is not None:
             # we will add all triples for the couplings
             print(f'Add {couplings.len()} Couplings triples')
-            self.createCouplingsTriples(couplings)
+            with timing_span(logs_dict, TRIPLES_SPAN, 'createCouplingsTriples'):
+                triples_sink.add(self.createCouplingsTriples(couplings))
+
+        triples_sink.flush()
+        # the literals are not needed anymore once the triples are in the sink
+        self.literal_factory.clear()
+
+    def exportDecentralizedSoSOntologyNTriples(self, ntriplesPath, **entities):
+        """
+        Write the ontology (graph triples and ABox of the extracted entities) to an N-Triples file.
+        The ABox triples are streamed to the file without being added to the graph, entities are given
+        with the createDecentralizedSoSOntologyABox parameters
+        """
+        with SoSNTriplesSink(ntriplesPath) as triples_sink:
+            self.createDecentralizedSoSOntologyABox(triples_sink=triples_sink, **entities)
+            # TBox and update time
+            triples_sink.add(self.graph.default_context)
+        print(f'SoS Ontology saved with {triples_sink.triples_count} triples !')
 
     def exportOntology(self, aboxPath=None):
         if aboxPath is not None:
@@ -0,0 +1,88 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import copy
+
+'''
+Projection of the discipline data descriptors (DESC_IN, DESC_OUT, data in and out of configured disciplines)
+on the attributes stored in the ontology, so that their values (default DataFrames, arrays...) are not copied.
+'''
+
+# descriptor attributes read by the Parameter and ParameterUsage entities
+PARAMETER_DESCRIPTOR_KEYS = frozenset((
+    'unit',
+    'definition',
+    'definitionSource',
+    'type',
+    'ACLTag',
+    'visibility',
+    'default',
+    'dataframe_edition_locked',
+    'user_level',
+    'possible_values',
+    'range',
+    'dataframe_descriptor',
+    'structuring',
+    'optional',
+    'namespace',
+    'numerical',
+    'coupling',
+    'editable',
+    'io_type',
+    'subtype_descriptor',
+))
+
+# containers with more items are summarized
+MAX_SUMMARIZED_ITEMS = 20
+
+
+def summarize_value(value):
+    """
+    Return a small copy of a default value: scalars and small containers are kept,
+    arrays, DataFrames, large containers and other objects are replaced by a description
+    """
+    if value is None or isinstance(value, str | bytes | int | float | complex):
+        return value
+    shape = getattr(value, 'shape', None)
+    if shape is not None:
+        # numpy arrays and scalars, pandas DataFrames and Series
+        return f'<{type(value).__name__} of shape {tuple(shape)}>'
+    if isinstance(value, dict) or type(value) in (list, tuple, set, frozenset):
+        if len(value) > MAX_SUMMARIZED_ITEMS:
+            return f'<{type(value).__name__} of {len(value)} items>'
+        if isinstance(value, dict):
+            return {key: summarize_value(item) for key, item in value.items()}
+        return type(value)(summarize_value(item) for item in value)
+    return f'<{type(value).__name__}>'
+
+
+def project_descriptor(descriptor):
+    """Return the attributes of a parameter descriptor stored in the ontology, the default value is summarized"""
+    if not isinstance(descriptor, dict):
+        return copy.deepcopy(descriptor)
+    return {
+        key: summarize_value(value) if key == 'default' else copy.deepcopy(value)
+        for key, value in descriptor.items()
+        if key in PARAMETER_DESCRIPTOR_KEYS
+    }
+
+
+def project_descriptors(descriptors: dict) -> dict:
+    """Project each parameter descriptor of a DESC_IN, DESC_OUT or data in/out dict"""
+    if not isinstance(descriptors, dict):
+        return descriptors
+    return {parameter: project_descriptor(descriptor) for parameter, descriptor in descriptors.items()}
@@ -0,0 +1,148 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import csv
+
+import pandas as pd
+
+'''
+Parameters glossaries (parameters_glossary.csv) of the code repositories: each file is read row by row with
+an explicit schema, then the glossaries of all the code repositories are merged at once with pandas.
+'''
+
+PARAMETERS_GLOSSARY_FILE_NAME = 'parameters_glossary.csv'
+
+ID_COLUMN = 'id'
+REPOSITORY_COLUMN = 'repository'
+# columns of a glossary used by the extraction, values are kept as strings as written in the file (empty if missing
+# from a short row), an attribute whose column is missing from a glossary is None
+GLOSSARY_SCHEMA = {
+    ID_COLUMN: str,
+    'label': str,
+    'unit': str,
+    'definition': str,
+    'definitionSource': str,
+    'ACLTag': str,
+    'datatype': str,
+}
+ATTRIBUTE_COLUMNS = tuple(column for column in GLOSSARY_SCHEMA if column != ID_COLUMN)
+# attributes that must have the same value in all the glossaries documenting a parameter
+CONSISTENT_ATTRIBUTE_COLUMNS = ('unit', 'datatype')
+
+
+class SoSParametersGlossary:
+    """Attributes of the parameters of a glossary file, a parameter documented twice keeps its first row"""
+
+    def __init__(self) -> None:
+        # {parameter id: {attribute column: value}}
+        self.attributes = {}
+        self.duplicated_ids = []
+
+
+def read_parameters_glossary(file_path: str) -> SoSParametersGlossary:
+    """Read a glossary file row by row, undecodable characters are ignored and blank lines skipped"""
+    glossary = SoSParametersGlossary()
+    # utf-8-sig drops the byte order mark written by spreadsheet tools
+    with open(file_path, encoding='utf-8-sig', errors='ignore', newline='') as glossary_file:
+        reader = csv.reader(glossary_file)
+        header = next(reader, None)
+        if header is None or ID_COLUMN not in header:
+            raise ValueError(f'Parameters glossary {file_path} has no {ID_COLUMN} column')
+        id_index = header.index(ID_COLUMN)
+        attribute_indexes = [(column, header.index(column)) for column in ATTRIBUTE_COLUMNS if column in header]
+        missing_columns = [column for column in ATTRIBUTE_COLUMNS if column not in header]
+
+        for row in reader:
+            if len(row) == 0:
+                continue
+            parameter_id = row[id_index] if id_index < len(row) else ''
+            if parameter_id in glossary.attributes:
+                glossary.duplicated_ids.append(parameter_id)
+                continue
+            attributes = {
+                column: GLOSSARY_SCHEMA[column](row[index]) if index < len(row) else ''
+                for column, index in attribute_indexes
+            }
+            for column in missing_columns:
+                attributes[column] = None
+            glossary.attributes[parameter_id] = attributes
+    return glossary
+
+
+class SoSMergedParametersGlossaries:
+    """
+    Glossaries of several code repositories merged in one DataFrame with a row per (code repository, parameter),
+    in the order of the code repositories.
+    A parameter takes for each attribute the value of the last glossary giving one, like glossaries applied one by one.
+    """
+
+    def __init__(self, glossaries: dict[str, SoSParametersGlossary]) -> None:
+        self.glossaries = glossaries
+        columns = (REPOSITORY_COLUMN, ID_COLUMN, *ATTRIBUTE_COLUMNS)
+        self.rows = pd.DataFrame.from_records(
+            [
+                (repository_id, parameter_id, *(attributes[column] for column in ATTRIBUTE_COLUMNS))
+                for repository_id, glossary in glossaries.items()
+                for parameter_id, attributes in glossary.attributes.items()
+            ],
+            columns=columns,
+        ).astype(object)
+
+    def get_unknown_parameters(self, known_parameter_ids) -> dict:
+        """{code repository: [ids of its glossary parameters not in known_parameter_ids]}"""
+        unknown_rows = self.rows[~self.rows[ID_COLUMN].isin(known_parameter_ids)]
+        return {
+            repository_id: repository_rows[ID_COLUMN].tolist()
+            for repository_id, repository_rows in unknown_rows.groupby(REPOSITORY_COLUMN, sort=False)
+        }
+
+    def get_merged_parameters(self, known_parameter_ids) -> list[tuple[str, dict, list[str]]]:
+        """
+        (parameter id, merged attributes, code repositories of the glossaries documenting it)
+        for the parameters of known_parameter_ids, in the order they first appear in the glossaries
+        """
+        known_rows = self.rows[self.rows[ID_COLUMN].isin(known_parameter_ids)]
+        if len(known_rows) == 0:
+            return []
+        grouped_rows = known_rows.groupby(ID_COLUMN, sort=False)
+        # last non missing value of each attribute
+        attributes = grouped_rows[list(ATTRIBUTE_COLUMNS)].last()
+        attributes = attributes.astype(object).where(attributes.notna(), None)
+        repositories = grouped_rows[REPOSITORY_COLUMN].agg(list)
+        return [
+            (parameter_id, dict(zip(ATTRIBUTE_COLUMNS, attribute_values)), repositories[parameter_id])
+            for parameter_id, *attribute_values in attributes.itertuples(name=None)
+        ]
+
+    def get_conflicts(self) -> dict:
+        """
+        {parameter id: {attribute: {value: [code repositories]}}} of the parameters documented with different units
+        or datatypes by several glossaries, missing and empty values are not conflicting
+        """
+        conflicts = {}
+        for column in CONSISTENT_ATTRIBUTE_COLUMNS:
+            values = self.rows[[ID_COLUMN, column, REPOSITORY_COLUMN]]
+            values = values[values[column].notna() & (values[column] != '')]
+            values_count = values.groupby(ID_COLUMN, sort=False)[column].nunique()
+            conflicting_ids = values_count.index[values_count > 1]
+            if len(conflicting_ids) == 0:
+                continue
+            conflicting_values = values[values[ID_COLUMN].isin(conflicting_ids)]
+            repositories = conflicting_values.groupby([ID_COLUMN, column], sort=False)[REPOSITORY_COLUMN].agg(list)
+            for (parameter_id, value), repository_ids in repositories.items():
+                conflicts.setdefault(parameter_id, {}).setdefault(column, {})[value] = repository_ids
+        return conflicts
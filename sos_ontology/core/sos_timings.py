@@ -0,0 +1,79 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import heapq
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+'''
+Timing spans of the ontology creation, recorded in the logs so that they are written to ontologyCreationLogs.json:
+logs_dict['timings'][span type] is the list of the {'name', 'duration'} spans of this type, durations in seconds.
+Spans are lists so that the logs of the extraction workers are merged like the other logs.
+'''
+
+TIMINGS_LOG_CATEGORY = 'timings'
+
+PHASE_SPAN = 'phase'
+REPOSITORY_SPAN = 'repository'
+PROCESS_SPAN = 'process'
+USECASE_SPAN = 'usecase'
+FILE_PARSE_SPAN = 'fileParse'
+TRIPLES_SPAN = 'triples'
+
+# number of spans of the slowest spans table of the logs
+SLOWEST_SPANS_COUNT = 20
+
+
+def add_timing(logs_dict: dict | None, span_type: str, name: str, duration: float) -> None:
+    """Record a span of duration seconds, nothing is recorded if there are no logs"""
+    if logs_dict is None:
+        return
+    spans = logs_dict.setdefault(TIMINGS_LOG_CATEGORY, {}).setdefault(span_type, [])
+    spans.append({'name': name, 'duration': round(duration, 6)})
+
+
+@contextmanager
+def timing_span(logs_dict: dict | None, span_type: str, name: str) -> Iterator[None]:
+    """Record the wall-clock duration of the with block, also when it raises"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_timing(logs_dict, span_type, name, time.perf_counter() - start)
+
+
+def get_slowest_spans(logs_dict: dict, count: int = SLOWEST_SPANS_COUNT) -> list[tuple[str, str, float]]:
+    """(span type, name, duration) of the count slowest spans of the logs, slowest first"""
+    timings = logs_dict.get(TIMINGS_LOG_CATEGORY, {})
+    return heapq.nlargest(
+        count,
+        (
+            (span_type, span['name'], span['duration'])
+            for span_type, spans in timings.items()
+            for span in spans
+        ),
+        key=lambda span: span[2],
+    )
+
+
+def without_timings(logs_dict: dict) -> dict:
+    """Logs without their timing spans, stored in the caches since timings are only valid for one run"""
+    return {category: category_logs for category, category_logs in logs_dict.items() if category != TIMINGS_LOG_CATEGORY}
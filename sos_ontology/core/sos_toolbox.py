@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -17,6 +17,8 @@ limitations under the License.
 
 import jsonpickle
 
+from sos_ontology.core.sos_timings import get_slowest_spans
+
 
 class SimpleTableLogger:
     """Simple replacement for table-logger with basic formatting capabilities"""
@@ -394,6 +396,37 @@ class SoSToolbox:
                         )
                     tbl_log.separator()
 
+            # write info about processes and usecases stopped while configured in isolated processes
+            for category, entity, entities in (
+                ("processConfiguration", "Process", "Processes"),
+                ("usecaseConfiguration", "Usecase", "Usecases"),
+            ):
+                if category in logs_dict:
+                    nb_entity = sum(len(entity_list) for entity_list in logs_dict[category].values())
+                    short_log_file.write(
+                        bytes(
+                            f'\n - {nb_entity} {entities.lower()} stopped during configuration (timeout, memory limit or crash)',
+                            encoding='utf-8',
+                        ),
+                    )
+
+                    log_file.write(
+                        bytes(
+                            f'\n\n--------------{entities} stopped during configuration:--------------\n\n',
+                            encoding='utf-8',
+                        ),
+                    )
+
+                    tbl_log = SimpleTableLogger(
+                        columns=f'{entity},Reason,Error', file=log_file, default_colwidth=70,
+                    )
+                    for reason, entity_list in logs_dict[category].items():
+                        for entity_error_dict in entity_list:
+                            tbl_log(
+                                entity_error_dict['message'], reason, entity_error_dict.get('error', ''),
+                            )
+                    tbl_log.separator()
+
             # write info about ontology info missing
             if "ontologyInfo" in logs_dict:
                 log_file.write(
@@ -471,6 +504,37 @@ class SoSToolbox:
                     log_file=log_file,
                 )
 
+            # write info when glossaries give different units or datatypes to a parameter
+            if "glossaryConflicts" in logs_dict and logs_dict["glossaryConflicts"] != {}:
+                nb_param = len(logs_dict["glossaryConflicts"])
+                short_log_file.write(
+                    bytes(
+                        f'\n - {nb_param} parameters with different units or datatypes in glossary files',
+                        encoding='utf-8',
+                    ),
+                )
+
+                log_file.write(
+                    b"\n\n--------------Parameters with different units or datatypes in Parameter Glossary:--------------\n\n",
+                )
+                conflict_rows = [
+                    (parameter_id, attribute, value, ', '.join(repositories))
+                    for parameter_id, attributes_dict in logs_dict["glossaryConflicts"].items()
+                    for attribute, values_dict in attributes_dict.items()
+                    for value, repositories in values_dict.items()
+                ]
+                tbl_log = SimpleTableLogger(
+                    columns='Parameter,Type,Value,Code Repositories',
+                    file=log_file,
+                    colwidth={
+                        column: max([len(str(row[index])) for row in conflict_rows] + [len(column)])
+                        for index, column in enumerate(('Parameter', 'Type', 'Value', 'Code Repositories'))
+                    },
+                )
+                for conflict_row in conflict_rows:
+                    tbl_log(*conflict_row)
+                tbl_log.separator()
+
             if "parameter_does_not_exist" in logs_dict and logs_dict["parameter_does_not_exist"] != {}:
                 log_file.write(
                     b"\n\n--------------Parameters present in Parameter Glossary but do not exist in the code:--------------\n\n",
@@ -492,6 +556,22 @@ class SoSToolbox:
                     log_file=log_file,
                 )
 
+            # write the slowest phases, repositories, processes, usecases, file parses and triples creations
+            slowest_spans = get_slowest_spans(logs_dict)
+            if len(slowest_spans) > 0:
+                log_file.write(
+                    b"\n\n--------------Slowest steps of the ontology creation:--------------\n\n",
+                )
+                name_width = max([len(name) for _, name, _ in slowest_spans] + [len('Name')])
+                tbl_log = SimpleTableLogger(
+                    columns='Type,Name,Duration (s)',
+                    file=log_file,
+                    colwidth={'Name': name_width},
+                )
+                for span_type, name, duration in slowest_spans:
+                    tbl_log(span_type, name, f'{duration:.3f}')
+                tbl_log.separator()
+
         # write logs to JSON
         self.write_json(
             json_file_path=full_log_json_path,
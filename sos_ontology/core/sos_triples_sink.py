@@ -0,0 +1,100 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from rdflib.plugins.serializers.nt import NTSerializer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rdflib import Dataset
+
+'''
+Sinks consuming the triples generated during the ABox creation by chunks, so that the triples of all the entities
+are never held in Python lists at the same time. Triples are tuples whose first three items are
+the subject, predicate and object, extra items (the graph of the quads built by the create methods) are ignored.
+'''
+
+# number of triples buffered before being added to the store or written to the file
+TRIPLES_CHUNK_SIZE = 50000
+
+
+class SoSTriplesSink(ABC):
+    """Buffer triples and hand them over by chunks of chunk_size to write_chunk"""
+
+    def __init__(self, chunk_size: int = TRIPLES_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+        self.chunk = []
+        self.triples_count = 0
+
+    def add(self, triples: Iterable[tuple]) -> None:
+        for triple in triples:
+            self.chunk.append(triple)
+            if len(self.chunk) >= self.chunk_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if len(self.chunk) > 0:
+            self.write_chunk(self.chunk)
+            self.triples_count += len(self.chunk)
+            self.chunk = []
+
+    @abstractmethod
+    def write_chunk(self, chunk: list[tuple]) -> None:
+        """Write a chunk of triples, called by flush"""
+
+
+class SoSGraphTriplesSink(SoSTriplesSink):
+    """Add the triples to the default graph of an rdflib Dataset"""
+
+    def __init__(self, graph: Dataset, chunk_size: int = TRIPLES_CHUNK_SIZE) -> None:
+        super().__init__(chunk_size)
+        self.graph = graph
+
+    def write_chunk(self, chunk: list[tuple]) -> None:
+        # Dataset.addN requires (subject, predicate, object, graph) quads
+        default_context = self.graph.default_context
+        self.graph.addN((triple[0], triple[1], triple[2], default_context) for triple in chunk)
+
+
+class SoSNTriplesSink(SoSTriplesSink):
+    """
+    Write the triples to an N-Triples file without keeping them in a graph, only the current chunk is in memory.
+    A triple generated twice is written twice, which does not change the graph read from the file.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = TRIPLES_CHUNK_SIZE) -> None:
+        super().__init__(chunk_size)
+        self.file_path = file_path
+        # closed by close, the sink is used as a context manager
+        self.file = open(file_path, 'wb')  # noqa: SIM115
+
+    def write_chunk(self, chunk: list[tuple]) -> None:
+        # the serializer only iterates over its store and reads the first three items of each triple
+        NTSerializer(chunk).serialize(self.file)
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+    def __enter__(self) -> SoSNTriplesSink:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,86 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rdflib import URIRef
+
+if TYPE_CHECKING:
+    from rdflib import Graph
+
+'''
+Registry of the URIs used in each namespace of an ontology, so that new URIs are allocated without
+looking up the graph for each entity. URIs are allocated like a probe of the graph would do: the base name if
+it is free, otherwise the base name followed by the first free _1, _2... suffix.
+'''
+
+
+class SoSNamespaceURIs:
+    """Local names used in a namespace and the suffix of the last URI allocated for each base name"""
+
+    def __init__(self) -> None:
+        self.used_names = set()
+        # {base name: last suffix allocated}, names with smaller suffixes are all used
+        self.collision_counters = {}
+
+
+class SoSURIRegistry:
+    """
+    URIs used in each namespace: the subjects of the graph, read once per namespace, and the URIs allocated so far.
+    Subjects added to the graph by other means than allocate after the namespace was read are only taken
+    into account once reload_graph_subjects is called.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self.graph = graph
+        # {namespace: SoSNamespaceURIs}
+        self.namespaces = {}
+        # namespaces whose names include the current subjects of the graph
+        self.read_namespaces = set()
+
+    def reload_graph_subjects(self) -> None:
+        """Read the subjects of the graph again on the next allocation in each namespace (after a graph is loaded)"""
+        self.read_namespaces.clear()
+
+    def get_namespace_uris(self, namespace: str) -> SoSNamespaceURIs:
+        namespace_uris = self.namespaces.get(namespace)
+        if namespace_uris is None:
+            namespace_uris = SoSNamespaceURIs()
+            self.namespaces[namespace] = namespace_uris
+        if namespace not in self.read_namespaces:
+            namespace_length = len(namespace)
+            namespace_uris.used_names.update(
+                str(subject)[namespace_length:]
+                for subject in self.graph.subjects(unique=True)
+                if isinstance(subject, URIRef) and subject.startswith(namespace)
+            )
+            self.read_namespaces.add(namespace)
+        return namespace_uris
+
+    def allocate(self, namespace: str, base_name: str) -> URIRef:
+        """Return a URI of namespace not used yet, base_name or base_name with the first free _<number> suffix"""
+        namespace_uris = self.get_namespace_uris(str(namespace))
+        used_names = namespace_uris.used_names
+        name = base_name
+        if name in used_names:
+            counter = namespace_uris.collision_counters.get(base_name, 0) + 1
+            while f'{base_name}_{counter}' in used_names:
+                counter += 1
+            namespace_uris.collision_counters[base_name] = counter
+            name = f'{base_name}_{counter}'
+        used_names.add(name)
+        return URIRef(namespace + name)
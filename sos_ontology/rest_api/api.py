@@ -1,6 +1,6 @@
 '''
 Copyright 2022 Airbus SAS
-Modifications on 2024/06/07-2024/07/16 Copyright 2024 Capgemini
+Modifications on 2024/06/07-2026/10/19 Copyright 2026 Capgemini
 Licensed under the Apache License, Version 2.0 (the "License");
 you may not use this file except in compliance with the License.
 You may obtain a copy of the License at
@@ -15,16 +15,22 @@ limitations under the License.
 
 '''
 
+import hmac
 import logging
 import os
 import tempfile
 import time
 
-from flask import Flask, jsonify, make_response, request, send_file, session
-from werkzeug.exceptions import BadRequest
+from flask import Flask, g, jsonify, make_response, request, send_file
+from werkzeug.exceptions import BadRequest, Forbidden, NotFound
 
 from sos_ontology.core.sos_ontology import SoSOntology
-from sos_ontology.rest_api.utils import copy_file
+from sos_ontology.rest_api.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY,
+    RequestMetrics,
+)
+from sos_ontology.rest_api.utils import EndpointSamplingProfiler, copy_file
 
 
 def random_string_for_secret_key():
@@ -93,7 +99,34 @@ logging._srcfile = None
 logging.logThreads = 0
 logging.logProcesses = 0
 
-START_TIME = 'start_time'
+# HTTP metrics collected in process and exposed on /metrics
+request_metrics = RequestMetrics(REGISTRY)
+UNMATCHED_ROUTE = 'unmatched'
+
+# On-demand cProfile sampling of routes, administration routes are disabled if no admin token is set
+profiling_folder = os.path.join(temp_folder, 'profiling')
+os.makedirs(profiling_folder, exist_ok=True)
+endpoint_profiler = EndpointSamplingProfiler(profiling_folder)
+ADMIN_TOKEN_ENV_VAR = 'ONTOLOGY_ADMIN_TOKEN'
+ADMIN_TOKEN_HEADER = 'X-Admin-Token'
+
+
+def get_request_route():
+    """Return the route rule of the current request, used as metrics label to keep a bounded cardinality"""
+    if request.url_rule is not None:
+        return request.url_rule.rule
+    return UNMATCHED_ROUTE
+
+
+def check_admin_token():
+    """Raise Forbidden if the request does not carry the admin token set in the environment"""
+    admin_token = os.environ.get(ADMIN_TOKEN_ENV_VAR)
+    if not admin_token:
+        raise Forbidden(f'Administration routes are disabled, set {ADMIN_TOKEN_ENV_VAR} to enable them')
+    # constant time comparison, the time taken does not tell how many leading characters are right
+    request_token = request.headers.get(ADMIN_TOKEN_HEADER, '')
+    if not hmac.compare_digest(request_token.encode('utf-8'), admin_token.encode('utf-8')):
+        raise Forbidden(f'Missing or invalid {ADMIN_TOKEN_HEADER} header')
 
 
 @app.route('/api/ontology/v1/general_information', methods=['GET'])
@@ -638,18 +671,98 @@ def ping():
     return make_response(jsonify('pong'), 200)
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Expose the metrics collected in process in Prometheus text format"""
+    resp = make_response(REGISTRY.render(), 200)
+    resp.headers['Content-Type'] = PROMETHEUS_CONTENT_TYPE
+    return resp
+
+
+@app.route('/api/ontology/admin/profiling', methods=['GET'])
+def get_profiling_status():
+    """Return the sampling configuration and number of profiled requests per route"""
+    check_admin_token()
+    return make_response(jsonify(endpoint_profiler.status()), 200)
+
+
+@app.route('/api/ontology/admin/profiling', methods=['POST'])
+def enable_profiling():
+    """
+    Enable the cProfile sampling of a route
+
+    Request object is intended with the following data structure
+        {
+            route: string, (route rule as declared in the API, ex: '/api/ontology/n2')
+            request_count: integer, (profile the next N requests)
+            percentage: float, (or profile a percentage of the requests)
+        }
+    """
+    check_admin_token()
+    data_request = request.json
+    if data_request is None or 'route' not in data_request:
+        raise BadRequest('Missing mandatory parameter: route')
+    try:
+        profiling_status = endpoint_profiler.enable(
+            data_request['route'],
+            request_count=data_request.get('request_count'),
+            percentage=data_request.get('percentage'),
+        )
+    except ValueError as e:
+        raise BadRequest(str(e))
+    return make_response(jsonify(profiling_status), 200)
+
+
+@app.route('/api/ontology/admin/profiling', methods=['DELETE'])
+def disable_profiling():
+    """Disable the sampling of the route given as argument (all routes if none) and drop its stats"""
+    check_admin_token()
+    return make_response(jsonify(endpoint_profiler.disable(request.args.get('route'))), 200)
+
+
+@app.route('/api/ontology/admin/profiling/download', methods=['GET'])
+def download_profiling_stats():
+    """Return the aggregated pstats file of the route given as argument, to be read with pstats or snakeviz"""
+    check_admin_token()
+    route = request.args.get('route')
+    if route is None:
+        raise BadRequest('Missing mandatory parameter: route')
+    path = endpoint_profiler.dump_stats(route)
+    if path is None:
+        raise NotFound(f'No profiled request for route {route}')
+    return send_file(path, as_attachment=True)
+
+
 @app.before_request
 def before_request():
-    """Store time for after request handler to log information"""
-    session[START_TIME] = time.time()
+    """Store time in the request context for after request handler to log information"""
+    g.start_time = time.perf_counter()
+    g.route = get_request_route()
+    request_metrics.request_started(g.route)
+    g.profiler = endpoint_profiler.start(g.route)
 
 
 @app.after_request
 def after_request(response):
-    """After request handler to log information"""
+    """After request handler to log information and record request metrics"""
+    stop_request_profiler()
     duration = 0
-    if START_TIME in session:
-        duration = time.time() - session[START_TIME]
+    if 'start_time' in g:
+        duration = time.perf_counter() - g.start_time
+
+    # streamed responses (file download) have no computable length, fall back to the header
+    response_size = response.calculate_content_length()
+    if response_size is None:
+        response_size = response.content_length or 0
+
+    request_metrics.observe(
+        route=g.get('route', get_request_route()),
+        method=request.method,
+        status=response.status_code,
+        duration=duration,
+        request_size=request.content_length or 0,
+        response_size=response_size,
+    )
 
     app.logger.info(
         f'{request.remote_addr}, {request.method}, {request.scheme}, {request.full_path}, {response.status}, {duration} sec.',
@@ -657,5 +770,20 @@ def after_request(response):
     return response
 
 
+def stop_request_profiler():
+    """Stop the profiler of the current request if it has been sampled"""
+    profiler = g.pop('profiler', None)
+    if profiler is not None:
+        endpoint_profiler.stop(g.route, profiler)
+
+
+@app.teardown_request
+def teardown_request(exception):
+    """Teardown handler, always called, even when the request ends with an unhandled error"""
+    stop_request_profiler()
+    if 'route' in g:
+        request_metrics.request_finished(g.route)
+
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5555)
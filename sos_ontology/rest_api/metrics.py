@@ -0,0 +1,247 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# latency buckets (in seconds) used for the request duration histograms
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+def _escape_label_value(value) -> str:
+    """Escape a label value following the Prometheus text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_names, label_values, extra=None) -> str:
+    pairs = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    ]
+    if extra is not None:
+        pairs.extend(f'{name}="{_escape_label_value(value)}"' for name, value in extra)
+    if len(pairs) == 0:
+        return ''
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class of the in-process metrics, one value per label set"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, label_names=()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels.get(name, '') for name in self.label_names)
+
+    def samples(self):
+        """Return the list of (name, label string, value) exposed for this metric"""
+        with self._lock:
+            return [
+                (self.name, _format_labels(self.label_names, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+    def render(self) -> list[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.metric_type}',
+        ]
+        lines.extend(
+            f'{name}{labels} {_format_value(value)}'
+            for name, labels, value in self.samples()
+        )
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(Metric):
+    """Monotonic counter"""
+
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down (in-flight requests...)"""
+
+    metric_type = 'gauge'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Histogram(Metric):
+    """Cumulative histogram with fixed buckets, exposed with _bucket, _sum and _count series"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names=(), buckets=DEFAULT_LATENCY_BUCKETS) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            bucket_counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            # last slot is the +Inf bucket
+            bucket_counts[bisect_left(self.buckets, value)] += 1
+            self._values[key] = (bucket_counts, total + value)
+
+    def get_count(self, **labels) -> int:
+        with self._lock:
+            bucket_counts, _ = self._values.get(self._key(labels), ([0], 0.0))
+            return sum(bucket_counts)
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (bucket_counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for upper_bound, count in zip((*self.buckets, float('inf')), bucket_counts):
+                    cumulative += count
+                    samples.append(
+                        (
+                            f'{self.name}_bucket',
+                            _format_labels(self.label_names, key, [('le', _format_value(float(upper_bound)))]),
+                            cumulative,
+                        ),
+                    )
+                labels = _format_labels(self.label_names, key)
+                samples.append((f'{self.name}_sum', labels, total))
+                samples.append((f'{self.name}_count', labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Registry of the metrics collected in process and rendered in Prometheus text format"""
+
+    def __init__(self, prefix: str = '') -> None:
+        self.prefix = prefix
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_class, name, documentation, label_names=(), **kwargs):
+        full_name = f'{self.prefix}{name}'
+        with self._lock:
+            if full_name not in self._metrics:
+                self._metrics[full_name] = metric_class(full_name, documentation, label_names, **kwargs)
+            return self._metrics[full_name]
+
+    def counter(self, name: str, documentation: str, label_names=()) -> Counter:
+        return self._register(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names=()) -> Gauge:
+        return self._register(Gauge, name, documentation, label_names)
+
+    def histogram(self, name: str, documentation: str, label_names=(), buckets=DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def render(self) -> str:
+        """Render all registered metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+class RequestMetrics:
+    """Set of HTTP metrics recorded around each request of the API"""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.registry = registry
+        self.requests_total = registry.counter(
+            'http_requests_total', 'Number of HTTP requests by route, method and status', ('route', 'method', 'status'),
+        )
+        self.request_duration = registry.histogram(
+            'http_request_duration_seconds', 'HTTP request latency by route and method', ('route', 'method'),
+        )
+        self.request_size = registry.counter(
+            'http_request_size_bytes_total', 'Cumulated size of HTTP request bodies by route', ('route', 'method'),
+        )
+        self.response_size = registry.counter(
+            'http_response_size_bytes_total', 'Cumulated size of HTTP response bodies by route', ('route', 'method'),
+        )
+        self.in_flight = registry.gauge(
+            'http_requests_in_flight', 'Number of HTTP requests currently being processed', ('route',),
+        )
+
+    def request_started(self, route: str) -> None:
+        self.in_flight.inc(route=route)
+
+    def request_finished(self, route: str) -> None:
+        self.in_flight.dec(route=route)
+
+    def observe(self, route: str, method: str, status: int, duration: float, request_size: int, response_size: int) -> None:
+        self.requests_total.inc(route=route, method=method, status=status)
+        self.request_duration.observe(duration, route=route, method=method)
+        self.request_size.inc(request_size, route=route, method=method)
+        self.response_size.inc(response_size, route=route, method=method)
+
+
+# registry shared by the whole process
+REGISTRY = MetricsRegistry(prefix='sos_ontology_')
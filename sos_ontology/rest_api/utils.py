@@ -18,6 +18,10 @@ from __future__ import annotations
 import cProfile
 import io
 import pstats
+import random
+import re
+import threading
+from os.path import join
 from time import time
 from typing import TYPE_CHECKING
 
@@ -74,3 +78,113 @@ def cprofile_function(logger: logging.Logger | None = None):
         return wrapper_function
 
     return inner
+
+
+class EndpointSamplingProfiler:
+    """
+    Runtime controllable cProfile sampling of API routes.
+
+    Sampling is enabled per route either for the next N requests or for a percentage of the traffic.
+    The profiles of the sampled requests are aggregated per route in a pstats.Stats that can be dumped
+    to a file and downloaded.
+    Only one request is profiled at a time because cProfile does not support several active profilers.
+    """
+
+    def __init__(self, output_folder: str):
+        self.output_folder = output_folder
+        self._sampling_config = {}
+        self._stats = {}
+        self._profiled_requests = {}
+        self._lock = threading.Lock()
+        self._profiling_lock = threading.Lock()
+
+    def enable(self, route: str, request_count: int | None = None, percentage: float | None = None) -> dict:
+        """Enable the sampling of a route for the next request_count requests or for a percentage of the traffic"""
+        if (request_count is None) == (percentage is None):
+            raise ValueError('Exactly one of request_count or percentage must be given')
+        if request_count is not None and (not isinstance(request_count, int) or request_count <= 0):
+            raise ValueError(f'request_count must be a strictly positive integer, received {request_count}')
+        if percentage is not None and (not isinstance(percentage, int | float) or not 0 < percentage <= 100):
+            raise ValueError(f'percentage must be in ]0, 100], received {percentage}')
+        with self._lock:
+            self._sampling_config[route] = {
+                'remaining_requests': request_count,
+                'percentage': percentage,
+            }
+        return self.status()
+
+    def disable(self, route: str | None = None) -> dict:
+        """Disable the sampling of a route (all routes if None) and drop the aggregated stats"""
+        with self._lock:
+            routes = list(self._sampling_config.keys() | self._stats.keys()) if route is None else [route]
+            for route_to_disable in routes:
+                self._sampling_config.pop(route_to_disable, None)
+                self._stats.pop(route_to_disable, None)
+                self._profiled_requests.pop(route_to_disable, None)
+        return self.status()
+
+    def status(self) -> dict:
+        """Return the sampling configuration and the number of profiled requests per route"""
+        with self._lock:
+            routes = sorted(self._sampling_config.keys() | self._profiled_requests.keys())
+            return {
+                route: {
+                    'active': self._is_active(route),
+                    'remaining_requests': self._sampling_config.get(route, {}).get('remaining_requests'),
+                    'percentage': self._sampling_config.get(route, {}).get('percentage'),
+                    'profiled_requests': self._profiled_requests.get(route, 0),
+                }
+                for route in routes
+            }
+
+    def _is_active(self, route: str) -> bool:
+        config = self._sampling_config.get(route)
+        if config is None:
+            return False
+        return config['percentage'] is not None or config['remaining_requests'] > 0
+
+    def start(self, route: str) -> cProfile.Profile | None:
+        """Decide if the current request of the route is sampled and if so start and return its profiler"""
+        with self._lock:
+            if not self._is_active(route):
+                return None
+            config = self._sampling_config[route]
+            if config['percentage'] is not None and random.random() * 100 >= config['percentage']:
+                return None
+            # a request already profiled in another thread, this one is not sampled
+            if not self._profiling_lock.acquire(blocking=False):
+                return None
+            if config['remaining_requests'] is not None:
+                config['remaining_requests'] -= 1
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # another profiling tool is already active
+            self._profiling_lock.release()
+            return None
+        return profiler
+
+    def stop(self, route: str, profiler: cProfile.Profile) -> None:
+        """Stop the profiler of a sampled request and aggregate its stats with the previous ones of the route"""
+        try:
+            profiler.disable()
+        finally:
+            self._profiling_lock.release()
+        with self._lock:
+            if route in self._stats:
+                self._stats[route].add(profiler)
+            else:
+                self._stats[route] = pstats.Stats(profiler)
+            self._profiled_requests[route] = self._profiled_requests.get(route, 0) + 1
+
+    def dump_stats(self, route: str) -> str | None:
+        """Dump the aggregated stats of a route in a pstats file and return its path (None if nothing was profiled)"""
+        with self._lock:
+            stats = self._stats.get(route)
+            if stats is None:
+                return None
+            file_path = join(self.output_folder, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', route).strip('_')}.prof")
+            stats.dump_stats(file_path)
+        return file_path
@@ -0,0 +1,204 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from os import environ
+from os.path import dirname, join
+
+from sos_ontology.core.functions.synthetic_ontology import SyntheticOntologyGenerator
+from sos_ontology.core.sos_ontology import SoSOntology
+
+'''
+Benchmark of the SoSOntology read methods on synthetic ontologies of several sizes.
+Timings and peak memory are stored as json and compared against a committed baseline:
+
+    python -m sos_ontology.tests.benchmark_sos_ontology --output results.json
+    python -m sos_ontology.tests.benchmark_sos_ontology --update-baseline
+
+The file is not collected by pytest (only l0*.py files are), run it explicitly.
+'''
+
+BASELINE_PATH = join(dirname(__file__), 'data', 'benchmark_baseline.json')
+DEFAULT_SCALES = (0.5, 1.0, 2.0)
+# relative slowdown allowed before reporting a regression
+DEFAULT_TOLERANCE = 0.5
+# differences under these thresholds are considered as noise whatever the ratio
+MIN_SECONDS_DELTA = 0.005
+MIN_MEMORY_DELTA = 256 * 1024
+
+BENCHMARKED_METHODS = {
+    'get_full_parameter_list': lambda ontology, requests: ontology.get_full_parameter_list(),
+    'get_full_process_list': lambda ontology, requests: ontology.get_full_process_list(),
+    'get_full_discipline_list': lambda ontology, requests: ontology.get_full_discipline_list(),
+    'get_models_status': lambda ontology, requests: ontology.get_models_status(),
+    'get_models_list_filtered': lambda ontology, requests: ontology.get_models_list_filtered(
+        requests['linked_process_dict'],
+    ),
+    'get_study_ontology_data': lambda ontology, requests: ontology.get_study_ontology_data(
+        requests['parameter_usages'],
+    ),
+    'get_n2_matrix': lambda ontology, requests: ontology.get_n2_matrix(requests['n2_treeview']),
+    'get_general_information': lambda ontology, requests: ontology.get_general_information(),
+}
+
+
+def load_synthetic_ontology(scale: float, seed: int, output_folder: str):
+    """Generate, export and reload from file a synthetic ontology, as done by the API"""
+    generator = SyntheticOntologyGenerator.scaled(scale, seed=seed).generate()
+    generator.export(output_folder, with_companion_files=False)
+    previous_folder = environ.get('ONTOLOGY_FOLDER')
+    environ['ONTOLOGY_FOLDER'] = output_folder
+    try:
+        start = time.perf_counter()
+        ontology = SoSOntology()
+        load_seconds = time.perf_counter() - start
+    finally:
+        if previous_folder is None:
+            environ.pop('ONTOLOGY_FOLDER')
+        else:
+            environ['ONTOLOGY_FOLDER'] = previous_folder
+    return ontology, generator, load_seconds
+
+
+def benchmark_method(method, ontology, requests, repeat: int) -> dict:
+    """Time a read method repeat times, then measure its peak memory in a separate traced run"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        method(ontology, requests)
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        method(ontology, requests)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_seconds': min(durations),
+        'mean_seconds': sum(durations) / len(durations),
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def run_benchmark(scales=DEFAULT_SCALES, repeat: int = 3, seed: int = 0, methods=None) -> dict:
+    """Run the benchmark for all scales and return the results as a json serializable dict"""
+    methods = methods or list(BENCHMARKED_METHODS)
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'scales': {},
+    }
+    for scale in scales:
+        output_folder = tempfile.mkdtemp(prefix='ontology_benchmark_')
+        try:
+            ontology, generator, load_seconds = load_synthetic_ontology(scale, seed, output_folder)
+            requests = generator.build_requests()
+            scale_results = {
+                'triples': len(ontology.graph),
+                'entities': generator.entities_count(),
+                'load_seconds': load_seconds,
+                'methods': {},
+            }
+            for method_name in methods:
+                scale_results['methods'][method_name] = benchmark_method(
+                    BENCHMARKED_METHODS[method_name], ontology, requests, repeat,
+                )
+                print(
+                    f'scale {scale} - {method_name}: '
+                    f'{scale_results["methods"][method_name]["min_seconds"]:.4f} s, '
+                    f'{scale_results["methods"][method_name]["peak_memory_bytes"] / 1024 / 1024:.2f} MiB',
+                )
+            results['scales'][str(scale)] = scale_results
+        finally:
+            shutil.rmtree(output_folder, ignore_errors=True)
+    return results
+
+
+def compare_results(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Return the list of regressions of results compared to baseline, measures missing in the baseline are skipped"""
+    regressions = []
+    for scale, scale_results in results['scales'].items():
+        baseline_methods = baseline.get('scales', {}).get(scale, {}).get('methods', {})
+        for method_name, measures in scale_results['methods'].items():
+            baseline_measures = baseline_methods.get(method_name)
+            if baseline_measures is None:
+                continue
+            for measure, min_delta in (('min_seconds', MIN_SECONDS_DELTA), ('peak_memory_bytes', MIN_MEMORY_DELTA)):
+                value = measures[measure]
+                reference = baseline_measures[measure]
+                if value > reference * (1 + tolerance) and value - reference > min_delta:
+                    regressions.append(
+                        f'scale {scale} - {method_name} - {measure}: {value:.4g} > {reference:.4g} (+{100 * (value / reference - 1):.0f}%)',
+                    )
+    return regressions
+
+
+def main(args=None):
+    """Command line entry point, returns the exit code (1 if regressions are found)"""
+    parser = argparse.ArgumentParser(description='Benchmark SoSOntology read methods on synthetic ontologies')
+    parser.add_argument('--scales', type=float, nargs='+', default=list(DEFAULT_SCALES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--methods', nargs='+', choices=list(BENCHMARKED_METHODS), default=None)
+    parser.add_argument('--output', help='json file where the results are written')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline json file to compare the results with')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='allowed relative slowdown')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline')
+    parsed_args = parser.parse_args(args)
+
+    results = run_benchmark(parsed_args.scales, parsed_args.repeat, parsed_args.seed, parsed_args.methods)
+
+    if parsed_args.output is not None:
+        with open(parsed_args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=4)
+
+    if parsed_args.update_baseline:
+        with open(parsed_args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=4)
+        print(f'Baseline written in {parsed_args.baseline}')
+        return 0
+
+    try:
+        with open(parsed_args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    except FileNotFoundError:
+        print(f'No baseline found at {parsed_args.baseline}, nothing to compare')
+        return 0
+
+    regressions = compare_results(results, baseline, parsed_args.tolerance)
+    if len(regressions) > 0:
+        print('Regressions compared to baseline:')
+        for regression in regressions:
+            print(f'  {regression}')
+        return 1
+    print('No regression compared to baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from sos_ontology.rest_api.utils import EndpointSamplingProfiler
+
+
+class TestEndpointSamplingProfiler(unittest.TestCase):
+    """On-demand route profiler test class"""
+
+    def setUp(self):
+        self.output_folder = tempfile.mkdtemp(prefix='profiler_test_')
+        self.profiler = EndpointSamplingProfiler(self.output_folder)
+        self.route = '/api/ontology/n2'
+
+    def tearDown(self):
+        shutil.rmtree(self.output_folder, ignore_errors=True)
+
+    def _profiled_request(self, route):
+        request_profiler = self.profiler.start(route)
+        sum(i * i for i in range(1000))
+        if request_profiler is not None:
+            self.profiler.stop(route, request_profiler)
+        return request_profiler is not None
+
+    def test_01_request_count_sampling(self):
+        self.assertFalse(self._profiled_request(self.route))
+        self.profiler.enable(self.route, request_count=2)
+        sampled = [self._profiled_request(self.route) for _ in range(4)]
+        self.assertEqual(sampled, [True, True, False, False])
+        self.assertFalse(self._profiled_request('/api/ping'))
+
+        status = self.profiler.status()[self.route]
+        self.assertFalse(status['active'])
+        self.assertEqual(status['profiled_requests'], 2)
+
+        stats_file = self.profiler.dump_stats(self.route)
+        self.assertTrue(stats_file.endswith('api_ontology_n2.prof'))
+        self.assertGreater(pstats.Stats(stats_file).total_calls, 0)
+
+    def test_02_percentage_sampling_and_disable(self):
+        self.profiler.enable(self.route, percentage=100)
+        self.assertTrue(all(self._profiled_request(self.route) for _ in range(3)))
+        self.profiler.disable(self.route)
+        self.assertFalse(self._profiled_request(self.route))
+        self.assertIsNone(self.profiler.dump_stats(self.route))
+
+    def test_03_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            self.profiler.enable(self.route)
+        with self.assertRaises(ValueError):
+            self.profiler.enable(self.route, request_count=1, percentage=10)
+        with self.assertRaises(ValueError):
+            self.profiler.enable(self.route, percentage=150)
+
+    def test_04_admin_token(self):
+        # imported here because importing the api loads the ontology
+        from sos_ontology.rest_api.api import (
+            ADMIN_TOKEN_ENV_VAR,
+            ADMIN_TOKEN_HEADER,
+            app,
+        )
+
+        client = app.test_client()
+        route = '/api/ontology/admin/profiling'
+        with mock.patch.dict(os.environ, {ADMIN_TOKEN_ENV_VAR: ''}):
+            self.assertEqual(client.get(route, headers={ADMIN_TOKEN_HEADER: ''}).status_code, 403)
+        with mock.patch.dict(os.environ, {ADMIN_TOKEN_ENV_VAR: 'secret'}):
+            self.assertEqual(client.get(route).status_code, 403)
+            for token in ('secre', 'secret2', 'sécret'):
+                self.assertEqual(client.get(route, headers={ADMIN_TOKEN_HEADER: token}).status_code, 403)
+            self.assertEqual(client.get(route, headers={ADMIN_TOKEN_HEADER: 'secret'}).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+from sos_ontology.rest_api.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsRegistry,
+    RequestMetrics,
+)
+
+
+class TestMetrics(unittest.TestCase):
+    """Metrics registry and Prometheus rendering test class"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry(prefix='test_')
+
+    def test_01_histogram_rendering(self):
+        histogram = self.registry.histogram('latency_seconds', 'Latency', ('route',), buckets=(0.1, 1.0))
+        histogram.observe(0.05, route='/a')
+        histogram.observe(0.5, route='/a')
+        histogram.observe(5.0, route='/a')
+
+        rendered = self.registry.render()
+        self.assertIn('# TYPE test_latency_seconds histogram', rendered)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="0.1"} 1', rendered)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="1"} 2', rendered)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="+Inf"} 3', rendered)
+        self.assertIn('test_latency_seconds_count{route="/a"} 3', rendered)
+        self.assertIn('test_latency_seconds_sum{route="/a"} 5.55', rendered)
+
+    def test_02_request_metrics(self):
+        request_metrics = RequestMetrics(self.registry)
+        request_metrics.request_started('/api/ping')
+        self.assertEqual(request_metrics.in_flight.get(route='/api/ping'), 1)
+        request_metrics.observe('/api/ping', 'GET', 200, 0.01, 0, 6)
+        request_metrics.request_finished('/api/ping')
+        self.assertEqual(request_metrics.in_flight.get(route='/api/ping'), 0)
+
+        rendered = self.registry.render()
+        self.assertIn('test_http_requests_total{route="/api/ping",method="GET",status="200"} 1', rendered)
+        self.assertIn('test_http_response_size_bytes_total{route="/api/ping",method="GET"} 6', rendered)
+
+    def test_03_label_escaping(self):
+        counter = self.registry.counter('events_total', 'Events', ('name',))
+        counter.inc(name='a "quoted"\nvalue')
+        self.assertIn('test_events_total{name="a \\"quoted\\"\\nvalue"} 1', self.registry.render())
+
+    def test_04_api_metrics_route(self):
+        # imported here because importing the api loads the ontology
+        from sos_ontology.rest_api.api import app
+
+        client = app.test_client()
+        for route in ('/api/ping', '/api/ontology/v1/general_information'):
+            response = client.get(route)
+            self.assertEqual(response.status_code, 200)
+            # request timing is not stored in the session anymore, no session cookie is set
+            self.assertNotIn('Set-Cookie', response.headers)
+        self.assertEqual(client.get('/api/unknown').status_code, 404)
+
+        response = client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], PROMETHEUS_CONTENT_TYPE)
+        self.assertNotIn('Set-Cookie', response.headers)
+        rendered = response.get_data(as_text=True)
+        self.assertIn('# TYPE sos_ontology_http_request_duration_seconds histogram', rendered)
+        self.assertIn('sos_ontology_http_requests_total{route="/api/ping",method="GET",status="200"}', rendered)
+        self.assertIn('sos_ontology_http_requests_total{route="unmatched",method="GET",status="404"}', rendered)
+        self.assertIn('sos_ontology_http_request_duration_seconds_count{route="/api/ping",method="GET"}', rendered)
+        # the /metrics request itself is in flight while the metrics are rendered
+        self.assertIn('sos_ontology_http_requests_in_flight{route="/api/ping"} 0', rendered)
+        self.assertIn('sos_ontology_http_requests_in_flight{route="/metrics"} 1', rendered)
+
+
+if __name__ == '__main__':
+    unittest.main()
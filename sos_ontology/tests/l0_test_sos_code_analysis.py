@@ -0,0 +1,153 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from importlib import import_module
+from os.path import join
+
+from sos_ontology.core.sos_code_analysis import (
+    CLASSES,
+    DISCIPLINE_ATTRIBUTES,
+    IMPORTS,
+    SoSClassHierarchyResolver,
+    SoSFileAnalysis,
+)
+
+DISCIPLINE_CODE = '''
+import numpy as np
+from sostrades_core.execution_engine.sos_wrapp import SoSWrapp as Wrapp
+
+
+class MyDiscipline(Wrapp):
+    _ontology_data = {'label': 'My discipline'}
+    _maturity = 'Fake'
+    DESC_IN = {'x': {'type': 'float'}}
+    DESC_OUT = {'y': {'type': 'float'}}
+'''
+
+HIERARCHY_PACKAGE = {
+    '__init__.py': 'from .wrapp import *\n',
+    'wrapp.py': "__all__ = ['SoSWrapp']\n\n\nclass SoSWrapp:\n    pass\n",
+    join('models', '__init__.py'): '',
+    join('models', 'mixin.py'): 'class Mixin:\n    pass\n\n\nclass ErrorMixin(Mixin, ValueError):\n    pass\n',
+    join('models', 'discipline.py'): (
+        'from .. import SoSWrapp as Wrapp\n'
+        'from . import mixin\n\n'
+        'DynamicBase = type("DynamicBase", (), {})\n'
+        'Alias = Wrapp\n\n\n'
+        'class Discipline(mixin.Mixin, Alias):\n    pass\n\n\n'
+        'class DynamicDiscipline(DynamicBase):\n    pass\n\n\n'
+        'def rename(cls):\n    return cls\n\n\n'
+        '@rename\nclass Decorated(Wrapp):\n    pass\n'
+    ),
+}
+
+
+class TestSoSCodeAnalysis(unittest.TestCase):
+    """Single parse analysis of the scanned Python files test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def write_file(self, code):
+        file = join(self.folder, 'discipline.py')
+        with open(file, 'w', encoding='utf-8') as python_file:
+            python_file.write(code)
+        return file
+
+    def test_01_discipline_file(self):
+        analysis = SoSFileAnalysis(self.write_file(DISCIPLINE_CODE))
+
+        self.assertEqual(analysis.classes, [{'name': 'MyDiscipline', 'type': ['Wrapp']}])
+        self.assertEqual(
+            analysis.imports,
+            {
+                'np': {'module': None, 'name': 'numpy'},
+                'Wrapp': {'module': 'sostrades_core.execution_engine.sos_wrapp', 'name': 'SoSWrapp'},
+            },
+        )
+        self.assertEqual(
+            analysis.get_discipline_attributes(),
+            ({'label': 'My discipline'}, 'Fake', {'x': {'type': 'float'}}, {'y': {'type': 'float'}}),
+        )
+        self.assertEqual(analysis.errors, {CLASSES: [], IMPORTS: [], DISCIPLINE_ATTRIBUTES: []})
+
+    def test_02_partial_parsing_errors(self):
+        code = DISCIPLINE_CODE.replace(
+            "DESC_IN = {'x': {'type': 'float'}}", "DESC_IN = {'x': {'type': get_type()}}",
+        ) + '\n\nclass Typed(Generic[T]):\n    pass\n'
+        analysis = SoSFileAnalysis(self.write_file(code))
+
+        # a subscripted base makes the whole class list unavailable
+        self.assertEqual(analysis.classes, [])
+        self.assertEqual([error[0] for error in analysis.errors[CLASSES]], ['parsingClassList'])
+        # a non literal DESC_IN is skipped but the other attributes are kept
+        self.assertEqual(analysis.get_discipline_attributes()[2], {})
+        self.assertEqual(analysis.get_discipline_attributes()[3], {'y': {'type': 'float'}})
+        self.assertEqual(
+            [error[1] for error in analysis.errors[DISCIPLINE_ATTRIBUTES]], ['Impossible to parse DESC_IN from'],
+        )
+
+    def test_03_syntax_error(self):
+        analysis = SoSFileAnalysis(self.write_file('class Broken(:\n'))
+
+        self.assertEqual(analysis.classes, [])
+        self.assertEqual(analysis.imports, {})
+        for information in (CLASSES, IMPORTS, DISCIPLINE_ATTRIBUTES):
+            self.assertEqual(len(analysis.errors[information]), 1)
+            self.assertIsInstance(analysis.errors[information][0][2], SyntaxError)
+
+    def test_04_static_class_hierarchy(self):
+        package_name = 'hierarchy_test_package'
+        for file, code in HIERARCHY_PACKAGE.items():
+            os.makedirs(join(self.folder, package_name, os.path.dirname(file)), exist_ok=True)
+            with open(join(self.folder, package_name, file), 'w', encoding='utf-8') as python_file:
+                python_file.write(code)
+        sys.path.insert(0, self.folder)
+        try:
+            resolver = SoSClassHierarchyResolver()
+            discipline_module = f'{package_name}.models.discipline'
+            static_trees = {
+                class_name: resolver.get_inheritance_tree(discipline_module, class_name)
+                for class_name in ('Discipline', 'DynamicDiscipline', 'Decorated')
+            }
+            error_mixin_tree = resolver.get_inheritance_tree(f'{package_name}.models.mixin', 'ErrorMixin')
+            # the resolution does not import the package
+            self.assertNotIn(package_name, sys.modules)
+
+            self.assertEqual(static_trees['Discipline'], ['Discipline', 'Mixin', 'SoSWrapp', 'object'])
+            self.assertEqual(
+                error_mixin_tree, ['ErrorMixin', 'Mixin', 'ValueError', 'Exception', 'BaseException', 'object'],
+            )
+            # classes whose hierarchy is only known once the module is executed are not resolved
+            self.assertIsNone(static_trees['DynamicDiscipline'])
+            self.assertIsNone(static_trees['Decorated'])
+
+            discipline = import_module(discipline_module).Discipline
+            self.assertEqual(static_trees['Discipline'], [cls.__name__ for cls in type.mro(discipline)])
+        finally:
+            sys.path.remove(self.folder)
+            for module_name in [name for name in sys.modules if name.split('.')[0] == package_name]:
+                del sys.modules[module_name]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import base64
+import shutil
+import tempfile
+import unittest
+from os.path import join
+
+from sos_ontology.core.sos_documentation_index import SoSDocumentationIndex
+
+
+class TestSoSDocumentationIndex(unittest.TestCase):
+    """Documentation folders index test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def write_file(self, name, content: bytes):
+        with open(join(self.folder, name), 'wb') as file:
+            file.write(content)
+        return join(self.folder, name)
+
+    def test_01_markdown_files(self):
+        self.write_file('my_discipline.md', b'# doc')
+        self.write_file('other.markdown', b'# doc')
+        self.write_file('my_discipline.py', b'')
+        documentation_index = SoSDocumentationIndex()
+
+        self.assertEqual(
+            documentation_index.find_markdown_file(self.folder, 'my_disc'), join(self.folder, 'my_discipline.md'),
+        )
+        self.assertEqual(sorted(documentation_index.get_markdown_files(self.folder)), ['my_discipline.md', 'other.markdown'])
+        self.assertIsNone(documentation_index.find_markdown_file(self.folder, 'missing'))
+        self.assertIsNone(documentation_index.find_markdown_file(join(self.folder, 'missing_folder'), 'my_discipline'))
+
+        # the folder is listed once per extraction
+        self.write_file('new.md', b'# doc')
+        self.assertIsNone(documentation_index.find_markdown_file(self.folder, 'new'))
+
+    def test_02_encoded_images(self):
+        image = self.write_file('image.png', b'image content')
+        image_copy = self.write_file('image_copy.png', b'image content')
+        documentation_index = SoSDocumentationIndex()
+
+        encoded = documentation_index.get_encoded_image(image)
+        self.assertEqual(encoded, base64.b64encode(b'image content').decode('utf-8'))
+        # identical images share the same encoded string
+        self.assertIs(documentation_index.get_encoded_image(image_copy), encoded)
+        self.assertIsNone(documentation_index.get_encoded_image(join(self.folder, 'missing.png')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import join
+from unittest import mock
+
+from sos_ontology.core import sos_extraction_cache
+from sos_ontology.core.sos_extraction_cache import (
+    SoSConfigurationCache,
+    SoSFileExtractionCache,
+    SoSRepositoryExtractionCache,
+    get_module_repositories,
+)
+
+
+class TestSoSExtractionCache(unittest.TestCase):
+    """Persistent artifacts of the code extraction test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache_file = join(self.folder, 'cache', 'files.pkl')
+        self.key = {'sostrades-core': 'abc'}
+
+    def tearDown(self):
+        for module_name in [name for name in sys.modules if name.startswith('cache_test_package')]:
+            del sys.modules[module_name]
+        if self.folder in sys.path:
+            sys.path.remove(self.folder)
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def write_file(self, name, content):
+        file_path = join(self.folder, name)
+        with open(file_path, 'w') as python_file:
+            python_file.write(content)
+        # older modification time so that the file is not considered as just modified
+        os.utime(file_path, (1_000_000_000, 1_000_000_000))
+        return file_path
+
+    def test_01_file_entries_reuse_and_eviction(self):
+        file_a = self.write_file('a.py', 'A = 1\n')
+        file_b = self.write_file('b.py', 'B = 1\n')
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key)
+        file_cache.get_entry(file_a)['analysis'] = 'analysis a'
+        file_cache.get_entry(file_b)['analysis'] = 'analysis b'
+        self.assertTrue(file_cache.save())
+
+        # unchanged file is reused, even with a new modification time
+        os.utime(file_a, (1_000_000_100, 1_000_000_100))
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key)
+        self.assertEqual(file_cache.get_entry(file_a)['analysis'], 'analysis a')
+        file_cache.save()
+
+        # b.py was not visited, its entry is evicted
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key)
+        self.assertEqual(list(file_cache.entries), [file_a])
+
+        # modified file gets a new entry
+        self.write_file('a.py', 'A = 2\n')
+        self.assertIsNone(file_cache.get_entry(file_a)['analysis'])
+
+    def test_02_file_entries_invalidation(self):
+        file_a = self.write_file('a.py', 'A = 1\n')
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key)
+        file_cache.get_entry(file_a)['analysis'] = 'analysis a'
+        file_cache.save()
+
+        self.assertEqual(SoSFileExtractionCache(self.cache_file, {'sostrades-core': 'def'}).entries, {})
+        with mock.patch.object(sos_extraction_cache, 'EXTRACTION_CACHE_VERSION', -1):
+            self.assertEqual(SoSFileExtractionCache(self.cache_file, self.key).entries, {})
+
+    def test_03_unpicklable_entries_are_not_stored(self):
+        file_a = self.write_file('a.py', 'A = 1\n')
+        file_b = self.write_file('b.py', 'B = 1\n')
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key)
+        file_cache.get_entry(file_a)['analysis'] = 'analysis a'
+        file_cache.get_entry(file_b)['analysis'] = lambda: None
+        self.assertTrue(file_cache.save())
+        self.assertEqual(list(SoSFileExtractionCache(self.cache_file, self.key).entries), [file_a])
+
+    def test_04_repository_artifacts(self):
+        code_repositories_dict = {
+            'repo': {'path': self.folder, 'commit': '123'},
+            'sostrades-core': {'path': self.folder, 'commit': 'abc'},
+        }
+        repositories_state = {'repo': '123', 'sostrades-core': 'abc', 'glossary_repo': '789', 'modified': None}
+        repository_cache = SoSRepositoryExtractionCache(join(self.folder, 'cache'))
+        with mock.patch.object(sos_extraction_cache, 'is_git_repository_clean', return_value=True):
+            key = repository_cache.get_key('repo', code_repositories_dict)
+        self.assertEqual(key, {'repo': '123', 'sostrades-core': 'abc'})
+        records = [{'discipline': {'id': 'd'}}]
+        self.assertTrue(
+            repository_cache.store('repo', key, records, {'errors': {}}, {'repo', 'glossary_repo'}, repositories_state),
+        )
+        self.assertEqual(repository_cache.load('repo', key, repositories_state), (records, {'errors': {}}))
+        self.assertIsNone(repository_cache.load('repo', {'repo': '456', 'sostrades-core': 'abc'}, repositories_state))
+        # a commit in a code repository imported during the scan invalidates the artifact
+        self.assertIsNone(repository_cache.load('repo', key, {**repositories_state, 'glossary_repo': '000'}))
+        # artifacts depending on imported repositories with local modifications are not stored
+        self.assertFalse(
+            repository_cache.store('repo', key, records, {'errors': {}}, {'modified'}, repositories_state),
+        )
+
+        # repositories with local modifications are not cached
+        with mock.patch.object(sos_extraction_cache, 'is_git_repository_clean', return_value=False):
+            self.assertIsNone(repository_cache.get_key('repo', code_repositories_dict))
+
+    def test_05_configurations(self):
+        configuration_cache = SoSConfigurationCache(join(self.folder, 'cache'))
+        repositories_state = {'repo': '123', 'other': '456', 'modified': None}
+        configuration = {'disciplines': {'Disc': [{'model_name_full_path': 'repo.disc'}]}, 'couplings': []}
+
+        self.assertFalse(configuration_cache.store('uc_modified', ['repo', 'modified'], repositories_state, configuration))
+        self.assertTrue(configuration_cache.store('uc', ['repo'], repositories_state, configuration))
+        self.assertEqual(configuration_cache.load('uc', repositories_state), configuration)
+        # a commit in a repository the configuration was not built from does not invalidate it
+        self.assertEqual(configuration_cache.load('uc', {**repositories_state, 'other': '789'}), configuration)
+        self.assertIsNone(configuration_cache.load('uc', {**repositories_state, 'repo': '789'}))
+        self.assertIsNone(configuration_cache.load('uc', {**repositories_state, 'repo': None}))
+        self.assertIsNone(configuration_cache.load('uc_modified', repositories_state))
+
+    def test_06_internal_variables_depend_on_loaded_modules(self):
+        os.makedirs(join(self.folder, 'cache_test_package'))
+        self.write_file(join('cache_test_package', '__init__.py'), '')
+        self.write_file(join('cache_test_package', 'glossary.py'), "UNIT = 'kg'\n")
+        discipline_file = self.write_file(
+            join('cache_test_package', 'discipline.py'),
+            "from cache_test_package.glossary import UNIT\nDESC_IN = {'x': {'unit': UNIT}}\n",
+        )
+        other_discipline_file = self.write_file(
+            join('cache_test_package', 'other_discipline.py'),
+            "from cache_test_package.glossary import UNIT\nDESC_OUT = {'y': {'unit': UNIT}}\n",
+        )
+        sys.path.insert(0, self.folder)
+
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key, module_folders=[self.folder])
+        for module_name, file_path in (('discipline', discipline_file), ('other_discipline', other_discipline_file)):
+            module = importlib.import_module(f'cache_test_package.{module_name}')
+            file_cache.get_entry(file_path)['internal_variables'][module_name] = (
+                module.__name__, {}, file_cache.record_loaded_modules(),
+            )
+        file_cache.save()
+        loaded_modules, count = file_cache.get_entry(other_discipline_file)['internal_variables']['other_discipline'][2]
+        # the glossary was loaded with the first discipline, the second one depends on it too
+        self.assertIn(join(self.folder, 'cache_test_package', 'glossary.py'), [file for file, _ in loaded_modules[:count]])
+
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key, module_folders=[self.folder])
+        entry = file_cache.get_entry(discipline_file)
+        self.assertTrue(file_cache.are_loaded_modules_unchanged(entry['internal_variables']['discipline'][2]))
+
+        # only the imported glossary changes, the entry of the discipline file is kept
+        # but its internal variables are not reused
+        self.write_file(join('cache_test_package', 'glossary.py'), "UNIT = 'g'\n")
+        file_cache = SoSFileExtractionCache(self.cache_file, self.key, module_folders=[self.folder])
+        for module_name, file_path in (('discipline', discipline_file), ('other_discipline', other_discipline_file)):
+            entry = file_cache.get_entry(file_path)
+            self.assertIn(module_name, entry['internal_variables'])
+            self.assertFalse(file_cache.are_loaded_modules_unchanged(entry['internal_variables'][module_name][2]))
+
+    def test_07_imported_repositories(self):
+        os.makedirs(join(self.folder, 'repo_a', 'cache_test_package_a'))
+        os.makedirs(join(self.folder, 'repo_b', 'cache_test_package_b'))
+        self.write_file(join('repo_a', 'cache_test_package_a', '__init__.py'), '')
+        self.write_file(join('repo_b', 'cache_test_package_b', '__init__.py'), '')
+        self.write_file(join('repo_b', 'cache_test_package_b', 'tools.py'), 'FACTOR = 2\n')
+        sys.path.insert(0, join(self.folder, 'repo_a'))
+        sys.path.insert(0, join(self.folder, 'repo_b'))
+        repository_folders = {
+            'repo_a': join(self.folder, 'repo_a'),
+            'repo_b': join(self.folder, 'repo_b'),
+            'repo_c': join(self.folder, 'repo_c'),
+        }
+        try:
+            importlib.import_module('cache_test_package_a')
+            self.assertEqual(get_module_repositories(repository_folders), {'repo_a'})
+            importlib.import_module('cache_test_package_b.tools')
+            self.assertEqual(get_module_repositories(repository_folders), {'repo_a', 'repo_b'})
+        finally:
+            sys.path.remove(join(self.folder, 'repo_a'))
+            sys.path.remove(join(self.folder, 'repo_b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from sos_ontology.core import sos_extraction_checkpoint
+from sos_ontology.core.functions.synthetic_ontology import SyntheticOntologyGenerator
+from sos_ontology.core.sos_extraction_checkpoint import (
+    DISCIPLINES_PHASE,
+    EXTRACTION_PHASES,
+    LOGS_PHASE,
+    ONTOLOGY_PHASE,
+    SoSExtractionCheckpoint,
+    get_phases_to_run,
+    get_previous_phase,
+)
+
+
+class TestSoSExtractionCheckpoint(unittest.TestCase):
+    """Checkpoints of the ontology creation phases test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_01_phases(self):
+        self.assertEqual(get_phases_to_run(), list(EXTRACTION_PHASES))
+        self.assertEqual(get_phases_to_run(resume_from=ONTOLOGY_PHASE)[0], ONTOLOGY_PHASE)
+        self.assertEqual(get_phases_to_run(resume_from=ONTOLOGY_PHASE)[-1], LOGS_PHASE)
+        self.assertEqual(get_phases_to_run(only=ONTOLOGY_PHASE), [ONTOLOGY_PHASE])
+        self.assertIsNone(get_previous_phase(DISCIPLINES_PHASE))
+        self.assertEqual(get_previous_phase(EXTRACTION_PHASES[1]), DISCIPLINES_PHASE)
+
+    def test_02_entities_round_trip(self):
+        generator = SyntheticOntologyGenerator(seed=0, documentation_words=0)
+        generator.generate()
+        logs_dict = {'errors': {'repo': ['error']}}
+        checkpoint = SoSExtractionCheckpoint(self.folder)
+        # entities are chained by their relations, the checkpoint does not recurse along them
+        with mock.patch.object(sos_extraction_checkpoint, 'ENTITIES_CHUNK_SIZE', 7):
+            self.assertTrue(
+                checkpoint.save(
+                    DISCIPLINES_PHASE,
+                    {'parameters': generator.parameters, 'couplings': generator.couplings, 'logs_dict': logs_dict},
+                ),
+            )
+        state = checkpoint.load(DISCIPLINES_PHASE)
+
+        self.assertEqual(state['logs_dict'], logs_dict)
+        self.assertEqual(list(state['parameters'].ids()), list(generator.parameters.ids()))
+        for parameter in state['parameters'].values():
+            original_parameter = generator.parameters.get(parameter.id)
+            self.assertEqual(parameter.unit, original_parameter.unit)
+            self.assertEqual(
+                [usage.id for usage in parameter.instances_list],
+                [usage.id for usage in original_parameter.instances_list],
+            )
+            for usage in parameter.instances_list:
+                # relations are restored to the same entities
+                self.assertIs(usage.instanceOf, parameter)
+                self.assertIn(usage.id, usage.sos_discipline.inputParameterUsagesIds + usage.sos_discipline.outputParameterUsagesIds)
+        for coupling in state['couplings'].values():
+            self.assertIs(coupling.parameterUsageIn.instanceOf, state['parameters'].get(coupling.parameterUsageIn.instanceOf.id))
+
+    def test_03_missing_or_outdated_checkpoint(self):
+        checkpoint = SoSExtractionCheckpoint(self.folder)
+        self.assertIsNone(checkpoint.load(DISCIPLINES_PHASE))
+        self.assertTrue(checkpoint.save(DISCIPLINES_PHASE, {'logs_dict': {}}))
+        with mock.patch.object(sos_extraction_checkpoint, 'EXTRACTION_CHECKPOINT_VERSION', -1):
+            self.assertIsNone(checkpoint.load(DISCIPLINES_PHASE))
+        self.assertFalse(checkpoint.save(ONTOLOGY_PHASE, {'logs_dict': lambda: None}))
+        self.assertIsNone(checkpoint.load(ONTOLOGY_PHASE))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+from sos_ontology.core.sos_extraction_index import SoSExtractionIndex
+
+
+class TestSoSExtractionIndex(unittest.TestCase):
+    """Parameters indexes of the extraction logs test class"""
+
+    def setUp(self):
+        self.index = SoSExtractionIndex()
+        self.index.add_parameter_usage('x', 'repo_a', 'repo_a.disc1', 'kg', 'float')
+        self.index.add_parameter_usage('y', 'repo_a', 'repo_a.disc1', 'm', 'float')
+        self.index.add_parameter_usage('x', 'repo_b', 'repo_b.disc2', 'g', 'float')
+        self.index.add_parameter_usage('y', 'repo_a', 'repo_a.disc3', 'm', 'float')
+
+    def test_01_parameters_by_repository(self):
+        self.assertEqual(self.index.parameter_usages_count, 4)
+        self.assertEqual(list(self.index.repositories_by_parameter['x']), ['repo_a', 'repo_b'])
+        self.assertEqual(
+            self.index.get_parameters_by_repository({'x': None, 'y': None}),
+            {'repo_a': ['x', 'y'], 'repo_b': ['x']},
+        )
+        self.assertEqual(self.index.get_parameters_by_repository({'y'}), {'repo_a': ['y']})
+        self.assertEqual(self.index.get_parameters_by_repository(set()), {})
+
+    def test_02_inconsistencies(self):
+        self.assertEqual(list(self.index.inconsistent_parameter_ids), ['x'])
+        self.assertEqual(
+            self.index.get_inconsistencies('x'),
+            {'unit': {'kg': [('discipline', 'repo_a.disc1')], 'g': [('discipline', 'repo_b.disc2')]}},
+        )
+        self.assertEqual(self.index.get_inconsistencies('y'), {})
+
+        # glossary attributes are added without modifying the index
+        inconsistencies = self.index.get_inconsistencies('y', {'glossary_repo': {'unit': 'm', 'datatype': 'int'}})
+        self.assertEqual(
+            inconsistencies,
+            {
+                'datatype': {
+                    'float': [('discipline', 'repo_a.disc1'), ('discipline', 'repo_a.disc3')],
+                    'int': [('glossary', 'glossary_repo')],
+                },
+            },
+        )
+        self.assertEqual(self.index.get_inconsistencies('y'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
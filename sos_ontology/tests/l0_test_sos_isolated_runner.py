@@ -0,0 +1,113 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import os
+import time
+import unittest
+
+from sos_ontology.core.sos_isolated_runner import (
+    TASK_CRASHED,
+    TASK_FAILED,
+    TASK_NOT_SERIALIZABLE,
+    TASK_SUCCEEDED,
+    TASK_TIMEOUT,
+    SoSIsolatedRunner,
+)
+
+
+def _add(a, b):
+    return a + b
+
+
+def _fail():
+    raise ValueError('task failure')
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+
+
+def _return_lambda():
+    return lambda: None
+
+
+def _exit_process():
+    os._exit(3)
+
+
+class TestSoSIsolatedRunner(unittest.TestCase):
+    """Tasks run in isolated processes test class"""
+
+    def test_01_task_outcomes(self):
+        runner = SoSIsolatedRunner(max_workers=2, timeout=1)
+        outcomes = runner.run(
+            {
+                'add': (_add, (1, 2)),
+                'fail': (_fail, ()),
+                'sleep': (_sleep, (30,)),
+                'lambda': (_return_lambda, ()),
+                'exit': (_exit_process, ()),
+            },
+        )
+
+        self.assertEqual(list(outcomes), ['add', 'fail', 'sleep', 'lambda', 'exit'])
+        self.assertEqual(outcomes['add'], (TASK_SUCCEEDED, 3))
+        self.assertEqual(outcomes['fail'][0], TASK_FAILED)
+        self.assertIsInstance(outcomes['fail'][1], ValueError)
+        self.assertEqual(outcomes['sleep'][0], TASK_TIMEOUT)
+        self.assertEqual(outcomes['lambda'][0], TASK_NOT_SERIALIZABLE)
+        self.assertEqual(outcomes['exit'][0], TASK_CRASHED)
+        self.assertEqual(set(runner.durations), set(outcomes))
+        # the timed out task is stopped after its timeout
+        self.assertLess(runner.durations['sleep'], 30)
+
+    def test_02_tasks_run_in_parallel(self):
+        runner = SoSIsolatedRunner(max_workers=4)
+        start = time.monotonic()
+        outcomes = runner.run({f'sleep_{i}': (_sleep, (0.5,)) for i in range(4)})
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertTrue(all(status == TASK_SUCCEEDED for status, _ in outcomes.values()))
+
+    def test_03_outcome_sent_after_poll(self):
+        class LatePollConnection:
+            """Connection whose first poll happens before the task sends its outcome"""
+
+            def __init__(self, connection):
+                self.connection = connection
+                self.poll_count = 0
+
+            def poll(self):
+                self.poll_count += 1
+                return self.poll_count > 1 and self.connection.poll()
+
+            def recv(self):
+                return self.connection.recv()
+
+        runner = SoSIsolatedRunner(max_workers=1)
+        process, connection, deadline = runner.start_task(_add, (1, 2))
+        # the task sends its outcome and exits before its process is checked
+        process.join()
+        outcome = runner.get_task_outcome(process, LatePollConnection(connection), deadline)
+        connection.close()
+        self.assertEqual(outcome, (TASK_SUCCEEDED, 3))
+
+    def test_04_many_immediate_tasks(self):
+        # tasks returning immediately exit while the other ones are checked, none of them is lost
+        runner = SoSIsolatedRunner(max_workers=16)
+        outcomes = runner.run({f'add_{i}': (_add, (i, 1)) for i in range(160)})
+        self.assertEqual(outcomes, {f'add_{i}': (TASK_SUCCEEDED, i + 1) for i in range(160)})
+
+
+if __name__ == '__main__':
+    unittest.main()
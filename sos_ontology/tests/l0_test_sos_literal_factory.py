@@ -0,0 +1,76 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+import numpy as np
+import pandas as pd
+from rdflib import Literal
+from rdflib.namespace import XSD
+
+from sos_ontology.core.ontology import Ontology
+from sos_ontology.core.sos_literal_factory import SoSLiteralFactory
+
+
+class TestSoSLiteralFactory(unittest.TestCase):
+    """Interned literals of the ontology test class"""
+
+    def test_01_literal_texts(self):
+        factory = SoSLiteralFactory()
+        values = [
+            ('kg', 'kg'),
+            (3, '3'),
+            (0.5, '0.5'),
+            (True, 'True'),
+            ({'a': 1}, "{'a': 1}"),
+            (None, ' '),
+            ([], ' '),
+            (['null'], ' '),
+            (['a', None, 'b'], 'a,\nb'),
+            # a None following a removed value is kept
+            ([None, None, 'a'], 'None,\na'),
+            (np.array([1, 2]), '1,\n2'),
+            (pd.DataFrame({'x': [1]}), "{'x': [1]}"),
+            ((1, 2), ' '),
+        ]
+        for value, text in values:
+            self.assertEqual(factory.to_literal(value), Literal(text, datatype=XSD.string))
+
+    def test_02_interning(self):
+        ontology = Ontology()
+        values = ['a', None, 'b']
+        literal = ontology.toLiteral(values)
+        # the list given is not modified
+        self.assertEqual(values, ['a', None, 'b'])
+        self.assertIs(ontology.toLiteral(['a', 'b']), literal)
+        self.assertIs(ontology.toLiteral('label'), ontology.getLiteral({'name': 'label'}, 'name'))
+        self.assertIs(ontology.toLiteral(1), ontology.toLiteral('1'))
+        self.assertIs(ontology.getLiteral({}, 'name'), ontology.toLiteral(None))
+
+    def test_03_long_texts_and_clear(self):
+        factory = SoSLiteralFactory(max_length=10)
+        long_text = 'documentation ' * 10
+        # long texts are converted but not kept by the factory
+        self.assertEqual(factory.to_literal(long_text), Literal(long_text, datatype=XSD.string))
+        self.assertIsNot(factory.to_literal(long_text), factory.to_literal(long_text))
+        self.assertIs(factory.to_literal('kg'), factory.to_literal('kg'))
+        self.assertEqual(list(factory.literals), ['kg'])
+
+        factory.clear()
+        self.assertEqual(factory.literals, {})
+        self.assertEqual(factory.to_literal('kg'), Literal('kg', datatype=XSD.string))
+
+
+if __name__ == '__main__':
+    unittest.main()
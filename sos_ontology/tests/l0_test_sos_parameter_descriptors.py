@@ -0,0 +1,62 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from sos_ontology.core.sos_parameter_descriptors import project_descriptors
+
+
+class TestSoSParameterDescriptors(unittest.TestCase):
+    """Projection of the discipline data descriptors test class"""
+
+    def test_01_projection(self):
+        dataframe_descriptor = {'years': ('int', [2020, 2050], False)}
+        desc_in = {
+            'x': {
+                'type': 'dataframe',
+                'unit': 'kg',
+                'default': pd.DataFrame({'years': range(2020, 2051)}),
+                'dataframe_descriptor': dataframe_descriptor,
+                'value': np.zeros(1000),
+                'namespace': 'ns_public',
+            },
+            ('y', 'ns'): {'type': 'float', 'default': 1.0},
+            'z': {'type': 'dict', 'default': {'a': np.ones(3), 'b': list(range(100)), 'c': [1, 'b']}},
+        }
+        projected = project_descriptors(desc_in)
+
+        self.assertEqual(list(projected), ['x', ('y', 'ns'), 'z'])
+        self.assertEqual(
+            projected['x'],
+            {
+                'type': 'dataframe',
+                'unit': 'kg',
+                'default': '<DataFrame of shape (31, 1)>',
+                'dataframe_descriptor': dataframe_descriptor,
+                'namespace': 'ns_public',
+            },
+        )
+        # stored attributes are copies of the descriptor values
+        self.assertIsNot(projected['x']['dataframe_descriptor'], dataframe_descriptor)
+        self.assertEqual(projected[('y', 'ns')], {'type': 'float', 'default': 1.0})
+        self.assertEqual(
+            projected['z']['default'], {'a': '<ndarray of shape (3,)>', 'b': '<list of 100 items>', 'c': [1, 'b']},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
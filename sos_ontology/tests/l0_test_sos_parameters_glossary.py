@@ -0,0 +1,111 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import shutil
+import tempfile
+import unittest
+from os.path import join
+
+from sos_ontology.core.sos_extraction_cache import (
+    SoSParametersGlossaryCache,
+    get_file_hash,
+)
+from sos_ontology.core.sos_parameters_glossary import (
+    PARAMETERS_GLOSSARY_FILE_NAME,
+    SoSMergedParametersGlossaries,
+    read_parameters_glossary,
+)
+
+
+class TestSoSParametersGlossary(unittest.TestCase):
+    """Parameters glossaries loading and merge test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def write_glossary(self, name: str, content: str) -> str:
+        glossary_path = join(self.folder, f'{name}_{PARAMETERS_GLOSSARY_FILE_NAME}')
+        with open(glossary_path, 'w', encoding='utf-8', newline='') as glossary_file:
+            glossary_file.write(content)
+        return glossary_path
+
+    def test_01_read_glossary(self):
+        glossary_path = self.write_glossary(
+            'repo_a',
+            '\ufeffid,label,unit,definition,datatype,extra\r\n'
+            'x,X,kg,"mass, in kg",float,e\r\n'
+            '\r\n'
+            'x,X again,g,,int,e\r\n'
+            'y,Y\r\n',
+        )
+        glossary = read_parameters_glossary(glossary_path)
+
+        self.assertEqual(list(glossary.attributes), ['x', 'y'])
+        self.assertEqual(glossary.duplicated_ids, ['x'])
+        self.assertEqual(
+            glossary.attributes['x'],
+            {
+                'label': 'X', 'unit': 'kg', 'definition': 'mass, in kg', 'datatype': 'float',
+                'definitionSource': None, 'ACLTag': None,
+            },
+        )
+        # missing fields of a short row are empty
+        self.assertEqual(glossary.attributes['y']['unit'], '')
+
+        with self.assertRaises(ValueError):
+            read_parameters_glossary(self.write_glossary('no_id', 'name,unit\nx,kg\n'))
+
+    def test_02_merge_glossaries(self):
+        glossaries = {
+            'repo_a': read_parameters_glossary(
+                self.write_glossary('repo_a', 'id,label,unit,datatype\nx,X,kg,float\ny,Y,m,float\nz,Z,,\n'),
+            ),
+            'repo_b': read_parameters_glossary(
+                self.write_glossary('repo_b', 'id,label,unit\nx,,g\nunknown,U,s\nz,Z b,s\n'),
+            ),
+        }
+        merged_glossaries = SoSMergedParametersGlossaries(glossaries)
+
+        merged_parameters = merged_glossaries.get_merged_parameters({'x', 'y', 'z'})
+        self.assertEqual([parameter[0] for parameter in merged_parameters], ['x', 'y', 'z'])
+        parameter_id, attributes, repositories = merged_parameters[0]
+        # last value of each attribute, a column missing from a glossary does not override the others
+        self.assertEqual((attributes['label'], attributes['unit'], attributes['datatype']), ('', 'g', 'float'))
+        self.assertIsNone(attributes['ACLTag'])
+        self.assertEqual(repositories, ['repo_a', 'repo_b'])
+
+        self.assertEqual(merged_glossaries.get_unknown_parameters({'x', 'y', 'z'}), {'repo_b': ['unknown']})
+        # empty units are not conflicting
+        self.assertEqual(
+            merged_glossaries.get_conflicts(),
+            {'x': {'unit': {'kg': ['repo_a'], 'g': ['repo_b']}}},
+        )
+        self.assertEqual(SoSMergedParametersGlossaries({}).get_merged_parameters({'x'}), [])
+
+    def test_03_glossary_cache(self):
+        glossary_path = self.write_glossary('repo_a', 'id,unit\nx,kg\n')
+        file_hash = get_file_hash(glossary_path)
+        cache = SoSParametersGlossaryCache(join(self.folder, 'cache'))
+        self.assertIsNone(cache.load('repo_a', file_hash))
+        self.assertTrue(cache.store('repo_a', file_hash, read_parameters_glossary(glossary_path)))
+
+        self.assertEqual(cache.load('repo_a', file_hash).attributes['x']['unit'], 'kg')
+        self.assertIsNone(cache.load('repo_a', 'other hash'))
+
+
+if __name__ == '__main__':
+    unittest.main()
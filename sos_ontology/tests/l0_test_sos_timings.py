@@ -0,0 +1,83 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import json
+import shutil
+import tempfile
+import unittest
+from os.path import join
+
+from sos_ontology.core.sos_timings import (
+    FILE_PARSE_SPAN,
+    PHASE_SPAN,
+    TIMINGS_LOG_CATEGORY,
+    USECASE_SPAN,
+    add_timing,
+    get_slowest_spans,
+    timing_span,
+    without_timings,
+)
+from sos_ontology.core.sos_toolbox import SoSToolbox
+
+
+class TestSoSTimings(unittest.TestCase):
+    """Timing spans of the ontology creation logs test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_01_spans(self):
+        logs_dict = {'errors': {}}
+        with timing_span(logs_dict, PHASE_SPAN, 'disciplines'):
+            pass
+        with self.assertRaises(ValueError), timing_span(logs_dict, USECASE_SPAN, 'usecase_failing'):
+            raise ValueError
+        add_timing(logs_dict, FILE_PARSE_SPAN, 'discipline.py', 2.5)
+        add_timing(logs_dict, FILE_PARSE_SPAN, 'other_discipline.py', 0.5)
+        # nothing is recorded without logs
+        add_timing(None, PHASE_SPAN, 'disciplines', 1.0)
+
+        timings = logs_dict[TIMINGS_LOG_CATEGORY]
+        self.assertEqual([span['name'] for span in timings[PHASE_SPAN]], ['disciplines'])
+        self.assertEqual([span['name'] for span in timings[USECASE_SPAN]], ['usecase_failing'])
+        self.assertEqual(
+            get_slowest_spans(logs_dict, count=2),
+            [(FILE_PARSE_SPAN, 'discipline.py', 2.5), (FILE_PARSE_SPAN, 'other_discipline.py', 0.5)],
+        )
+        self.assertEqual(get_slowest_spans({}), [])
+        self.assertEqual(without_timings(logs_dict), {'errors': {}})
+
+    def test_02_slowest_spans_table(self):
+        logs_dict = {
+            'updatesDetails': {'Parameter': {'new': 0, 'removed': 0, 'new_list': [], 'removed_list': []}},
+        }
+        add_timing(logs_dict, USECASE_SPAN, 'repo.process.usecase_slow', 12.0)
+        add_timing(logs_dict, PHASE_SPAN, 'processes', 30.0)
+        log_file_name = join(self.folder, 'output_log.txt')
+        json_path = join(self.folder, 'ontologyCreationLogs.json')
+        SoSToolbox().write_logs(logs_dict, log_file_name, join(self.folder, 'short_log.txt'), json_path)
+
+        with open(log_file_name) as log_file:
+            log = log_file.read()
+        self.assertIn('Slowest steps of the ontology creation', log)
+        self.assertLess(log.index('30.000'), log.index('repo.process.usecase_slow'))
+        with open(json_path) as json_file:
+            self.assertEqual(json.load(json_file)[TIMINGS_LOG_CATEGORY], logs_dict[TIMINGS_LOG_CATEGORY])
+
+
+if __name__ == '__main__':
+    unittest.main()
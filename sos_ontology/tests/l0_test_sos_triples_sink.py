@@ -0,0 +1,89 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import shutil
+import tempfile
+import unittest
+
+from rdflib import Dataset, Graph, Literal, URIRef
+from rdflib.compare import to_isomorphic
+from rdflib.namespace import DCTERMS, RDFS
+
+from sos_ontology.core.functions.synthetic_ontology import SyntheticOntologyGenerator
+from sos_ontology.core.sos_triples_sink import (
+    SoSGraphTriplesSink,
+    SoSNTriplesSink,
+    SoSTriplesSink,
+)
+
+
+def _without_update_time(graph):
+    graph.remove((None, DCTERMS.modified, None))
+    return to_isomorphic(graph)
+
+
+class TestSoSTriplesSink(unittest.TestCase):
+    """Sinks of the ABox triples test class"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.triples = [
+            (URIRef(f'http://example.org/entity_{i}'), RDFS.label, Literal(f'entity\n"{i}"'), None)
+            for i in range(7)
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_01_sinks(self):
+        graph = Dataset()
+        graph_sink = SoSGraphTriplesSink(graph, chunk_size=3)
+        graph_sink.add(iter(self.triples))
+        # the last incomplete chunk is only added on flush
+        self.assertEqual(len(graph), 6)
+        graph_sink.flush()
+        self.assertEqual(len(graph), 7)
+
+        ntriples_path = f'{self.folder}/triples.nt'
+        with SoSNTriplesSink(ntriples_path, chunk_size=3) as ntriples_sink:
+            ntriples_sink.add(iter(self.triples))
+        self.assertEqual(ntriples_sink.triples_count, 7)
+        ntriples_graph = Graph().parse(ntriples_path, format='nt')
+        self.assertEqual(set(ntriples_graph), {triple[:3] for triple in self.triples})
+
+    def test_02_streamed_ontology(self):
+        generator = SyntheticOntologyGenerator(
+            seed=3, code_repositories=2, processes=3, disciplines=6, parameters=30, usages_per_discipline=8,
+        )
+        ontology_graph = Graph()
+        for triple in generator.create_ontology().graph.default_context:
+            ontology_graph.add(triple)
+        ntriples_path = generator.export_ntriples(self.folder)
+        streamed_graph = Graph().parse(ntriples_path, format='nt')
+
+        self.assertEqual(_without_update_time(streamed_graph), _without_update_time(ontology_graph))
+
+    def test_03_abstract_sink(self):
+        class IncompleteSink(SoSTriplesSink):
+            pass
+
+        # a sink without write_chunk fails on creation instead of on its first flush
+        with self.assertRaises(TypeError):
+            SoSTriplesSink()
+        with self.assertRaises(TypeError):
+            IncompleteSink()
+
+
+if __name__ == '__main__':
+    unittest.main()
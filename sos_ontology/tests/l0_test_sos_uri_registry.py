@@ -0,0 +1,81 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import random
+import unittest
+
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, RDFS
+
+from sos_ontology.core.ontology import Ontology
+from sos_ontology.core.sos_uri_registry import SoSURIRegistry
+
+EX = Namespace('http://example.org/ontology#')
+OTHER = Namespace('http://example.org/other#')
+
+
+def _probe_URI(graph, issued_URIs, namespace, name):
+    """URI allocation by probing the graph and the issued URIs for each suffix"""
+    URI = URIRef(namespace + name)
+    counter = 0
+    while URI in issued_URIs or (URI, None, None) in graph:
+        counter += 1
+        URI = URIRef(f'{namespace}{name}_{counter}')
+    issued_URIs.add(URI)
+    return URI
+
+
+class TestSoSURIRegistry(unittest.TestCase):
+    """URIs allocation without graph lookups test class"""
+
+    def test_01_allocation(self):
+        graph = Graph()
+        graph.add((EX.Parameter, RDF.type, RDFS.Class))
+        graph.add((EX.Parameter_2, RDFS.label, Literal('parameter 2')))
+        graph.add((OTHER.Usage, RDF.type, RDFS.Class))
+        registry = SoSURIRegistry(graph)
+
+        self.assertEqual(
+            [registry.allocate(EX, 'Parameter') for _ in range(3)],
+            [EX.Parameter_1, EX.Parameter_3, EX.Parameter_4],
+        )
+        self.assertEqual(registry.allocate(EX, 'Usage'), EX.Usage)
+        self.assertEqual(registry.allocate(OTHER, 'Usage'), OTHER.Usage_1)
+
+        # subjects added to the graph are seen once the graph subjects are read again
+        graph.add((EX.Coupling, RDF.type, RDFS.Class))
+        registry.reload_graph_subjects()
+        self.assertEqual(registry.allocate(EX, 'Coupling'), EX.Coupling_1)
+        self.assertEqual(registry.allocate(EX, 'Parameter'), EX.Parameter_5)
+
+    def test_02_same_URIs_as_graph_probe(self):
+        ontology = Ontology()
+        probe_graph = Graph()
+        for name in ('Year', 'Year_1', 'Year_3', 'Energy'):
+            ontology.graph.add((EX[name], RDF.type, RDFS.Class))
+            probe_graph.add((EX[name], RDF.type, RDFS.Class))
+        # names given to create_new_URI and their cleaned version
+        cleaned_names = {
+            'year': 'Year', 'YEAR': 'Year', 'Energy': 'Energy', 'co2 (emissions)': 'Co2Emissions', 'mass-flow': 'MassFlow',
+        }
+        names = [random.Random(seed).choice(list(cleaned_names)) for seed in range(200)]
+
+        issued_URIs = set()
+        expected_URIs = [_probe_URI(probe_graph, issued_URIs, EX, cleaned_names[name]) for name in names]
+        self.assertEqual([ontology.create_new_URI(EX, name) for name in names], expected_URIs)
+        self.assertEqual(len(set(expected_URIs)), len(names))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+'''
+import unittest
+
+from sos_ontology.core.functions.synthetic_ontology import SyntheticOntologyGenerator
+
+
+class TestSyntheticOntology(unittest.TestCase):
+    """Synthetic ontology generator test class"""
+
+    def setUp(self):
+        self.sizes = {
+            'code_repositories': 2,
+            'processes': 3,
+            'disciplines': 6,
+            'parameters': 30,
+            'usages_per_discipline': 8,
+            'disciplines_per_process': 3,
+            'documentation_words': 20,
+        }
+
+    def test_01_generation_is_reproducible(self):
+        first = SyntheticOntologyGenerator(seed=3, **self.sizes).generate()
+        second = SyntheticOntologyGenerator(seed=3, **self.sizes).generate()
+        self.assertEqual(first.entities_count(), second.entities_count())
+        self.assertEqual(list(first.parameters_usages.sos_entity_dict), list(second.parameters_usages.sos_entity_dict))
+        self.assertEqual(first.entities_count()['sos_disciplines'], 6)
+        self.assertEqual(first.entities_count()['usecases'], 6)
+
+        with self.assertRaises(ValueError):
+            SyntheticOntologyGenerator(unknown_size=1)
+
+    def test_02_ontology_read_path(self):
+        generator = SyntheticOntologyGenerator(seed=1, **self.sizes)
+        ontology = generator.create_ontology()
+        requests = generator.build_requests(disciplines_count=2, parameters_count=5)
+
+        self.assertEqual(len(ontology.get_full_discipline_list()), 6)
+        self.assertEqual(len(ontology.get_full_process_list()), 3)
+        study_data = ontology.get_study_ontology_data(requests['parameter_usages'])
+        self.assertEqual(set(study_data['disciplines']), set(requests['parameter_usages']['disciplines']))
+        tree_nodes, _, _ = ontology.get_n2_matrix(requests['n2_treeview'])
+        self.assertEqual(len(tree_nodes), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+'''
+Copyright 2026 Capgemini
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+'''
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from os.path import dirname, join
+
+'''
+Load test of the REST API replaying a weighted mix of requests built from the json files of tests/data
+(or of a folder generated by sos_ontology.core.functions.synthetic_ontology --requests).
+The API is driven in process through the Flask test client, or through a local server with --url:
+
+    python -m sos_ontology.tests.load_test_rest_api --requests 500 --concurrency 8
+    python -m sos_ontology.tests.load_test_rest_api --url http://localhost:5555 --mix study=3 n2=1
+
+Throughput, p50/p95/p99 latency per route and error counts are printed, and written as json with --output.
+'''
+
+DATA_FOLDER = join(dirname(__file__), 'data')
+
+# name: (method, path, json file used as payload, key of the payload in the request body)
+REQUEST_TEMPLATES = {
+    'study': ('POST', '/api/ontology/v1/study', 'parameter_usages.json', 'study_ontology_request'),
+    'ontology': ('POST', '/api/ontology', 'data_request.json', 'ontology_request'),
+    'models_status_filtered': (
+        'POST', '/api/ontology/models/status-filtered', 'linked_process_dict.json', 'linked_process_dict',
+    ),
+    'processes_by_names': ('POST', '/api/ontology/process/by/names', 'processes_name.json', 'processes_name'),
+    'repositories_by_names': (
+        'POST', '/api/ontology/repository/by/names', 'repositories_name.json', 'repositories_name',
+    ),
+    'n2': ('POST', '/api/ontology/n2', 'n2_treeview.json', 'treeview'),
+    'general_information': ('GET', '/api/ontology/v1/general_information', None, None),
+    'full_parameter_list': ('GET', '/api/ontology/v1/full_parameter_list', None, None),
+    'full_process_list': ('GET', '/api/ontology/v1/full_process_list', None, None),
+    'full_discipline_list': ('GET', '/api/ontology/v1/full_discipline_list', None, None),
+    'models_status': ('GET', '/api/ontology/models/status', None, None),
+}
+
+DEFAULT_MIX = {
+    'study': 4,
+    'ontology': 2,
+    'models_status_filtered': 2,
+    'processes_by_names': 1,
+    'repositories_by_names': 1,
+    'n2': 2,
+    'general_information': 1,
+    'full_parameter_list': 1,
+    'full_process_list': 1,
+    'full_discipline_list': 1,
+    'models_status': 1,
+}
+
+
+def load_request_payloads(data_folder: str, mix: dict) -> dict:
+    """Build the (method, path, body) of each request name of the mix from the json files of data_folder"""
+    payloads = {}
+    for name in mix:
+        method, path, json_file, payload_key = REQUEST_TEMPLATES[name]
+        body = None
+        if json_file is not None:
+            with open(join(data_folder, json_file)) as request_file:
+                body = {payload_key: json.load(request_file)}
+        payloads[name] = (method, path, body)
+    return payloads
+
+
+def build_schedule(mix: dict, requests_count: int, seed: int) -> list[str]:
+    """Deterministic sequence of request names following the weights of the mix"""
+    names = list(mix)
+    return random.Random(seed).choices(names, weights=[mix[name] for name in names], k=requests_count)
+
+
+class FlaskClientSender:
+    """Send the requests in process through the Flask test client, one client per thread"""
+
+    def __init__(self) -> None:
+        # imported here because importing the api loads the ontology
+        from sos_ontology.rest_api.api import app
+
+        self.app = app
+        self._local = threading.local()
+
+    def send(self, method: str, path: str, body) -> int:
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.app.test_client()
+        response = self._local.client.open(path, method=method, json=body)
+        # read the body so that streamed responses are fully produced
+        response.get_data()
+        return response.status_code
+
+
+class HttpSender:
+    """Send the requests to a running server"""
+
+    def __init__(self, url: str, timeout: float) -> None:
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    def send(self, method: str, path: str, body) -> int:
+        data = None
+        headers = {}
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        http_request = urllib.request.Request(f'{self.url}{path}', data=data, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(http_request, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+
+
+def percentile(sorted_values: list, percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if len(sorted_values) == 0:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_load_test(sender, payloads: dict, schedule: list[str], concurrency: int) -> dict:
+    """Replay the schedule with concurrency threads and return the report"""
+    samples = []
+    samples_lock = threading.Lock()
+
+    def send_request(name):
+        method, path, body = payloads[name]
+        start = time.perf_counter()
+        error = None
+        try:
+            status = sender.send(method, path, body)
+            if status >= 400:
+                error = f'HTTP {status}'
+        except Exception as ex:
+            error = f'{type(ex).__name__}: {ex}'
+        duration = time.perf_counter() - start
+        with samples_lock:
+            samples.append((name, duration, error))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send_request, schedule))
+    total_seconds = time.perf_counter() - start
+
+    routes = {}
+    for name in sorted({sample[0] for sample in samples}):
+        durations = sorted(sample[1] for sample in samples if sample[0] == name)
+        errors = [sample[2] for sample in samples if sample[0] == name and sample[2] is not None]
+        routes[name] = {
+            'path': payloads[name][1],
+            'count': len(durations),
+            'errors': len(errors),
+            'error_examples': sorted(set(errors))[:3],
+            'p50_seconds': percentile(durations, 50),
+            'p95_seconds': percentile(durations, 95),
+            'p99_seconds': percentile(durations, 99),
+            'max_seconds': durations[-1],
+        }
+    return {
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'errors': sum(route['errors'] for route in routes.values()),
+        'total_seconds': total_seconds,
+        'throughput_rps': len(samples) / total_seconds if total_seconds > 0 else 0.0,
+        'routes': routes,
+    }
+
+
+def print_report(report: dict) -> None:
+    """Print the summary and the latency table per route"""
+    print(
+        f'{report["requests"]} requests in {report["total_seconds"]:.2f} s with concurrency {report["concurrency"]}: '
+        f'{report["throughput_rps"]:.1f} req/s, {report["errors"]} errors',
+    )
+    print(f'{"route":<26}{"count":>7}{"errors":>8}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+    for name, route in report['routes'].items():
+        print(
+            f'{name:<26}{route["count"]:>7}{route["errors"]:>8}'
+            f'{route["p50_seconds"] * 1000:>10.1f}{route["p95_seconds"] * 1000:>10.1f}'
+            f'{route["p99_seconds"] * 1000:>10.1f}{route["max_seconds"] * 1000:>10.1f}',
+        )
+        for error in route['error_examples']:
+            print(f'    {error}')
+
+
+def parse_mix(mix_args) -> dict:
+    """Parse name=weight arguments, unknown names raise a ValueError"""
+    if mix_args is None:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for mix_arg in mix_args:
+        name, _, weight = mix_arg.partition('=')
+        if name not in REQUEST_TEMPLATES:
+            raise ValueError(f'Unknown request {name}, possible requests are {sorted(REQUEST_TEMPLATES)}')
+        mix[name] = float(weight) if weight != '' else 1.0
+    return mix
+
+
+def main(args=None):
+    """Command line entry point, returns the exit code (1 if some requests failed)"""
+    parser = argparse.ArgumentParser(description='Load test of the ontology REST API')
+    parser.add_argument('--url', default=None, help='url of a running server, the Flask test client is used if not set')
+    parser.add_argument('--data-folder', default=DATA_FOLDER, help='folder of the json files used to build the requests')
+    parser.add_argument('--mix', nargs='+', default=None, help=f'weighted requests as name=weight among {sorted(REQUEST_TEMPLATES)}')
+    parser.add_argument('--requests', type=int, default=200, help='total number of requests sent')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=60.0, help='timeout of each request sent to --url')
+    parser.add_argument('--output', default=None, help='json file where the report is written')
+    parsed_args = parser.parse_args(args)
+
+    mix = parse_mix(parsed_args.mix)
+    payloads = load_request_payloads(parsed_args.data_folder, mix)
+    schedule = build_schedule(mix, parsed_args.requests, parsed_args.seed)
+    sender = FlaskClientSender() if parsed_args.url is None else HttpSender(parsed_args.url, parsed_args.timeout)
+
+    report = run_load_test(sender, payloads, schedule, parsed_args.concurrency)
+    print_report(report)
+    if parsed_args.output is not None:
+        with open(parsed_args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=4)
+    return 1 if report['errors'] > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())